@@ -1,12 +1,20 @@
 """Sphinx documentation configuration file."""
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+import hashlib
+import json
 import os
 import pathlib
 import shutil
-from typing import List
+import signal
+import subprocess
+import sys
+from typing import Dict, List, Set
 
+import jupytext
 import sphinx
+from sphinx.errors import ExtensionError
 from sphinx.util import logging
 from sphinx.util.display import status_iterator
 
@@ -89,6 +97,27 @@ html_css_files = [
     "css/custom.css"
 ]
 
+# Configuration for the cache of executed examples. Each example is keyed by the
+# hash of its "main.py", "assets/" and "scripts/" files and the pinned example
+# requirements. Unchanged examples reuse their previously executed notebook.
+examples_cache_dir = pathlib.Path(
+    os.getenv("PYWORKBENCH_EXAMPLES_CACHE", source_dir.parent / "_cache" / "examples")
+)
+examples_requirements_file = source_dir / "../../requirements/requirements_examples.txt"
+
+# Configuration for the parallel execution of the examples before the build.
+# Each example runs in its own process and working directory, and starts its own
+# Workbench and solver servers, so only a few examples run at once by default.
+# Set the number of workers to 0 to let nbsphinx execute the examples
+# sequentially instead.
+examples_workers = int(os.getenv("PYWORKBENCH_EXAMPLES_WORKERS", 2))
+examples_timeout = int(os.getenv("PYWORKBENCH_EXAMPLES_TIMEOUT", 3 * 60 * 60))
+
+# Manifest of the example files synchronized into the source directory and
+# Linux ioctl request used to clone files as copy-on-write reflinks
+examples_manifest_name = ".sync-manifest.json"
+FICLONE = 0x40049409
+
 # Configuration for nbsphinx
 nbsphinx_execute = "always"
 nbsphinx_custom_formats = {
@@ -142,38 +171,175 @@ nbsphinx_prolog = """
 
 # -- Sphinx application setup ------------------------------------------------
 
-def copytree(src: pathlib.Path, dst: pathlib.Path, excluded: List[str]):
+def file_digest(path: pathlib.Path) -> str:
+    """
+    Compute the SHA-256 digest of a file.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Path to the file to hash.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the file contents.
+
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def clone_or_copy(src: pathlib.Path, dst: pathlib.Path):
+    """
+    Copy a file, sharing the source data as copy-on-write when possible.
+
+    A copy-on-write clone (reflink) is tried first, and the file is copied
+    otherwise. Files are never hard linked, since the examples are executed in
+    the destination and may rewrite their input files, which would change the
+    source files of the repository.
+
+    Parameters
+    ----------
+    src : pathlib.Path
+        The source file.
+    dst : pathlib.Path
+        The destination file. It is replaced if it exists.
+
     """
-    Recursively copy a directory tree using pathlib.
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
 
-    Args:
-        src (Path): The source directory to copy from.
-        dst (Path): The destination directory to copy to.
+    try:
+        import fcntl
+
+        with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+            fcntl.ioctl(dst_file.fileno(), FICLONE, src_file.fileno())
+        shutil.copystat(src, dst)
+        return
+    except (ImportError, OSError):
+        if dst.exists():
+            dst.unlink()
+
+    shutil.copy2(src, dst)
+
+
+def sync_tree(
+    src: pathlib.Path, dst: pathlib.Path, excluded: List[str], manifest_file: pathlib.Path
+) -> Dict[str, dict]:
+    """
+    Incrementally synchronize a directory tree.
+
+    A manifest of the size, modification time and hash of every synchronized
+    file is kept between runs. Unchanged files are left untouched, files with a
+    new modification time but the same content only have their metadata
+    updated, and the remaining files are cloned or copied with
+    :func:`clone_or_copy`. Files and directories of the destination that are not
+    part of the source are removed.
+
+    Parameters
+    ----------
+    src : pathlib.Path
+        The source directory to synchronize from.
+    dst : pathlib.Path
+        The destination directory to synchronize to.
+    excluded : List[str]
+        Names of the files and directories to skip.
+    manifest_file : pathlib.Path
+        Path to the manifest of the previous synchronization.
+
+    Returns
+    -------
+    Dict[str, dict]
+        The manifest of the synchronized files, indexed by relative path.
+
+    Raises
+    ------
+    ValueError
+        If the source is not a directory.
 
-    Raises:
-        ValueError: If the source is not a directory.
     """
     if not src.is_dir():
         raise ValueError(f"The source {src} is not a directory.")
 
-    # Create the destination directory
-    dst.mkdir(parents=True, exist_ok=True)
+    previous = {}
+    if manifest_file.exists():
+        previous = json.loads(manifest_file.read_text(encoding="utf-8"))
+
+    manifest = {}
+    pending = [src]
+    while pending:
+        directory = pending.pop()
+        for item in directory.iterdir():
+            if item.name in excluded:
+                continue
+            if item.is_dir():
+                pending.append(item)
+                continue
+
+            relative_path = item.relative_to(src).as_posix()
+            dst_item = dst / relative_path
+            stat = item.stat()
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            known = previous.get(relative_path, {})
+            dst_stat = dst_item.stat() if dst_item.exists() else None
+            dst_in_sync = (
+                dst_stat is not None
+                and dst_stat.st_size == known.get("size")
+                and dst_stat.st_mtime_ns == known.get("mtime_ns")
+            )
+
+            if dst_in_sync and known.get("size") == entry["size"]:
+                if known.get("mtime_ns") == entry["mtime_ns"]:
+                    manifest[relative_path] = known
+                    continue
+                entry["sha256"] = file_digest(item)
+                if known.get("sha256") == entry["sha256"]:
+                    shutil.copystat(item, dst_item)
+                    manifest[relative_path] = entry
+                    continue
+
+            dst_item.parent.mkdir(parents=True, exist_ok=True)
+            clone_or_copy(item, dst_item)
+            entry.setdefault("sha256", file_digest(item))
+            manifest[relative_path] = entry
+
+    prune_tree(dst, set(manifest) | {manifest_file.relative_to(dst).as_posix()})
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    manifest_file.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    return manifest
+
+
+def prune_tree(root: pathlib.Path, kept: Set[str]):
+    """
+    Remove the files of a directory tree that are not explicitly kept.
+
+    Directories left empty are removed too.
 
-    # Recursively copy files and subdirectories
-    for item in src.iterdir():
-        if item.name in excluded:
-            continue
-        src_item = item
-        dst_item = dst / item.name
-        if src_item.is_dir():
-            copytree(src_item, dst_item, excluded)
-        else:
-            shutil.copy2(src_item, dst_item)
+    Parameters
+    ----------
+    root : pathlib.Path
+        Root of the directory tree.
+    kept : Set[str]
+        Paths, relative to the root, of the files to keep.
+
+    """
+    if not root.is_dir():
+        return
+    for path in sorted(root.rglob("*"), key=lambda item: len(item.parts), reverse=True):
+        if path.is_dir() and not path.is_symlink():
+            if not any(path.iterdir()):
+                path.rmdir()
+        elif path.relative_to(root).as_posix() not in kept:
+            path.unlink()
 
 
-def copy_examples_dir_to_source_dir(app: sphinx.application.Sphinx):
+def sync_examples_dir_to_source_dir(app: sphinx.application.Sphinx):
     """
-    Copy the examples directory to the source directory of the documentation.
+    Synchronize the examples directory into the source directory of the documentation.
 
     Parameters
     ----------
@@ -186,7 +352,298 @@ def copy_examples_dir_to_source_dir(app: sphinx.application.Sphinx):
 
     EXAMPLES_DIRECTORY = SOURCE_EXAMPLES.parent.parent.parent / "examples"
 
-    copytree(EXAMPLES_DIRECTORY, SOURCE_EXAMPLES, exclude_examples)
+    manifest = sync_tree(
+        EXAMPLES_DIRECTORY,
+        SOURCE_EXAMPLES,
+        exclude_examples,
+        SOURCE_EXAMPLES / examples_manifest_name,
+    )
+    logger = logging.getLogger(__name__)
+    logger.info(f"Synchronized {len(manifest)} example files into {SOURCE_EXAMPLES}.")
+
+
+def compute_example_hash(example_dir: pathlib.Path) -> str:
+    """
+    Compute the content hash identifying an execution of an example.
+
+    The hash covers the ``main.py`` file, every file under the ``assets`` and
+    ``scripts`` directories, and the pinned requirements of the examples.
+
+    Parameters
+    ----------
+    example_dir : pathlib.Path
+        Directory of the example.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest identifying the example.
+
+    """
+    digest = hashlib.sha256()
+    tracked_files = [example_dir / "main.py"]
+    for subdir in ("assets", "scripts"):
+        tracked_files.extend(
+            sorted(file for file in (example_dir / subdir).rglob("*") if file.is_file())
+        )
+    for file in tracked_files:
+        digest.update(file.relative_to(example_dir).as_posix().encode())
+        digest.update(file_digest(file).encode())
+    digest.update(file_digest(examples_requirements_file.resolve()).encode())
+    return digest.hexdigest()
+
+
+def cached_notebook_path(example_name: str, example_hash: str) -> pathlib.Path:
+    """
+    Return the path of the cached executed notebook of an example.
+
+    Parameters
+    ----------
+    example_name : str
+        Name of the example directory.
+    example_hash : str
+        Content hash of the example.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the executed notebook in the cache directory.
+
+    """
+    return examples_cache_dir / f"{example_name}-{example_hash}.ipynb"
+
+
+def restore_cached_examples(app: sphinx.application.Sphinx):
+    """
+    Replace unchanged examples by their cached executed notebooks.
+
+    The ``main.py`` file of an example whose content hash is found in the cache
+    is replaced by the executed ``main.ipynb`` notebook, which nbsphinx renders
+    without executing it again.
+
+    Parameters
+    ----------
+    app : sphinx.application.Sphinx
+        Sphinx application instance containing the all the doc build configuration.
+
+    """
+    SOURCE_EXAMPLES = pathlib.Path(app.srcdir) / "examples"
+    EXAMPLES_DIRECTORY = SOURCE_EXAMPLES.parent.parent.parent / "examples"
+    logger = logging.getLogger(__name__)
+
+    for example_script in sorted(SOURCE_EXAMPLES.glob("*/main.py")):
+        example_name = example_script.parent.name
+        cached_notebook = cached_notebook_path(
+            example_name, compute_example_hash(EXAMPLES_DIRECTORY / example_name)
+        )
+        if not cached_notebook.exists():
+            logger.info(f"Example {example_name} changed, it will be executed.")
+            continue
+        logger.info(f"Example {example_name} unchanged, using {cached_notebook.name}.")
+        shutil.copy2(cached_notebook, example_script.with_suffix(".ipynb"))
+        example_script.unlink()
+
+
+def cache_executed_notebook(
+    example_name: str, example_hash: str, executed_notebook: pathlib.Path
+) -> pathlib.Path:
+    """
+    Store an executed notebook in the examples cache.
+
+    Previously cached notebooks of the same example are removed. The stored
+    notebook is marked so that nbsphinx never executes it again.
+
+    Parameters
+    ----------
+    example_name : str
+        Name of the example directory.
+    example_hash : str
+        Content hash of the example.
+    executed_notebook : pathlib.Path
+        Path to the executed notebook.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the executed notebook in the cache directory.
+
+    """
+    examples_cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale_notebook in examples_cache_dir.glob(f"{example_name}-*.ipynb"):
+        stale_notebook.unlink()
+
+    notebook = json.loads(executed_notebook.read_text(encoding="utf-8"))
+    notebook.setdefault("metadata", {})["nbsphinx"] = {"execute": "never"}
+    cached_notebook = cached_notebook_path(example_name, example_hash)
+    cached_notebook.write_text(json.dumps(notebook), encoding="utf-8")
+    return cached_notebook
+
+
+def execute_example(example_script: pathlib.Path, timeout: int) -> pathlib.Path:
+    """
+    Execute an example as a notebook in its own process.
+
+    The example is converted to a ``main.ipynb`` notebook next to the script and
+    executed in place by ``nbconvert``, using the example directory as working
+    directory.
+
+    Parameters
+    ----------
+    example_script : pathlib.Path
+        Path to the ``main.py`` file of the example.
+    timeout : int
+        Maximum time, in seconds, allowed for the execution of the example.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the executed notebook.
+
+    Raises
+    ------
+    RuntimeError
+        If the execution of the example fails or times out.
+
+    """
+    notebook = example_script.with_suffix(".ipynb")
+    jupytext.write(jupytext.read(example_script), notebook)
+    command = [
+        sys.executable, "-m", "nbconvert", "--to", "notebook", "--execute", "--inplace",
+        "--ExecutePreprocessor.timeout=-1", notebook.name,
+    ]
+    # The example runs in its own process group, so the kernel and the servers it
+    # starts are killed with it on timeout.
+    if sys.platform == "win32":
+        group_options = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        group_options = {"start_new_session": True}
+    process = subprocess.Popen(
+        command,
+        cwd=example_script.parent,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        **group_options,
+    )
+    try:
+        _, stderr = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        kill_process_group(process)
+        process.communicate()
+        notebook.unlink()
+        raise RuntimeError(f"execution timed out after {timeout} seconds")
+    if process.returncode != 0:
+        notebook.unlink()
+        lines = stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit code {process.returncode}")
+    return notebook
+
+
+def kill_process_group(process: subprocess.Popen):
+    """
+    Kill a process started in its own process group and all its descendants.
+
+    Parameters
+    ----------
+    process : subprocess.Popen
+        The process, started with ``start_new_session=True``, or with
+        ``CREATE_NEW_PROCESS_GROUP`` on Windows.
+
+    """
+    if sys.platform == "win32":
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(process.pid)], capture_output=True
+        )
+        return
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def execute_examples(app: sphinx.application.Sphinx):
+    """
+    Execute the examples that are not cached in a pool of worker processes.
+
+    Each executed notebook is stored in the examples cache and replaces the
+    ``main.py`` file of the example, so nbsphinx only renders it.
+
+    Parameters
+    ----------
+    app : sphinx.application.Sphinx
+        Sphinx application instance containing the all the doc build configuration.
+
+    Raises
+    ------
+    ExtensionError
+        If the execution of any of the examples fails.
+
+    """
+    SOURCE_EXAMPLES = pathlib.Path(app.srcdir) / "examples"
+    EXAMPLES_DIRECTORY = SOURCE_EXAMPLES.parent.parent.parent / "examples"
+    example_scripts = sorted(SOURCE_EXAMPLES.glob("*/main.py"))
+    if examples_workers <= 0 or not example_scripts:
+        return
+
+    logger = logging.getLogger(__name__)
+    workers = min(examples_workers, len(example_scripts))
+    logger.info(f"Executing {len(example_scripts)} examples with {workers} workers...")
+
+    failures = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(execute_example, example_script, examples_timeout): example_script
+            for example_script in example_scripts
+        }
+        for future in as_completed(futures):
+            example_script = futures[future]
+            example_name = example_script.parent.name
+            try:
+                executed_notebook = future.result()
+            except RuntimeError as error:
+                logger.warning(f"Example {example_name} failed: {error}")
+                failures.append(example_name)
+                continue
+            logger.info(f"Example {example_name} executed.")
+            cached_notebook = cache_executed_notebook(
+                example_name,
+                compute_example_hash(EXAMPLES_DIRECTORY / example_name),
+                executed_notebook,
+            )
+            shutil.copy2(cached_notebook, executed_notebook)
+            example_script.unlink()
+
+    if failures:
+        raise ExtensionError(f"Failed to execute the examples: {', '.join(sorted(failures))}")
+
+
+def store_executed_examples(app: sphinx.application.Sphinx, exception: Exception):
+    """
+    Store the notebooks executed during the build in the examples cache.
+
+    Parameters
+    ----------
+    app : sphinx.application.Sphinx
+        Sphinx application instance containing the all the doc build configuration.
+    exception : Exception
+        Exception encountered during the building of the documentation.
+
+    """
+    if exception is not None:
+        return
+
+    SOURCE_EXAMPLES = pathlib.Path(app.srcdir) / "examples"
+    EXAMPLES_DIRECTORY = SOURCE_EXAMPLES.parent.parent.parent / "examples"
+    auxdir = pathlib.Path(getattr(app.env, "nbsphinx_auxdir", app.doctreedir))
+    examples_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    for example_script in sorted(SOURCE_EXAMPLES.glob("*/main.py")):
+        example_name = example_script.parent.name
+        executed_notebook = auxdir / "examples" / example_name / "main.ipynb"
+        if not executed_notebook.exists():
+            continue
+        example_hash = compute_example_hash(EXAMPLES_DIRECTORY / example_name)
+        cache_executed_notebook(example_name, example_hash, executed_notebook)
 
 
 def copy_examples_to_output_dir(app: sphinx.application.Sphinx, exception: Exception):
@@ -229,9 +686,12 @@ def copy_examples_to_output_dir(app: sphinx.application.Sphinx, exception: Excep
         destination_file.write_text(file.read_text())
 
 
-def remove_examples_from_source_dir(app: sphinx.application.Sphinx, exception: Exception):
+def clean_examples_in_source_dir(app: sphinx.application.Sphinx, exception: Exception):
     """
-    Remove the example files from the documentation source directory.
+    Remove the files generated by the build from the examples source directory.
+
+    The synchronized example files and their manifest are kept in place so that
+    the next build only needs to synchronize the files that changed.
 
     Parameters
     ----------
@@ -242,9 +702,15 @@ def remove_examples_from_source_dir(app: sphinx.application.Sphinx, exception: E
 
     """
     EXAMPLES_DIRECTORY = pathlib.Path(app.srcdir) / "examples"
+    manifest_file = EXAMPLES_DIRECTORY / examples_manifest_name
+    if not manifest_file.exists():
+        return
+
     logger = logging.getLogger(__name__)
-    logger.info(f"\nRemoving {EXAMPLES_DIRECTORY} directory...")
-    shutil.rmtree(EXAMPLES_DIRECTORY)
+    logger.info(f"\nCleaning {EXAMPLES_DIRECTORY} directory...")
+    kept = set(json.loads(manifest_file.read_text(encoding="utf-8")))
+    prune_tree(EXAMPLES_DIRECTORY, kept | {examples_manifest_name})
+
 
 def setup(app: sphinx.application.Sphinx):
     """
@@ -256,11 +722,15 @@ def setup(app: sphinx.application.Sphinx):
         Sphinx application instance containing the all the doc build configuration.
 
     """
-    # HACK: rST files are copied to the doc/source directory before the build.
+    # HACK: rST files are synchronized to the doc/source directory before the build.
     # Sphinx needs all source files to be in the source directory to build.
     # However, the examples are desired to be kept in the root directory. Once the
-    # build has completed, no matter its success, the examples are removed from
-    # the source directory.
-    app.connect("builder-inited", copy_examples_dir_to_source_dir)
-    app.connect("build-finished", remove_examples_from_source_dir)
+    # build has completed, no matter its success, the files generated in the
+    # examples source directory are removed. The synchronized files are kept so
+    # that the next build only links or copies the files that changed.
+    app.connect("builder-inited", sync_examples_dir_to_source_dir)
+    app.connect("builder-inited", restore_cached_examples)
+    app.connect("builder-inited", execute_examples)
+    app.connect("build-finished", store_executed_examples)
+    app.connect("build-finished", clean_examples_in_source_dir)
     app.connect("build-finished", copy_examples_to_output_dir)
@@ -52,11 +52,16 @@ with open(scripts / "axisymmetric_rotor.py") as sf:
 mech_output = mechanical.run_python_script(mech_script)
 print(mech_output)
 
+# Query the working directories of all the analyses in a single call, instead of one call per analysis.
+
+working_dirs = mechanical.run_python_script(
+    '"\\n".join([analysis.WorkingDir for analysis in ExtAPI.DataModel.AnalysisList])'
+).splitlines()
+
 # Specify the Mechanical directory for the Modal Campbell Analysis and fetch the working directory path.
 # Download the solver output file (`solve.out`) from the server to the client's current working directory and print its contents.
 
-mechanical.run_python_script(f"solve_dir=ExtAPI.DataModel.AnalysisList[2].WorkingDir")
-result_solve_dir_server = mechanical.run_python_script(f"solve_dir")
+result_solve_dir_server = working_dirs[2]
 print(f"All solver files are stored on the server at: {result_solve_dir_server}")
 
 solve_out_path = os.path.join(result_solve_dir_server, "solve.out")
@@ -82,8 +87,7 @@ else:
 from matplotlib import image as mpimg
 from matplotlib import pyplot as plt
 
-mechanical.run_python_script(f"image_dir=ExtAPI.DataModel.AnalysisList[2].WorkingDir")
-result_image_dir_server = mechanical.run_python_script(f"image_dir")
+result_image_dir_server = working_dirs[2]
 print(f"Images are stored on the server at: {result_image_dir_server}")
 
 def get_image_path(image_name):
@@ -113,8 +117,7 @@ if False and image_path_server != "":
 # Specify the Mechanical directory for the Unbalance Response Analysis and fetch the working directory path.
 # Download the solver output file (`solve.out`) from the server to the client's current working directory and print its contents.
 
-mechanical.run_python_script(f"solve_dir=ExtAPI.DataModel.AnalysisList[3].WorkingDir")
-result_solve_dir_server = mechanical.run_python_script(f"solve_dir")
+result_solve_dir_server = working_dirs[3]
 print(f"All solver files are stored on the server at: {result_solve_dir_server}")
 
 solve_out_path = os.path.join(result_solve_dir_server, "solve.out")
@@ -156,11 +159,16 @@ with open(scripts / "rotor_3d.py") as sf:
 mech_output = mechanical.run_python_script(mech_script)
 print(mech_output)
 
+# Query the working directories of all the analyses in a single call, instead of one call per analysis.
+
+working_dirs = mechanical.run_python_script(
+    '"\\n".join([analysis.WorkingDir for analysis in ExtAPI.DataModel.AnalysisList])'
+).splitlines()
+
 # Specify the Mechanical directory for the Modal Campbell Analysis and fetch the working directory path.
 # Download the solver output file (`solve.out`) from the server to the client's current working directory and print its contents.
 
-mechanical.run_python_script(f"solve_dir=ExtAPI.DataModel.AnalysisList[2].WorkingDir")
-result_solve_dir_server = mechanical.run_python_script(f"solve_dir")
+result_solve_dir_server = working_dirs[2]
 print(f"All solver files are stored on the server at: {result_solve_dir_server}")
 
 solve_out_path = os.path.join(result_solve_dir_server, "solve.out")
@@ -185,8 +193,7 @@ else:
 from matplotlib import image as mpimg
 from matplotlib import pyplot as plt
 
-mechanical.run_python_script(f"image_dir=ExtAPI.DataModel.AnalysisList[2].WorkingDir")
-result_image_dir_server = mechanical.run_python_script(f"image_dir")
+result_image_dir_server = working_dirs[2]
 print(f"Images are stored on the server at: {result_image_dir_server}")
 
 def get_image_path(image_name):
@@ -216,8 +223,7 @@ if False and image_path_server != "":
 # Specify the Mechanical directory for the Unbalance Response Analysis and fetch the working directory path.
 # Download the solver output file (`solve.out`) from the server to the client's current working directory and print its contents.
 
-mechanical.run_python_script(f"solve_dir=ExtAPI.DataModel.AnalysisList[3].WorkingDir")
-result_solve_dir_server = mechanical.run_python_script(f"solve_dir")
+result_solve_dir_server = working_dirs[3]
 print(f"All solver files are stored on the server at: {result_solve_dir_server}")
 
 solve_out_path = os.path.join(result_solve_dir_server, "solve.out")
@@ -322,18 +322,8 @@ SOLN1.Activate()
 SOLN1.ClearGeneratedData()
 SOLN1.Solve(True)
 
-FREQ_1_MODAL1 = SOLN1.TabularData.Values[1][0]
-FREQ_2_MODAL1 = SOLN1.TabularData.Values[1][1]
-FREQ_3_MODAL1 = SOLN1.TabularData.Values[1][2]
-FREQ_4_MODAL1 = SOLN1.TabularData.Values[1][3]
-FREQ_5_MODAL1 = SOLN1.TabularData.Values[1][4]
-FREQ_6_MODAL1 = SOLN1.TabularData.Values[1][5]
-FREQ_7_MODAL1 = SOLN1.TabularData.Values[1][6]
-FREQ_8_MODAL1 = SOLN1.TabularData.Values[1][7]
-FREQ_9_MODAL1 = SOLN1.TabularData.Values[1][8]
-FREQ_10_MODAL1 = SOLN1.TabularData.Values[1][9]
-FREQ_11_MODAL1 = SOLN1.TabularData.Values[1][10]
-FREQ_12_MODAL1 = SOLN1.TabularData.Values[1][11]
+# Read the frequencies from a single access to the tabular data, instead of one access per mode
+FREQS_MODAL1 = list(SOLN1.TabularData.Values[1])
 
 # Clean and solve Modal analysis for 2D Axisymmetric Model with rotation of 50000 rpm
 MODAL2 = Model.Analyses[1]
@@ -425,18 +415,7 @@ SOLN2.Activate()
 SOLN2.ClearGeneratedData()
 SOLN2.Solve(True)
 
-FREQ_1_MODAL2 = SOLN2.TabularData.Values[1][0]
-FREQ_2_MODAL2 = SOLN2.TabularData.Values[1][1]
-FREQ_3_MODAL2 = SOLN2.TabularData.Values[1][2]
-FREQ_4_MODAL2 = SOLN2.TabularData.Values[1][3]
-FREQ_5_MODAL2 = SOLN2.TabularData.Values[1][4]
-FREQ_6_MODAL2 = SOLN2.TabularData.Values[1][5]
-FREQ_7_MODAL2 = SOLN2.TabularData.Values[1][6]
-FREQ_8_MODAL2 = SOLN2.TabularData.Values[1][7]
-FREQ_9_MODAL2 = SOLN2.TabularData.Values[1][8]
-FREQ_10_MODAL2 = SOLN2.TabularData.Values[1][9]
-FREQ_11_MODAL2 = SOLN2.TabularData.Values[1][10]
-FREQ_12_MODAL2 = SOLN2.TabularData.Values[1][11]
+FREQS_MODAL2 = list(SOLN2.TabularData.Values[1])
 
 # Clean and solve Campbell diagram analysis of the 2D Axisymmetric Model
 MODAL3 = Model.Analyses[2]
@@ -531,15 +510,10 @@ ExtAPI.Graphics.ViewOptions.ResultPreference.ExtraModelDisplay=Ansys.Mechanical.
 # disable image export or it will fail on github build agent due to graphics context
 # ExtAPI.Graphics.ExportImage(export_path, image_export_format, settings_720p)
 
-FREQ_1_MODAL3 = SOLN3.TabularData.Values[3][18]
-FREQ_2_MODAL3 = SOLN3.TabularData.Values[3][19]
-FREQ_3_MODAL3 = SOLN3.TabularData.Values[3][20]
-FREQ_4_MODAL3 = SOLN3.TabularData.Values[3][21]
-FREQ_5_MODAL3 = SOLN3.TabularData.Values[3][22]
-FREQ_6_MODAL3 = SOLN3.TabularData.Values[3][23]
-FREQ_7_MODAL3 = SOLN3.TabularData.Values[3][24]
-FREQ_8_MODAL3 = SOLN3.TabularData.Values[3][25]
-FREQ_9_MODAL3 = SOLN3.TabularData.Values[3][26]
+# The Campbell table lists the modes of each rotational velocity in turn, so the frequencies of the
+# last rotational velocity are the last MaximumModesToFind rows of the column
+CAMPBELL_FREQS_MODAL3 = list(SOLN3.TabularData.Values[3])
+FREQS_MODAL3 = CAMPBELL_FREQS_MODAL3[len(CAMPBELL_FREQS_MODAL3) - ANA_SETTINGS_MODAL3.MaximumModesToFind:]
 
 CMPBL_DIAG.Activate()
 
@@ -39,43 +39,16 @@ STAT_THERM_SOLN = STAT_THERM.Solution
 STAT_STRUC = ExtAPI.DataModel.AnalysisByName("Static Structural")
 STAT_STRUC_SOLN = STAT_STRUC.Solution
 
-NS_Passage1 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 1'][0]
-NS_Passage2 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 2'][0]
-NS_Passage3 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 3'][0]
-NS_Passage4 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 4'][0]
-NS_Passage5 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 5'][0]
-NS_Passage6 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 6'][0]
-NS_Passage7 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 7'][0]
-NS_Passage8 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 8'][0]
-NS_Passage9 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 9'][0]
-NS_Passage10 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Passage 10'][0]
-NS_Hole1 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 1'][0]
-NS_Hole2 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 2'][0]
-NS_Hole3 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 3'][0]
-NS_Hole4 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 4'][0]
-NS_Hole5 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 5'][0]
-NS_Hole6 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 6'][0]
-NS_Hole7 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 7'][0]
-NS_Hole8 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 8'][0]
-NS_Hole9 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 9'][0]
-NS_Hole10 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Hole 10'][0]
-NS_Inlet1 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 1'][0]
-NS_Inlet2 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 2'][0]
-NS_Inlet3 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 3'][0]
-NS_Inlet4 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 4'][0]
-NS_Inlet5 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 5'][0]
-NS_Inlet6 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 6'][0]
-NS_Inlet7 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 7'][0]
-NS_Inlet8 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 8'][0]
-NS_Inlet9 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 9'][0]
-NS_Inlet10 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Inlet 10'][0]
-NS_Path1 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Path1'][0]
-NS_Path2 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Path2'][0]
-NS_Faces4 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Faces4'][0]
-NS_Face1 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Face1'][0]
-NS_Face2 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Face2'][0]
-NS_Body1 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Body1'][0]
-NS_Bodies10 = [x for x in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True) if x.Name == 'Bodies10'][0]
+# Index the named selections by name in a single pass over the tree, instead of one pass per lookup
+NAMED_SELECTIONS = {}
+for named_selection in Model.GetChildren[Ansys.ACT.Automation.Mechanical.NamedSelection](True):
+    NAMED_SELECTIONS.setdefault(named_selection.Name, named_selection)
+NS_Passage1, NS_Passage2, NS_Passage3, NS_Passage4, NS_Passage5, NS_Passage6, NS_Passage7, NS_Passage8, NS_Passage9, NS_Passage10 = [NAMED_SELECTIONS['Passage %d' % number] for number in range(1, 11)]
+NS_Hole1, NS_Hole2, NS_Hole3, NS_Hole4, NS_Hole5, NS_Hole6, NS_Hole7, NS_Hole8, NS_Hole9, NS_Hole10 = [NAMED_SELECTIONS['Hole %d' % number] for number in range(1, 11)]
+NS_Inlet1, NS_Inlet2, NS_Inlet3, NS_Inlet4, NS_Inlet5, NS_Inlet6, NS_Inlet7, NS_Inlet8, NS_Inlet9, NS_Inlet10 = [NAMED_SELECTIONS['Inlet %d' % number] for number in range(1, 11)]
+NS_Path1, NS_Path2, NS_Faces4, NS_Face1, NS_Face2, NS_Body1, NS_Bodies10 = [
+    NAMED_SELECTIONS[name] for name in ['Path1', 'Path2', 'Faces4', 'Face1', 'Face2', 'Body1', 'Bodies10']
+]
 
 # Assign materials to blade and fluid bodies and model type for line bodies
 GEOM.Children[0].Material = 'Blade'
@@ -102,149 +75,31 @@ PATH02.StartCoordinateSystem = LCS01
 PATH02.EndCoordinateSystem = LCS02
 
 # Setup loads and supports in linked steady-state thermal and static structural analyses
-CONV01 = STAT_THERM.AddConvection()
-CONV01.Location = NS_Hole1
-CONV01.FilmCoefficient.Output.DiscreteValues = [Quantity('295430 [W m^-1 m^-1 K^-1]')]
-CONV01.HasFluidFlow = True
-CONV01.FluidFlowSelection = NS_Passage1
-
-CONV02 = STAT_THERM.AddConvection()
-CONV02.Location = NS_Hole2
-CONV02.FilmCoefficient.Output.DiscreteValues = [Quantity('296290 [W m^-1 m^-1 K^-1]')]
-CONV02.HasFluidFlow = True
-CONV02.FluidFlowSelection = NS_Passage2
-
-CONV03 = STAT_THERM.AddConvection()
-CONV03.Location = NS_Hole3
-CONV03.FilmCoefficient.Output.DiscreteValues = [Quantity('300760 [W m^-1 m^-1 K^-1]')]
-CONV03.HasFluidFlow = True
-CONV03.FluidFlowSelection = NS_Passage3
-
-CONV04 = STAT_THERM.AddConvection()
-CONV04.Location = NS_Hole4
-CONV04.FilmCoefficient.Output.DiscreteValues = [Quantity('314160 [W m^-1 m^-1 K^-1]')]
-CONV04.HasFluidFlow = True
-CONV04.FluidFlowSelection = NS_Passage4
-
-CONV05 = STAT_THERM.AddConvection()
-CONV05.Location = NS_Hole5
-CONV05.FilmCoefficient.Output.DiscreteValues = [Quantity('314950 [W m^-1 m^-1 K^-1]')]
-CONV05.HasFluidFlow = True
-CONV05.FluidFlowSelection = NS_Passage5
-
-CONV06 = STAT_THERM.AddConvection()
-CONV06.Location = NS_Hole6
-CONV06.FilmCoefficient.Output.DiscreteValues = [Quantity('301990 [W m^-1 m^-1 K^-1]')]
-CONV06.HasFluidFlow = True
-CONV06.FluidFlowSelection = NS_Passage6
-
-CONV07 = STAT_THERM.AddConvection()
-CONV07.Location = NS_Hole7
-CONV07.FilmCoefficient.Output.DiscreteValues = [Quantity('302470 [W m^-1 m^-1 K^-1]')]
-CONV07.HasFluidFlow = True
-CONV07.FluidFlowSelection = NS_Passage7
-
-CONV08 = STAT_THERM.AddConvection()
-CONV08.Location = NS_Hole8
-CONV08.FilmCoefficient.Output.DiscreteValues = [Quantity('443430 [W m^-1 m^-1 K^-1]')]
-CONV08.HasFluidFlow = True
-CONV08.FluidFlowSelection = NS_Passage8
-
-CONV09 = STAT_THERM.AddConvection()
-CONV09.Location = NS_Hole9
-CONV09.FilmCoefficient.Output.DiscreteValues = [Quantity('285270 [W m^-1 m^-1 K^-1]')]
-CONV09.HasFluidFlow = True
-CONV09.FluidFlowSelection = NS_Passage9
-
-CONV010 = STAT_THERM.AddConvection()
-CONV010.Location = NS_Hole10
-CONV010.FilmCoefficient.Output.DiscreteValues = [Quantity('895860 [W m^-1 m^-1 K^-1]')]
-CONV010.HasFluidFlow = True
-CONV010.FluidFlowSelection = NS_Passage10
-
-MFLOW_RT01 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT01.Location = NS_Passage1
-MFLOW_RT01.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.0228[kg sec^-1]')]
-
-MFLOW_RT02 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT02.Location = NS_Passage2
-MFLOW_RT02.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.0239[kg sec^-1]')]
-
-MFLOW_RT03 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT03.Location = NS_Passage3
-MFLOW_RT03.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.0228[kg sec^-1]')]
-
-MFLOW_RT04 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT04.Location = NS_Passage4
-MFLOW_RT04.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.0243[kg sec^-1]')]
-
-MFLOW_RT05 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT05.Location = NS_Passage5
-MFLOW_RT05.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.0239[kg sec^-1]')]
-
-MFLOW_RT06 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT06.Location = NS_Passage6
-MFLOW_RT06.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.0242[kg sec^-1]')]
-
-MFLOW_RT07 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT07.Location = NS_Passage7
-MFLOW_RT07.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.0232[kg sec^-1]')]
-
-MFLOW_RT08 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT08.Location = NS_Passage8
-MFLOW_RT08.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.00799[kg sec^-1]')]
-
-MFLOW_RT09 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT09.Location = NS_Passage9
-MFLOW_RT09.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.00499[kg sec^-1]')]
-
-MFLOW_RT10 = STAT_THERM.AddMassFlowRate()
-MFLOW_RT10.Location = NS_Passage10
-MFLOW_RT10.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('-0.00253[kg sec^-1]')]
-
-TEMP01 = STAT_THERM.AddTemperature()
-TEMP01.Location = NS_Inlet1
-TEMP01.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('348.83[K]')]
-
-TEMP02 = STAT_THERM.AddTemperature()
-TEMP02.Location = NS_Inlet2
-TEMP02.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('349.32[K]')]
-
-TEMP03 = STAT_THERM.AddTemperature()
-TEMP03.Location = NS_Inlet3
-TEMP03.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('339.49[K]')]
-
-TEMP04 = STAT_THERM.AddTemperature()
-TEMP04.Location = NS_Inlet4
-TEMP04.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('342.3[K]')]
-
-TEMP05 = STAT_THERM.AddTemperature()
-TEMP05.Location = NS_Inlet5
-TEMP05.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('333.99[K]')]
-
-TEMP06 = STAT_THERM.AddTemperature()
-TEMP06.Location = NS_Inlet6
-TEMP06.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('364.95[K]')]
-
-TEMP07 = STAT_THERM.AddTemperature()
-TEMP07.Location = NS_Inlet7
-TEMP07.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('343.37[K]')]
-
-TEMP08 = STAT_THERM.AddTemperature()
-TEMP08.Location = NS_Inlet8
-TEMP08.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('365.41[K]')]
-
-TEMP09 = STAT_THERM.AddTemperature()
-TEMP09.Location = NS_Inlet9
-TEMP09.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('408.78[K]')]
-
-TEMP10 = STAT_THERM.AddTemperature()
-TEMP10.Location = NS_Inlet10
-TEMP10.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('453.18[K]')]
-
-TEMP11 = STAT_THERM.AddTemperature()
-TEMP11.Location = NS_Faces4
-TEMP11.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('568[K]')]
+FILM_COEFFICIENTS = [295430, 296290, 300760, 314160, 314950, 301990, 302470, 443430, 285270, 895860]
+MASS_FLOW_RATES = [-0.0228, -0.0239, -0.0228, -0.0243, -0.0239, -0.0242, -0.0232, -0.00799, -0.00499, -0.00253]
+INLET_TEMPERATURES = [348.83, 349.32, 339.49, 342.3, 333.99, 364.95, 343.37, 365.41, 408.78, 453.18]
+
+# Convection on the holes with fluid flow through the passages, mass flow rates through the
+# passages and temperatures at the inlets, created in a single transaction so the tree and
+# graphics are refreshed once
+with Transaction():
+    for number in range(1, 11):
+        CONV = STAT_THERM.AddConvection()
+        CONV.Location = NAMED_SELECTIONS['Hole %d' % number]
+        CONV.FilmCoefficient.Output.DiscreteValues = [Quantity('%s [W m^-1 m^-1 K^-1]' % FILM_COEFFICIENTS[number - 1])]
+        CONV.HasFluidFlow = True
+        CONV.FluidFlowSelection = NAMED_SELECTIONS['Passage %d' % number]
+    for number in range(1, 11):
+        MFLOW_RT = STAT_THERM.AddMassFlowRate()
+        MFLOW_RT.Location = NAMED_SELECTIONS['Passage %d' % number]
+        MFLOW_RT.Magnitude.Output.DiscreteValues = [Quantity('0[kg sec^-1]'), Quantity('%s[kg sec^-1]' % MASS_FLOW_RATES[number - 1])]
+    for number in range(1, 11):
+        TEMP = STAT_THERM.AddTemperature()
+        TEMP.Location = NAMED_SELECTIONS['Inlet %d' % number]
+        TEMP.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('%s[K]' % INLET_TEMPERATURES[number - 1])]
+    TEMP = STAT_THERM.AddTemperature()
+    TEMP.Location = NS_Faces4
+    TEMP.Magnitude.Output.DiscreteValues = [Quantity('0[K]'), Quantity('568[K]')]
 
 TEMP_RST01 = STAT_THERM_SOLN.AddTemperature()
 TEMP_RST01.Location = NS_Body1
@@ -55,12 +55,17 @@ with open(scripts / "cyclic_symmetry_analysis.py") as sf:
 mech_output = mechanical.run_python_script(mech_script)
 print(mech_output)
 
-# Specify the Mechanical directory and run a script to fetch the working directory path.
+# Query the working directories of all the analyses in a single call, instead of one call per analysis.
+
+working_dirs = mechanical.run_python_script(
+    '"\\n".join([analysis.WorkingDir for analysis in ExtAPI.DataModel.AnalysisList])'
+).splitlines()
+
+# Specify the Mechanical directory and look up its working directory path.
 # The path where all solver files are stored on the server is printed.
 # Download the solver output file (`solve.out`) from the server to the client's current working directory and print its contents.
 
-mechanical.run_python_script(f"solve_dir=ExtAPI.DataModel.AnalysisList[5].WorkingDir")
-result_solve_dir_server = mechanical.run_python_script(f"solve_dir")
+result_solve_dir_server = working_dirs[5]
 print(f"All solver files are stored on the server at: {result_solve_dir_server}")
 
 solve_out_path = os.path.join(result_solve_dir_server, "solve.out")
@@ -77,15 +82,14 @@ solve_out_local_path = os.path.join(current_directory, "solve.out")
 write_file_contents_to_console(solve_out_local_path)
 os.remove(solve_out_local_path)
 
-# Specify the Mechanical directory path for images and run a script to fetch the directory path.
+# Specify the Mechanical directory path for images and look up the directory path.
 # The path where images are stored on the server is printed.
 # Download an image file (`deformation.png`) from the server to the client's current working directory and display it using `matplotlib`.
 
 from matplotlib import image as mpimg
 from matplotlib import pyplot as plt
 
-mechanical.run_python_script(f"image_dir=ExtAPI.DataModel.AnalysisList[5].WorkingDir")
-result_image_dir_server = mechanical.run_python_script(f"image_dir")
+result_image_dir_server = working_dirs[5]
 print(f"Images are stored on the server at: {result_image_dir_server}")
 
 def get_image_path(image_name):
@@ -114,8 +118,7 @@ if image_path_server != "":
 # Download all the files from the server to the current working directory.
 # Verify the source path for the directory and copy all files from the server to the client.
 
-mechanical.run_python_script(f"solve_dir=ExtAPI.DataModel.AnalysisList[5].WorkingDir")
-result_solve_dir_server = mechanical.run_python_script(f"solve_dir")
+result_solve_dir_server = working_dirs[5]
 print(f"All solver files are stored on the server at: {result_solve_dir_server}")
 
 solve_out_path = os.path.join(result_solve_dir_server, "*.*")
@@ -210,16 +210,6 @@ SOLN_MODAL01.Solve(1)
 
 if not TOT_DEF_MODAL01.TabularData:
     raise Exception("TOT_DEF_MODAL01.TabularData is None")
-H0_FRQ1_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][0]
-H0_FRQ2_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][1]
-H1_FRQ1_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][2]
-H1_FRQ2_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][3]
-H2_FRQ1_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][4]
-H2_FRQ2_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][5]
-H3_FRQ1_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][6]
-H3_FRQ2_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][7]
-H4_FRQ1_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][8]
-H4_FRQ2_MODAL01 = TOT_DEF_MODAL01.TabularData["Frequency"][9]
 
 # Setup linear Static Structural analysis
 STAT_STRUC01 = Model.Analyses[1]
@@ -252,17 +242,6 @@ TOT_DEF_MODAL02 = SOLN_MODAL02.AddTotalDeformation()
 
 SOLN_MODAL02.Solve(1)
 
-H0_FRQ1_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][0]
-H0_FRQ2_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][1]
-H1_FRQ1_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][2]
-H1_FRQ2_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][3]
-H2_FRQ1_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][4]
-H2_FRQ2_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][5]
-H3_FRQ1_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][6]
-H3_FRQ2_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][7]
-H4_FRQ1_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][8]
-H4_FRQ2_MODAL02 = TOT_DEF_MODAL02.TabularData["Frequency"][9]
-
 # Setup non-linear Static Structural analysis
 STAT_STRUC02 = Model.Analyses[3]
 ANA_SETTING_STAT_STRUC02 = Model.Analyses[3].AnalysisSettings
@@ -296,17 +275,6 @@ TOT_DEF_MODAL03 = SOLN_MODAL03.AddTotalDeformation()
 
 SOLN_MODAL03.Solve(1)
 
-H0_FRQ1_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][0]
-H0_FRQ2_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][1]
-H1_FRQ1_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][2]
-H1_FRQ2_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][3]
-H2_FRQ1_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][4]
-H2_FRQ2_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][5]
-H3_FRQ1_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][6]
-H3_FRQ2_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][7]
-H4_FRQ1_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][8]
-H4_FRQ2_MODAL03 = TOT_DEF_MODAL03.TabularData["Frequency"][9]
-
 # Setup standalone FULL Harmonic analysis
 HARM_RESP01 = Model.Analyses[5]
 ANA_SETTING_HARM_RESP01 = Model.Analyses[5].AnalysisSettings
@@ -154,18 +154,14 @@ cfx_data_path = download_file("example_10_CFX_ExportResults_FT_10P_EO2.csv", "py
 temp_data_path = download_file("example_10_Temperature_Data.txt", "pymechanical", "embedding")
 # -
 
-# ### File path corrections
-
-geometry_path = geometry_path.replace("\\",r"/")
-cfx_data_path = cfx_data_path.replace("\\",r"/")
-temp_data_path = temp_data_path.replace("\\",r"/")
-
 # ### Pass this vairable info to the PyMechanical instance
+# The paths are written with `!r`, which quotes and escapes them as Python strings, so Windows paths
+# with backslashes or quotes are passed unchanged.
 
 mech_output = mechanical.run_python_script(f"""
-geometry_path='{geometry_path}'
-cfx_data_path='{cfx_data_path}'
-temp_data_path='{temp_data_path}'
+geometry_path={geometry_path!r}
+cfx_data_path={cfx_data_path!r}
+temp_data_path={temp_data_path!r}
 """)
 
 # ### Run a Mechanical python script using PyMechanical to mesh and solve the model
@@ -175,13 +171,17 @@ with open (scripts / "nasa_rotor_67_fan_blade_inverse_solve.py") as sf:
 mech_output = mechanical.run_python_script(mech_script)
 print(mech_output)
 
+# Query the working directories of all the analyses in a single call, instead of one call per analysis.
+
+working_dirs = mechanical.run_python_script(
+    '"\\n".join([analysis.WorkingDir for analysis in ExtAPI.DataModel.AnalysisList])'
+).splitlines()
+
 # ### Download output files from PyMechanical working directory and print contents
 
 # +
 # Specify Mechanical directory
-mechanical.run_python_script(f"solve_dir=ExtAPI.DataModel.AnalysisList[0].WorkingDir")
-
-result_solve_dir_server = mechanical.run_python_script(f"solve_dir")
+result_solve_dir_server = working_dirs[0]
 print(f"All solver files are stored on the server at: {result_solve_dir_server}")
 
 solve_out_path = os.path.join(result_solve_dir_server, "solve.out")
@@ -201,11 +201,8 @@ os.remove(solve_out_local_path)
 # ### Download postprocess/output images from PyMechanical working directory and display
 
 # +
-#Specify Mechanical directory path
-mechanical.run_python_script(f"image_dir=ExtAPI.DataModel.AnalysisList[0].WorkingDir")
-
-# Verify the path for image directory.
-result_image_dir_server = mechanical.run_python_script(f"image_dir")
+# Specify Mechanical directory path
+result_image_dir_server = working_dirs[0]
 print(f"Images are stored on the server at: {result_image_dir_server}")
 
 # Download one image file from the server to the current working directory and plot
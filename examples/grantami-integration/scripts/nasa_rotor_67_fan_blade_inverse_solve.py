@@ -79,10 +79,14 @@ ExtAPI.Graphics.ExportImage(
 materials = ExtAPI.DataModel.Project.Model.Materials
 materials.RefreshMaterials()
 
-PRT1 = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Component2\Rotor11"][
-    0
-]
-PRT2 = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Component3"][0]
+# Index the tree objects by name in a single pass over the tree, instead of one pass per lookup.
+# The first object of each name is kept, as a search of the tree would return.
+TREE_OBJECTS = {}
+for tree_object in ExtAPI.DataModel.Tree.AllObjects:
+    TREE_OBJECTS.setdefault(tree_object.Name, tree_object)
+
+PRT1 = TREE_OBJECTS["Component2\Rotor11"]
+PRT2 = TREE_OBJECTS["Component3"]
 PRT2_Blade_1 = PRT2.Children[0]
 PRT2_Blade_2 = PRT2.Children[1]
 PRT2_Blade_3 = PRT2.Children[2]
@@ -112,43 +116,23 @@ MAT_GRP = Model.Materials
 # Create NS for Named Selection.
 
 NS_GRP = ExtAPI.DataModel.Project.Model.NamedSelections
-BLADE_NS = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade"][0]
-BLADE_SURF_NS = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade_Surf"][
-    0
-]
-FIX_SUPPORT_NS = [
-    x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Fix_Support"
-][0]
-BLADE_HUB_NS = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade_Hub"][0]
-HUB_CONTACT_NS = [
-    x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Hub_Contact"
-][0]
-BLADE_TARGET_NS = [
-    x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade_Target"
-][0]
-Hub_Low_NS = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Hub_Low"][0]
-Hub_High_NS = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Hub_High"][0]
-BLADE1_NS = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade1"][0]
-BLADE1_Source_NS = [
-    x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade1_Source"
-][0]
-BLADE1_TARGET_NS = [
-    x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade1_Target"
-][0]
-BLADE2_NS = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade2"][0]
-BLADE2_Source_NS = [
-    x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade2_Source"
-][0]
-BLADE2_TARGET_NS = [
-    x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade2_Target"
-][0]
-BLADE3_NS = [x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade3"][0]
-BLADE3_Source_NS = [
-    x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade3_Source"
-][0]
-BLADE3_TARGET_NS = [
-    x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade3_Target"
-][0]
+BLADE_NS = TREE_OBJECTS["Blade"]
+BLADE_SURF_NS = TREE_OBJECTS["Blade_Surf"]
+FIX_SUPPORT_NS = TREE_OBJECTS["Fix_Support"]
+BLADE_HUB_NS = TREE_OBJECTS["Blade_Hub"]
+HUB_CONTACT_NS = TREE_OBJECTS["Hub_Contact"]
+BLADE_TARGET_NS = TREE_OBJECTS["Blade_Target"]
+Hub_Low_NS = TREE_OBJECTS["Hub_Low"]
+Hub_High_NS = TREE_OBJECTS["Hub_High"]
+BLADE1_NS = TREE_OBJECTS["Blade1"]
+BLADE1_Source_NS = TREE_OBJECTS["Blade1_Source"]
+BLADE1_TARGET_NS = TREE_OBJECTS["Blade1_Target"]
+BLADE2_NS = TREE_OBJECTS["Blade2"]
+BLADE2_Source_NS = TREE_OBJECTS["Blade2_Source"]
+BLADE2_TARGET_NS = TREE_OBJECTS["Blade2_Target"]
+BLADE3_NS = TREE_OBJECTS["Blade3"]
+BLADE3_Source_NS = TREE_OBJECTS["Blade3_Source"]
+BLADE3_TARGET_NS = TREE_OBJECTS["Blade3_Target"]
 
 ###################################################################################
 # Define coordinate system
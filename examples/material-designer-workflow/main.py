@@ -46,23 +46,33 @@ UpdateAllDesignPoints(DesignPoints=[designPoint1])
 my_command = wbjn_template.format( 1.6e10 )
 wb.run_script_string( my_command )
 
-# Extract output values. First, we prepare the Workbench script to quiry output parameter values
-
-extract_output = '''import json
-p = Parameters.GetParameter(Name="P{}")
-my_tag = p.DisplayText
-wb_script_result =json.dumps( my_tag + ',' + str(p.Value) )
-'''
+# Extract output values. First, we prepare a Workbench script that reads the output parameters `P2` to `P11` in a single call.
+# For each parameter, it returns its display text, its value as a number, and its unit.
+
+extract_outputs = """import json
+result = {}
+for name in names:
+    p = Parameters.GetParameter(Name=name)
+    value = p.Value
+    if hasattr(value, "Unit"):
+        result[name] = [p.DisplayText, float(value.Value), str(value.Unit)]
+    else:
+        result[name] = [p.DisplayText, float(value), ""]
+wb_script_result = json.dumps(result)
+"""
 
 # Get updated output values
 
+names = ["P{}".format(p) for p in range(2, 12)]
+return_val = wb.run_script_string("names = {!r}\n".format(names) + extract_outputs)
 outputs = {}
-for p in range( 2 , 12 ):
-    return_val = wb.run_script_string( extract_output.format( p ) ).split(',')
-    name = return_val[0]
-    parameter_val = float(return_val[1])
-    outputs[ name ] = parameter_val
+units = {}
+for name in names:
+    display_text, parameter_val, unit = return_val[name]
+    outputs[display_text] = parameter_val
+    units[display_text] = unit
 print( outputs )
+print( units )
 
 # Finally, call the `exit` method on the Workbench client to gracefully shut down the service.
 
@@ -0,0 +1,98 @@
+"""Tests of the phase splitting and regression checks of ``tools.benchmark``."""
+
+from tools.benchmark import (
+    METRICS,
+    PHASES,
+    append_history,
+    build_baseline,
+    compare,
+    read_history,
+    split_mechanical_script,
+)
+
+SCRIPT = """MESH = Model.Mesh
+MESH.ElementSize = Quantity("2 [mm]")
+MESH.GenerateMesh()
+ANALYSIS = Model.Analyses[0]
+if ANALYSIS:
+    ANALYSIS.Solution.Solve(True)
+RESULT = ANALYSIS.Solution.Children[1]
+RESULT.Maximum
+"""
+
+
+def make_record(example="logging", mode="offline", status="passed", wall=1.0, **phases):
+    """Return a history record whose phases all take ``wall`` seconds unless given."""
+    return {
+        "example": example,
+        "mode": mode,
+        "status": status,
+        "phases": {
+            phase: dict(
+                {metric: 0 for metric in METRICS}, wall=phases.get(phase, wall), calls=1
+            )
+            for phase in PHASES
+        },
+    }
+
+
+def test_split_mechanical_script_after_mesh_and_solve():
+    parts = split_mechanical_script(SCRIPT)
+
+    assert [phase for phase, _ in parts] == ["meshing", "solve", "result_query"]
+    assert parts[0][1].endswith("MESH.GenerateMesh()\n")
+    assert parts[1][1].startswith("ANALYSIS = Model.Analyses[0]\n")
+    assert parts[1][1].endswith("    ANALYSIS.Solution.Solve(True)\n")
+    assert "".join(text for _, text in parts) == SCRIPT
+
+
+def test_split_mechanical_script_without_trailing_query():
+    parts = split_mechanical_script("Model.Mesh.GenerateMesh()\nModel.Solve()\n")
+
+    assert [phase for phase, _ in parts] == ["meshing", "solve"]
+
+
+def test_split_mechanical_script_returns_other_scripts_whole():
+    assert split_mechanical_script("Model.Mesh.Nodes") == [("result_query", "Model.Mesh.Nodes")]
+    # IronPython print statements are not valid Python 3, the script is classified whole.
+    script = 'print "mesh"\nModel.Mesh.GenerateMesh()\nModel.Solve()\n'
+    assert split_mechanical_script(script) == [("solve", script)]
+
+
+def test_build_baseline_uses_median_of_latest_passing_runs():
+    history = [make_record(wall=100.0)] + [make_record(wall=wall) for wall in (1.0, 3.0, 2.0)]
+    history.append(make_record(status="failed", wall=50.0))
+    history.append(make_record(example="cyclic-symmetry-analysis", wall=7.0))
+
+    baseline = build_baseline(history, runs=3)
+
+    assert baseline["offline"]["logging"]["solve"]["wall"] == 2.0
+    assert baseline["offline"]["cyclic-symmetry-analysis"]["solve"]["wall"] == 7.0
+
+
+def test_compare_flags_only_significant_regressions():
+    baseline = build_baseline([make_record(wall=10.0)])
+
+    record = make_record(solve=20.0, meshing=10.5, download=10.9)
+    regressions = compare(record, baseline, threshold=0.2, min_delta=1.0)
+
+    assert regressions == [
+        {"phase": "solve", "metric": "wall", "baseline": 10.0, "measured": 20.0}
+    ]
+    assert compare(make_record(example="unknown", solve=20.0), baseline) == []
+
+
+def test_compare_ignores_small_absolute_increases():
+    baseline = build_baseline([make_record(wall=0.1)])
+
+    assert compare(make_record(wall=0.1, solve=0.5), baseline, min_delta=1.0) == []
+
+
+def test_history_round_trip(tmp_path):
+    path = tmp_path / "history" / "offline.jsonl"
+    records = [make_record(wall=1.0), make_record(wall=2.0)]
+    for record in records:
+        append_history(path, record)
+
+    assert read_history(path) == records
+    assert read_history(tmp_path / "missing.jsonl") == []
@@ -0,0 +1,103 @@
+"""Tests of the recording and replay of sessions with ``tools.cassette``."""
+
+import os
+import pathlib
+
+import pytest
+
+from tools.cassette import WORKBENCH, Cassette, payload_key, record, replay, summarize
+from tools.offline_workbench import ScriptedResponses, install
+
+
+def run_session(client_dir, output_dir):
+    """Drive a Workbench and Mechanical session and return what the client observed."""
+    from ansys.mechanical.core import connect_to_mechanical
+    from ansys.workbench.core import launch_workbench
+
+    wb = launch_workbench(client_workdir=str(client_dir))
+    observed = {"systems": wb.run_script_string("wb_script_result = json.dumps(['SYS'])")}
+    wb.upload_file("input.txt")
+    observed["download"] = wb.download_file("input.txt", target_dir=str(output_dir / "wb"))
+    mechanical = connect_to_mechanical(port=wb.start_mechanical_server(observed["systems"][0]))
+    observed["solve"] = mechanical.run_python_script("Model.Solve()")
+    observed["solve_again"] = mechanical.run_python_script("Model.Solve()")
+    working_dir = mechanical.run_python_script("Model.Analyses[0].WorkingDir")
+    observed["files"] = [
+        os.path.basename(path)
+        for path in mechanical.download(
+            os.path.join(working_dir, "solve.out"), target_dir=str(output_dir / "mech")
+        )
+    ]
+    mechanical.exit()
+    wb.exit()
+    return observed
+
+
+@pytest.fixture
+def client_dir(tmp_path):
+    client_dir = tmp_path / "client"
+    client_dir.mkdir()
+    (client_dir / "input.txt").write_text("input\n")
+    return client_dir
+
+
+def test_record_and_replay_round_trip(tmp_path, client_dir):
+    solves = iter(["first", "second"])
+    mechanical_responses = ScriptedResponses(
+        [
+            ("Solve", lambda script: next(solves)),
+            ("WorkingDir", "{project_directory}/dp0/SYS/MECH"),
+        ]
+    )
+    cassette_path = tmp_path / "session.cassette"
+    with install(
+        responses=ScriptedResponses([("json.dumps", ["SYS"])]),
+        mechanical_responses=mechanical_responses,
+        mechanical_files={"dp0/SYS/MECH/solve.out": b"solved\n"},
+    ):
+        with record(cassette_path):
+            recorded = run_session(client_dir, tmp_path / "recorded")
+
+    with replay(cassette_path):
+        replayed = run_session(client_dir, tmp_path / "replayed")
+
+    assert replayed == recorded
+    assert recorded["solve"] == "first" and recorded["solve_again"] == "second"
+    for directory, name in (("wb", "input.txt"), ("mech", "solve.out")):
+        assert (tmp_path / "replayed" / directory / name).read_bytes() == (
+            tmp_path / "recorded" / directory / name
+        ).read_bytes()
+
+    cassette = Cassette.load(cassette_path)
+    summary = {(entry["target"], entry["method"]): entry for entry in summarize(cassette)}
+    assert summary[("mechanical", "run_python_script")]["calls"] == 3
+    assert summary[("workbench", "upload_file")]["bytes"] == len("input\n")
+
+
+def test_replay_fails_on_unrecorded_call(tmp_path):
+    cassette = Cassette()
+    cassette.record(WORKBENCH, "run_script", payload_key("a"), 1, 0.0)
+    cassette.record(WORKBENCH, "run_script", payload_key("a"), 2, 0.0)
+    path = tmp_path / "session.cassette"
+    cassette.save(path)
+    cassette = Cassette.load(path)
+
+    assert cassette.next(WORKBENCH, "run_script", payload_key("a"))["result"] == 1
+    assert cassette.next(WORKBENCH, "run_script", payload_key("a"))["result"] == 2
+    with pytest.raises(KeyError, match="No recorded workbench run_script"):
+        cassette.next(WORKBENCH, "run_script", payload_key("a"))
+
+
+def test_cassette_stores_downloaded_files_once(tmp_path):
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_text("same")
+    second.write_text("same")
+    cassette = Cassette()
+    cassette.record(WORKBENCH, "download_file", "a", None, 0.0, [first], store_files=True)
+    cassette.record(WORKBENCH, "download_file", "b", None, 0.0, [second], store_files=True)
+
+    assert len(cassette.blobs) == 1
+    record_b = cassette.interactions[1]["files"][0]
+    written = cassette.write_file(record_b, tmp_path / "out")
+    assert pathlib.Path(written).read_text() == "same"
+    assert os.path.basename(written) == "second.txt"
@@ -0,0 +1,146 @@
+"""Tests of the chunked, checksummed and resumable transfers of ``tools.chunked_transfer``."""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from tools import chunked_transfer
+from tools.chunked_transfer import _chunks, download_chunked, upload_chunked
+
+
+class FakeWorkbenchClient:
+    """Workbench client running the server scripts in process on a local directory."""
+
+    def __init__(self, server_dir):
+        self.server_dir = server_dir
+        self.fetched = []
+        self.uploaded = []
+        self.fail_fetch = set()
+        self.fail_upload = set()
+
+    def run_script_string(self, script):
+        namespace = {"GetServerWorkingDirectory": lambda: str(self.server_dir)}
+        exec(script, namespace)
+        return json.loads(namespace["wb_script_result"])
+
+    def download_file(self, name, show_progress=True, target_dir=None):
+        index = int(name.split(".")[-2 if name.endswith(".chunk") else -3])
+        if index in self.fail_fetch:
+            raise ConnectionError(f"Lost the connection while fetching chunk {index}.")
+        self.fetched.append(index)
+        shutil.copy(os.path.join(self.server_dir, name), target_dir)
+
+    def upload_file(self, path, show_progress=True):
+        if int(os.path.basename(path).split(".")[2]) in self.fail_upload:
+            raise ConnectionError(f"Lost the connection while sending {path}.")
+        self.uploaded.append(os.path.basename(path))
+        shutil.copy(path, self.server_dir)
+
+
+@pytest.fixture
+def server(tmp_path):
+    server_dir = tmp_path / "server"
+    server_dir.mkdir()
+    (server_dir / "file.rst").write_bytes(os.urandom(2500) + b"\0" * 2000)
+    return FakeWorkbenchClient(server_dir)
+
+
+@pytest.mark.parametrize(
+    "size, chunk_size, expected",
+    [
+        (10, 5, [(0, 0, 5), (1, 5, 5)]),
+        (11, 5, [(0, 0, 5), (1, 5, 5), (2, 10, 1)]),
+        (3, 5, [(0, 0, 3)]),
+        (0, 5, [(0, 0, 0)]),
+    ],
+)
+def test_chunks(size, chunk_size, expected):
+    chunks = _chunks(size, chunk_size)
+
+    assert [(chunk["index"], chunk["offset"], chunk["size"]) for chunk in chunks] == expected
+
+
+@pytest.mark.parametrize("compress_level", [None, 6])
+def test_download_chunked(tmp_path, server, compress_level):
+    target = download_chunked(
+        server, "file.rst", tmp_path / "client", chunk_size=1000, compress_level=compress_level
+    )
+
+    assert open(target, "rb").read() == (server.server_dir / "file.rst").read_bytes()
+    assert sorted(server.fetched) == [0, 1, 2, 3, 4]
+    assert sorted(os.listdir(tmp_path / "client")) == ["file.rst"]
+    assert sorted(os.listdir(server.server_dir)) == ["file.rst"]
+
+
+def test_download_chunked_resumes_from_verified_chunks(tmp_path, server):
+    client_dir = tmp_path / "client"
+    server.fail_fetch = {3}
+    with pytest.raises(ConnectionError):
+        download_chunked(server, "file.rst", client_dir, chunk_size=1000, max_workers=1, retries=0)
+    state = json.loads((client_dir / "file.rst.part.json").read_text())
+    assert sorted(state["done"]) == ["0", "1", "2", "4"]
+    assert sorted(os.listdir(server.server_dir)) == ["file.rst"]
+
+    server.fail_fetch, server.fetched = set(), []
+    target = download_chunked(server, "file.rst", client_dir, chunk_size=1000)
+
+    assert server.fetched == [3]
+    assert open(target, "rb").read() == (server.server_dir / "file.rst").read_bytes()
+    assert not (client_dir / "file.rst.part.json").exists()
+
+
+def test_download_chunked_restarts_when_source_or_chunk_size_change(tmp_path, server):
+    client_dir = tmp_path / "client"
+    server.fail_fetch = {3}
+    with pytest.raises(ConnectionError):
+        download_chunked(server, "file.rst", client_dir, chunk_size=1000, max_workers=1, retries=0)
+    server.fail_fetch, server.fetched = set(), []
+
+    download_chunked(server, "file.rst", client_dir, chunk_size=500)
+
+    assert sorted(server.fetched) == list(range(9))
+
+
+def test_download_chunked_retries_failed_chunks(tmp_path, server, monkeypatch):
+    attempts = []
+    fetch = chunked_transfer._WorkbenchServer.fetch
+
+    def flaky_fetch(self, name, directory, target_dir):
+        attempts.append(name)
+        if len(attempts) == 1:
+            raise ConnectionError("Transient failure.")
+        fetch(self, name, directory, target_dir)
+
+    monkeypatch.setattr(chunked_transfer._WorkbenchServer, "fetch", flaky_fetch)
+    target = download_chunked(server, "file.rst", tmp_path, chunk_size=5000, retries=1)
+
+    assert len(attempts) == 2
+    assert open(target, "rb").read() == (server.server_dir / "file.rst").read_bytes()
+
+
+def test_upload_chunked(tmp_path, server):
+    path = tmp_path / "input.cdb"
+    path.write_bytes(os.urandom(2500))
+
+    assert upload_chunked(server, str(path), chunk_size=1000) == str(
+        server.server_dir / "input.cdb"
+    )
+    assert len(server.uploaded) == 3
+    assert (server.server_dir / "input.cdb").read_bytes() == path.read_bytes()
+    assert sorted(os.listdir(server.server_dir)) == ["file.rst", "input.cdb"]
+
+
+def test_upload_chunked_resumes_from_staged_chunks(tmp_path, server):
+    path = tmp_path / "input.cdb"
+    path.write_bytes(os.urandom(2500))
+    server.fail_upload = {2}
+    with pytest.raises(ConnectionError):
+        upload_chunked(server, str(path), chunk_size=1000, max_workers=1, retries=0)
+    server.fail_upload, server.uploaded = set(), []
+
+    upload_chunked(server, str(path), chunk_size=1000)
+
+    assert [name.split(".")[2] for name in server.uploaded] == ["00002"]
+    assert (server.server_dir / "input.cdb").read_bytes() == path.read_bytes()
@@ -0,0 +1,71 @@
+"""Tests of the frequency matrices of cyclic modal analyses of ``tools.cyclic_modes``."""
+
+import numpy as np
+import pytest
+
+from tools.cyclic_modes import frequency_matrix, stack_matrices
+
+
+def make_table(frequencies, harmonic_indices=None, unit="Hz"):
+    """Return a table as read by ``tools.tabular_data.get_tabular_data``."""
+    columns = [("Frequency", np.asarray(frequencies, dtype="f8"))]
+    if harmonic_indices is not None:
+        columns.insert(0, ("Harmonic Index", np.asarray(harmonic_indices, dtype="f8")))
+    values = np.empty(len(frequencies), dtype=[(name, "f8") for name, _ in columns])
+    for name, column in columns:
+        values[name] = column
+    return {"values": values, "units": {"Frequency": unit}}
+
+
+def test_frequency_matrix_from_harmonic_index_column():
+    table = make_table([5.0, 1.0, 6.0, 2.0, 3.0], harmonic_indices=[2, 0, 2, 0, 0])
+
+    matrix = frequency_matrix(table)
+
+    np.testing.assert_array_equal(matrix["harmonic_indices"], [0, 2])
+    np.testing.assert_array_equal(matrix["frequencies"], [[1.0, 2.0, 3.0], [5.0, 6.0, np.nan]])
+    assert matrix["unit"] == "Hz"
+
+
+def test_frequency_matrix_from_modes_per_index():
+    matrix = frequency_matrix(make_table([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]), modes_per_index=3)
+
+    np.testing.assert_array_equal(matrix["harmonic_indices"], [0, 1])
+    np.testing.assert_array_equal(matrix["frequencies"], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+
+def test_frequency_matrix_of_empty_table():
+    matrix = frequency_matrix(make_table([], harmonic_indices=[]))
+
+    assert matrix["harmonic_indices"].shape == (0,)
+    assert matrix["frequencies"].shape == (0, 0)
+
+
+def test_frequency_matrix_requires_harmonic_indices():
+    with pytest.raises(ValueError, match="no 'Harmonic Index' column"):
+        frequency_matrix(make_table([1.0, 2.0]))
+
+
+def test_stack_matrices_aligns_harmonic_indices():
+    standalone = frequency_matrix(make_table([1.0, 2.0, 3.0, 4.0], harmonic_indices=[0, 0, 1, 1]))
+    prestress = frequency_matrix(make_table([5.0, 6.0, 7.0], harmonic_indices=[1, 2, 2]))
+
+    harmonic_indices, frequencies = stack_matrices(
+        {"standalone": standalone, "prestress": prestress}
+    )
+
+    np.testing.assert_array_equal(harmonic_indices, [0, 1, 2])
+    np.testing.assert_array_equal(
+        frequencies,
+        [
+            [[1.0, 2.0], [3.0, 4.0], [np.nan, np.nan]],
+            [[np.nan, np.nan], [5.0, np.nan], [6.0, 7.0]],
+        ],
+    )
+
+
+def test_stack_matrices_of_no_matrices():
+    harmonic_indices, frequencies = stack_matrices({})
+
+    assert harmonic_indices.shape == (0,)
+    assert frequencies.shape == (0, 0, 0)
@@ -0,0 +1,143 @@
+"""Tests of the incremental synchronization of the examples in ``doc/source/conf.py``."""
+
+import importlib.util
+import json
+import os
+import pathlib
+
+import pytest
+
+CONF_PATH = pathlib.Path(__file__).parents[1] / "doc" / "source" / "conf.py"
+
+
+@pytest.fixture(scope="module")
+def conf():
+    spec = importlib.util.spec_from_file_location("doc_conf", CONF_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def trees(tmp_path):
+    src = tmp_path / "examples"
+    (src / "logging" / "assets").mkdir(parents=True)
+    (src / "logging" / "main.py").write_text("print('main')\n")
+    (src / "logging" / "assets" / "model.txt").write_text("model\n")
+    (src / "logging" / "__pycache__").mkdir()
+    (src / "logging" / "__pycache__" / "main.pyc").write_bytes(b"\0")
+    dst = tmp_path / "source" / "examples"
+    return src, dst, dst / ".sync_manifest.json"
+
+
+@pytest.fixture
+def copies(conf, monkeypatch):
+    copied = []
+    clone_or_copy = conf.clone_or_copy
+
+    def counting_clone_or_copy(src, dst):
+        copied.append(dst.name)
+        clone_or_copy(src, dst)
+
+    monkeypatch.setattr(conf, "clone_or_copy", counting_clone_or_copy)
+    return copied
+
+
+def test_sync_tree_copies_files_and_writes_manifest(conf, trees, copies):
+    src, dst, manifest_file = trees
+
+    manifest = conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+
+    assert sorted(manifest) == ["logging/assets/model.txt", "logging/main.py"]
+    assert (dst / "logging" / "main.py").read_text() == "print('main')\n"
+    assert not (dst / "logging" / "__pycache__").exists()
+    assert json.loads(manifest_file.read_text()) == manifest
+    assert sorted(copies) == ["main.py", "model.txt"]
+
+
+def test_sync_tree_skips_unchanged_files(conf, trees, copies):
+    src, dst, manifest_file = trees
+    conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+    copies.clear()
+
+    conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+
+    assert copies == []
+
+
+def test_sync_tree_only_updates_metadata_of_touched_files(conf, trees, copies):
+    src, dst, manifest_file = trees
+    conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+    copies.clear()
+    main = src / "logging" / "main.py"
+    stat = main.stat()
+    os.utime(main, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    manifest = conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+
+    assert copies == []
+    assert (dst / "logging" / "main.py").stat().st_mtime_ns == main.stat().st_mtime_ns
+    assert manifest["logging/main.py"]["mtime_ns"] == main.stat().st_mtime_ns
+
+
+def test_sync_tree_copies_changed_files(conf, trees, copies):
+    src, dst, manifest_file = trees
+    conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+    copies.clear()
+    (src / "logging" / "main.py").write_text("print('changed main')\n")
+
+    conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+
+    assert copies == ["main.py"]
+    assert (dst / "logging" / "main.py").read_text() == "print('changed main')\n"
+
+
+def test_sync_tree_copies_files_modified_in_destination(conf, trees, copies):
+    src, dst, manifest_file = trees
+    conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+    copies.clear()
+    (dst / "logging" / "main.py").write_text("print('executed')\n# output\n")
+
+    conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+
+    assert copies == ["main.py"]
+    assert (dst / "logging" / "main.py").read_text() == "print('main')\n"
+
+
+def test_sync_tree_removes_files_deleted_from_source(conf, trees):
+    src, dst, manifest_file = trees
+    conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+    (src / "logging" / "assets" / "model.txt").unlink()
+    (dst / "logging" / "output.txt").write_text("generated\n")
+
+    manifest = conf.sync_tree(src, dst, ["__pycache__"], manifest_file)
+
+    assert sorted(manifest) == ["logging/main.py"]
+    assert not (dst / "logging" / "assets").exists()
+    assert not (dst / "logging" / "output.txt").exists()
+    assert manifest_file.exists()
+
+
+def test_sync_tree_rejects_missing_source(conf, tmp_path):
+    with pytest.raises(ValueError, match="is not a directory"):
+        conf.sync_tree(tmp_path / "missing", tmp_path / "dst", [], tmp_path / "dst" / "m.json")
+
+
+def test_prune_tree_keeps_listed_files_and_removes_empty_directories(conf, tmp_path):
+    (tmp_path / "kept").mkdir()
+    (tmp_path / "kept" / "a.txt").write_text("a")
+    (tmp_path / "kept" / "b.txt").write_text("b")
+    (tmp_path / "empty" / "nested").mkdir(parents=True)
+    (tmp_path / "removed").mkdir()
+    (tmp_path / "removed" / "c.txt").write_text("c")
+
+    conf.prune_tree(tmp_path, {"kept/a.txt"})
+
+    assert sorted(path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*")) == [
+        "kept",
+        "kept/a.txt",
+    ]
+
+
+def test_prune_tree_ignores_missing_root(conf, tmp_path):
+    conf.prune_tree(tmp_path / "missing", set())
@@ -0,0 +1,95 @@
+"""Tests of the offline Workbench and Mechanical servers."""
+
+import json
+import os
+import pathlib
+import shutil
+import zipfile
+
+from tools.offline_workbench import (
+    OfflineWorkbenchClient,
+    ScriptedResponses,
+    connect_to_mechanical,
+    load_default_responses,
+    run_example,
+    substitute_script_args,
+)
+
+EXAMPLES_DIR = pathlib.Path(__file__).parents[1] / "examples"
+
+
+def test_scripted_responses_first_match_wins():
+    responses = ScriptedResponses([("GetParameter", 1), ("Parameter", 2)])
+    responses.add("Set", lambda script: script.upper())
+
+    assert responses.resolve("GetParameter(Name='P1')") == 1
+    assert responses.resolve("Parameters") == 2
+    assert responses.resolve("SetParameter") == "SETPARAMETER"
+    assert responses.resolve("Reset()") is None
+
+
+def test_scripted_responses_from_file(tmp_path):
+    path = tmp_path / "responses.json"
+    path.write_text(json.dumps([{"match": "system", "result": ["SYS"]}]))
+
+    assert ScriptedResponses.from_file(path).resolve("system1.Name") == ["SYS"]
+
+
+def test_substitute_script_args():
+    script = "a = $$first%%1%%\nb = $$second%%two%%\n"
+
+    assert substitute_script_args(script, {"first": 3}) == "a = 3\nb = two\n"
+
+
+def test_upload_and_download_files(tmp_path):
+    client_dir = tmp_path / "client"
+    client_dir.mkdir()
+    (client_dir / "a.txt").write_text("a")
+    (client_dir / "b.txt").write_text("b")
+    with OfflineWorkbenchClient(client_workdir=str(client_dir)) as wb:
+        assert sorted(wb.upload_file("*.txt")) == ["a.txt", "b.txt"]
+
+        assert wb.download_file("a.txt", target_dir=str(tmp_path / "one")) == "a.txt"
+        assert (tmp_path / "one" / "a.txt").read_text() == "a"
+        archive = wb.download_file("*.txt", target_dir=str(tmp_path / "all"))
+        with zipfile.ZipFile(tmp_path / "all" / archive) as zip_file:
+            assert sorted(zip_file.namelist()) == ["a.txt", "b.txt"]
+        assert wb.download_file("missing.txt") is None
+        server_workdir = wb.server_workdir
+    assert not os.path.exists(server_workdir)
+
+
+def test_mechanical_server_files_and_project_directory(tmp_path):
+    responses = ScriptedResponses([("WorkingDir", "{project_directory}/dp0/SYS/MECH")])
+    with OfflineWorkbenchClient(
+        client_workdir=str(tmp_path),
+        mechanical_responses=responses,
+        mechanical_files={"dp0/SYS/MECH/solve.out": b"solved\n"},
+    ) as wb:
+        mechanical = connect_to_mechanical(port=wb.start_mechanical_server("SYS"))
+
+        working_dir = mechanical.run_python_script("Model.Analyses[0].WorkingDir")
+        assert working_dir == os.path.join(wb.server_workdir, "SYS_files", "dp0", "SYS", "MECH")
+        assert mechanical.run_python_script("Model.Mesh.Nodes") == ""
+        downloaded = mechanical.download(
+            os.path.join(working_dir, "solve.out"), target_dir=str(tmp_path)
+        )
+        assert [pathlib.Path(path).read_text() for path in downloaded] == ["solved\n"]
+
+
+def test_load_default_responses():
+    options = load_default_responses(EXAMPLES_DIR / "cooled-turbine-blade")
+
+    assert options["responses"].resolve("result = system1.Name\n") == "SYS"
+    assert options["mechanical_files"]["dp0/SYS-1/MECH/stress.png"].startswith(b"\x89PNG")
+    assert load_default_responses(EXAMPLES_DIR / "logging") == {}
+
+
+def test_run_example_with_default_responses(tmp_path, capsys):
+    example_dir = tmp_path / "material-designer-workflow"
+    shutil.copytree(EXAMPLES_DIR / "material-designer-workflow", example_dir)
+
+    variables = run_example(example_dir)
+
+    assert sorted(variables["outputs"]) == sorted(f"P{index}" for index in range(2, 12))
+    assert "{'P2': 0.0" in capsys.readouterr().out
@@ -0,0 +1,96 @@
+"""Tests of the classification and selective download of ``tools.solver_files``."""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from tools.solver_files import classify, download_solver_files, get_manifest, select
+
+
+class FakeMechanicalClient:
+    """Mechanical client running the server scripts in process on the local file system."""
+
+    def __init__(self):
+        self.downloaded = []
+
+    def run_python_script(self, script):
+        namespace = {}
+        exec(script, namespace)
+        return json.dumps(namespace["result"])
+
+    def download(self, path, target_dir=None):
+        self.downloaded.append(os.path.basename(path))
+        os.makedirs(target_dir, exist_ok=True)
+        return [shutil.copy(path, target_dir)]
+
+
+@pytest.fixture
+def solve_dir(tmp_path):
+    solve_dir = tmp_path / "MECH"
+    solve_dir.mkdir()
+    for name, size in (("file.rst", 300), ("solve.out", 20), ("file.r001", 10), ("file.FULL", 50)):
+        (solve_dir / name).write_bytes(b"x" * size)
+    return solve_dir
+
+
+@pytest.mark.parametrize(
+    "name, file_type",
+    [
+        ("file.rst", "results"),
+        ("FILE.RTH", "results"),
+        ("solve.out", "logs"),
+        ("ds.dat", "inputs"),
+        ("stress.png", "images"),
+        ("file.r003", "scratch"),
+        ("file.full", "scratch"),
+        ("notes.txt", "other"),
+    ],
+)
+def test_classify(name, file_type):
+    assert classify(name) == file_type
+
+
+def test_get_manifest(solve_dir):
+    manifest = get_manifest(FakeMechanicalClient(), str(solve_dir))
+
+    assert [(entry["name"], entry["size"], entry["type"]) for entry in manifest] == [
+        ("file.FULL", 50, "scratch"),
+        ("file.r001", 10, "scratch"),
+        ("file.rst", 300, "results"),
+        ("solve.out", 20, "logs"),
+    ]
+
+
+def test_select():
+    manifest = [
+        {"name": "file.rst", "size": 300, "type": "results"},
+        {"name": "solve.out", "size": 20, "type": "logs"},
+        {"name": "file.esav", "size": 50, "type": "scratch"},
+    ]
+
+    def names(entries):
+        return [entry["name"] for entry in entries]
+
+    assert names(select(manifest)) == ["file.rst", "solve.out", "file.esav"]
+    assert names(select(manifest, types=["results", "logs"])) == ["file.rst", "solve.out"]
+    assert names(select(manifest, max_size=50)) == ["solve.out", "file.esav"]
+    assert names(select(manifest, names=["*.rst", "solve.*"], max_size=100)) == ["solve.out"]
+    assert select(manifest, types=[]) == []
+
+
+def test_download_solver_files_skips_identical_files(tmp_path, solve_dir):
+    client = FakeMechanicalClient()
+    target_dir = tmp_path / "client"
+    target_dir.mkdir()
+    shutil.copy(solve_dir / "file.rst", target_dir)
+    (target_dir / "solve.out").write_bytes(b"y" * 20)
+
+    paths = download_solver_files(
+        client, str(solve_dir), str(target_dir), types=["results", "logs"], skip_identical=True
+    )
+
+    assert paths == [str(target_dir / "file.rst"), str(target_dir / "solve.out")]
+    assert client.downloaded == ["solve.out"]
+    assert (target_dir / "solve.out").read_bytes() == (solve_dir / "solve.out").read_bytes()
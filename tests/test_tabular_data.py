@@ -0,0 +1,113 @@
+"""Tests of the bulk export of ``TabularData`` tables of ``tools.tabular_data``."""
+
+import types
+
+import numpy as np
+import pytest
+
+from tools.tabular_data import get_tabular_data, to_dataframe
+
+
+class Quantity:
+    """Mechanical quantity with a value and a unit."""
+
+    def __init__(self, value, unit):
+        self.Value = value
+        self.Unit = unit
+
+
+class FakeMechanicalClient:
+    """Mechanical client returning the value of the last line of the scripts."""
+
+    def __init__(self, **objects):
+        self.objects = objects
+        self.calls = 0
+
+    def run_python_script(self, script):
+        self.calls += 1
+        body, _, last_line = script.rpartition("\n")
+        namespace = dict(self.objects)
+        exec(body, namespace)
+        return eval(last_line, namespace)
+
+
+def solution(values, names=None):
+    """Return a solution object whose ``TabularData`` has the given columns."""
+    table = types.SimpleNamespace(Values=values)
+    if names is not None:
+        table.Names = names
+    return types.SimpleNamespace(TabularData=table)
+
+
+def test_get_tabular_data_reads_all_tables_in_one_call():
+    mechanical = FakeMechanicalClient(
+        MODAL=solution(
+            [[1, 2, 3], [Quantity(10.0, "Hz"), Quantity(20.0, "Hz"), Quantity(30.0, "Hz")]],
+            ["Mode", "Frequency"],
+        ),
+        CAMPBELL=solution([["A", "B"], [0.5, 1.5]]),
+    )
+
+    tables = get_tabular_data(mechanical, {"modal": "MODAL", "campbell": "CAMPBELL"})
+
+    assert mechanical.calls == 1
+    modal = tables["modal"]
+    assert modal["values"].dtype.names == ("Mode", "Frequency")
+    np.testing.assert_array_equal(modal["values"]["Frequency"], [10.0, 20.0, 30.0])
+    assert modal["units"] == {"Mode": "", "Frequency": "Hz"}
+    campbell = tables["campbell"]
+    assert campbell["values"].dtype.names == ("0", "1")
+    assert list(campbell["values"]["0"]) == ["A", "B"]
+
+
+def test_get_tabular_data_pads_short_columns():
+    mechanical = FakeMechanicalClient(
+        SOLN=solution([[1.0, 2.0, 3.0], [4.0], ["a", "b"]], ["X", "Y", "Label"])
+    )
+
+    values = get_tabular_data(mechanical, {"soln": "SOLN"})["soln"]["values"]
+
+    assert len(values) == 3
+    np.testing.assert_array_equal(values["Y"], [4.0, np.nan, np.nan])
+    assert list(values["Label"]) == ["a", "b", ""]
+
+
+def test_get_tabular_data_renames_repeated_columns():
+    mechanical = FakeMechanicalClient(
+        SOLN=solution([[1.0], [2.0], [3.0], [4.0]], ["Mode", "Frequency", "Mode", "Mode"])
+    )
+
+    table = get_tabular_data(mechanical, {"soln": "SOLN"})["soln"]
+
+    assert table["values"].dtype.names == ("Mode", "Frequency", "Mode.1", "Mode.2")
+    assert table["values"]["Mode.2"][0] == 4.0
+
+
+def test_get_tabular_data_returns_columns_mixing_units_as_text():
+    mechanical = FakeMechanicalClient(
+        SOLN=solution([[Quantity(1.0, "Hz"), Quantity(2.0, "rad/s")]], ["Frequency"])
+    )
+
+    table = get_tabular_data(mechanical, {"soln": "SOLN"})["soln"]
+
+    assert table["values"]["Frequency"].dtype.kind == "U"
+    assert table["units"] == {"Frequency": ""}
+
+
+def test_get_tabular_data_rejects_objects_without_table():
+    mechanical = FakeMechanicalClient(SOLN=types.SimpleNamespace(TabularData=None))
+
+    with pytest.raises(ValueError, match="SOLN has no tabular data"):
+        get_tabular_data(mechanical, {"soln": "SOLN"})
+
+
+def test_to_dataframe_keeps_units():
+    pytest.importorskip("pandas")
+    mechanical = FakeMechanicalClient(
+        SOLN=solution([[1, 2], [Quantity(10.0, "Hz"), Quantity(20.0, "Hz")]], ["Mode", "Frequency"])
+    )
+
+    dataframe = to_dataframe(get_tabular_data(mechanical, {"soln": "SOLN"})["soln"])
+
+    assert list(dataframe.columns) == ["Mode", "Frequency"]
+    assert dataframe.attrs["units"] == {"Mode": "", "Frequency": "Hz"}
@@ -0,0 +1,93 @@
+"""Tests of the typed binary channel of ``tools.typed_results``."""
+
+import json
+
+import numpy as np
+import pytest
+
+from tools.typed_results import ENCODER_SCRIPT, decode_results, run_typed
+
+
+class Quantity:
+    """Mechanical quantity with a value and a unit."""
+
+    def __init__(self, value, unit):
+        self.Value = value
+        self.Unit = unit
+
+
+class FakeMechanicalClient:
+    """Mechanical client returning the value of the last line of the scripts."""
+
+    def run_python_script(self, script):
+        body, _, last_line = script.rpartition("\n")
+        namespace = {"Quantity": Quantity}
+        exec(body, namespace)
+        return eval(last_line, namespace)
+
+
+@pytest.fixture(scope="module")
+def encode_results():
+    namespace = {}
+    exec(ENCODER_SCRIPT, namespace)
+    return namespace["encode_results"]
+
+
+def test_round_trip_of_scalars_and_sequences(encode_results):
+    payload = encode_results(
+        {
+            "maximum": Quantity(0.5, "mm"),
+            "count": 3,
+            "frequencies": [Quantity(10.0, "Hz"), Quantity(20.0, "Hz")],
+            "matrix": ((1, 2, 3), (4, 5, 6)),
+        }
+    )
+
+    results = decode_results(payload)
+
+    assert results["maximum"] == {"value": 0.5, "unit": "mm"}
+    assert results["count"] == {"value": 3.0, "unit": ""}
+    assert results["frequencies"]["unit"] == "Hz"
+    np.testing.assert_array_equal(results["frequencies"]["value"], [10.0, 20.0])
+    assert results["matrix"]["value"].shape == (2, 3)
+    np.testing.assert_array_equal(results["matrix"]["value"][1], [4.0, 5.0, 6.0])
+    assert not results["matrix"]["value"].flags.writeable
+
+
+def test_decode_results_of_decoded_json(encode_results):
+    payload = json.loads(encode_results({"empty": [], "nested": [[], []]}))
+
+    results = decode_results(payload)
+
+    assert results["empty"]["value"].shape == (0,)
+    assert results["nested"]["value"].shape == (2, 0)
+
+
+@pytest.mark.parametrize(
+    "value, message",
+    [
+        ([[1, 2], [3]], "ragged sequence at level 1"),
+        ([[1, 2], 3], "number at level 1"),
+        ([1, [2, 3]], "ragged sequence at level 1"),
+        ([[[1], [2]], [[3, 4], [5, 6]]], "ragged sequence at level 2"),
+    ],
+)
+def test_encode_results_rejects_ragged_sequences(encode_results, value, message):
+    with pytest.raises(ValueError, match=message):
+        encode_results({"ragged": value})
+
+
+def test_encode_results_rejects_mixed_units(encode_results):
+    with pytest.raises(ValueError, match="several units"):
+        encode_results({"mixed": [Quantity(1.0, "mm"), Quantity(1.0, "m")]})
+
+
+def test_run_typed_evaluates_expressions_after_the_script():
+    script = "DEFORMATION = Quantity(0.25, 'mm')\nSTRESSES = [1.0, 2.0]"
+
+    results = run_typed(
+        FakeMechanicalClient(), script, {"deformation": "DEFORMATION", "stresses": "STRESSES"}
+    )
+
+    assert results["deformation"] == {"value": 0.25, "unit": "mm"}
+    np.testing.assert_array_equal(results["stresses"]["value"], [1.0, 2.0])
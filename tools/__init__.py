@@ -0,0 +1 @@
+"""Development tools for running, measuring and orchestrating the PyWorkbench examples."""
@@ -0,0 +1,564 @@
+"""Per-phase benchmarks of the example workflows.
+
+Each ``examples/*/main.py`` file is run with its Workbench and Mechanical
+clients wrapped, so the wall time, the client CPU time and the bytes moved by
+every call are attributed to one of the phases of a workflow:
+
+- ``launch``: launch of, or connection to, the Workbench and Mechanical servers.
+- ``upload``: uploads to the servers.
+- ``project_script``: Workbench scripts, such as ``project.wbjn``.
+- ``solver_start``: start of the Mechanical and Fluent servers from Workbench.
+- ``meshing``: Mechanical scripts generating the mesh.
+- ``solve``: Mechanical scripts solving the analyses.
+- ``result_query``: other Mechanical scripts, which query results and settings.
+- ``download``: downloads from the servers.
+- ``exit``: shutdown of the servers.
+- ``client``: time spent in the example itself, between the calls.
+
+Mechanical scripts are split after their top-level statements calling
+``GenerateMesh()`` or ``Solve()``, so the setup, meshing and solve parts of a
+single script are timed separately. The split runs the same statements, in the
+same order and in the same Mechanical session, so the result of the script is
+unchanged. Use ``--no-split`` to time each script as a whole. Scripts are
+never split in replay mode, since cassettes record them whole.
+
+Every run is appended to a JSON Lines history file and compared against a
+baseline built from that history:
+
+.. code:: console
+
+    python -m tools.benchmark run examples/cyclic-symmetry-analysis
+    python -m tools.benchmark baseline
+    python -m tools.benchmark run --threshold 0.1 --min-delta 5
+
+"""
+
+import argparse
+import ast
+import contextlib
+import datetime
+import json
+import os
+import pathlib
+import re
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+from typing import Any, Dict, Iterator, List, Tuple
+
+from tools.offline_workbench import (
+    NetworkModel,
+    expand_patterns,
+    install,
+    load_default_responses,
+    working_directory,
+    wrap_clients,
+)
+
+PHASES = (
+    "launch",
+    "upload",
+    "project_script",
+    "solver_start",
+    "meshing",
+    "solve",
+    "result_query",
+    "download",
+    "exit",
+    "client",
+)
+METRICS = ("wall", "cpu", "bytes")
+
+MESHING_PATTERN = re.compile(r"\.GenerateMesh\s*\(")
+SOLVE_PATTERN = re.compile(r"\.Solve\s*\(")
+
+REPOSITORY_DIR = pathlib.Path(__file__).absolute().parents[1]
+EXAMPLES_DIR = REPOSITORY_DIR / "examples"
+BENCHMARKS_DIR = REPOSITORY_DIR / ".benchmarks"
+
+
+class PhaseTimer:
+    """Accumulator of the wall time, CPU time and bytes moved per phase."""
+
+    def __init__(self):
+        self.phases = {phase: {"calls": 0, "wall": 0.0, "cpu": 0.0, "bytes": 0} for phase in PHASES}
+
+    @contextlib.contextmanager
+    def measure(self, phase) -> Iterator[None]:
+        """Attribute the time spent in the context to a phase."""
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - wall, time.process_time() - cpu)
+
+    def add(self, phase, wall=0.0, cpu=0.0, size=0, calls=1):
+        """Attribute measured time and bytes to a phase."""
+        entry = self.phases[phase]
+        entry["calls"] += calls
+        entry["wall"] += wall
+        entry["cpu"] += cpu
+        entry["bytes"] += size
+
+    def add_files(self, phase, paths):
+        """Attribute the size of transferred files to a phase."""
+        size = sum(os.path.getsize(path) for path in paths if os.path.isfile(path))
+        self.add(phase, size=size, calls=0)
+
+    def totals(self) -> Dict[str, float]:
+        """Return the totals over all the phases."""
+        return {metric: sum(entry[metric] for entry in self.phases.values()) for metric in METRICS}
+
+
+def classify_mechanical_script(script: str) -> str:
+    """Return the phase of a Mechanical script from the operations it runs."""
+    if SOLVE_PATTERN.search(script):
+        return "solve"
+    if MESHING_PATTERN.search(script):
+        return "meshing"
+    return "result_query"
+
+
+def split_mechanical_script(script: str) -> List[Tuple[str, str]]:
+    """Split a Mechanical script after its top-level meshing and solve statements.
+
+    Parameters
+    ----------
+    script : str
+        Text of the script.
+
+    Returns
+    -------
+    list[tuple[str, str]]
+        Phases and texts of the consecutive parts of the script. Scripts that
+        cannot be parsed, or that do not mesh nor solve, are returned whole.
+    """
+    try:
+        statements = ast.parse(script).body
+    except SyntaxError:
+        return [(classify_mechanical_script(script), script)]
+    lines = script.splitlines(keepends=True)
+    parts, start = [], 0
+    for statement in statements:
+        text = "".join(lines[statement.lineno - 1 : statement.end_lineno])
+        if MESHING_PATTERN.search(text) or SOLVE_PATTERN.search(text):
+            parts.append("".join(lines[start : statement.end_lineno]))
+            start = statement.end_lineno
+    tail = "".join(lines[start:])
+    if tail.strip() or not parts:
+        parts.append(tail)
+    return [(classify_mechanical_script(part), part) for part in parts]
+
+
+class _TimedClient:
+    """Base of the client wrappers timing the calls to a server."""
+
+    def __init__(self, client, timer):
+        self._client = client
+        self._timer = timer
+
+    def __getattr__(self, name):
+        """Forward the calls that are not timed to the wrapped client."""
+        return getattr(self._client, name)
+
+    def _call(self, phase, method, *args, **kwargs):
+        """Call the wrapped client and attribute the time taken to a phase."""
+        with self._timer.measure(phase):
+            return getattr(self._client, method)(*args, **kwargs)
+
+
+class TimedWorkbenchClient(_TimedClient):
+    """Wrapper of a PyWorkbench client attributing its calls to phases."""
+
+    def run_script_string(self, script_string, args=None, log_level="error"):
+        """Run a script as part of the project script phase."""
+        return self._call("project_script", "run_script_string", script_string, args, log_level)
+
+    def run_script_file(self, script_file_name, args=None, log_level="error"):
+        """Run a script file as part of the project script phase."""
+        return self._call("project_script", "run_script_file", script_file_name, args, log_level)
+
+    def upload_file(self, *file_list, show_progress=True):
+        """Upload files and measure their size."""
+        result = self._call("upload", "upload_file", *file_list, show_progress=show_progress)
+        self._timer.add_files("upload", expand_patterns(file_list, self._client.workdir))
+        return result
+
+    def upload_file_from_example_repo(self, relative_file_path, show_progress=True):
+        """Download a file of the example repository, upload it and measure its size."""
+        result = self._call(
+            "upload",
+            "upload_file_from_example_repo",
+            relative_file_path,
+            show_progress=show_progress,
+        )
+        local_file = os.path.join(self._client.workdir, os.path.basename(relative_file_path))
+        self._timer.add_files("upload", [local_file])
+        return result
+
+    def download_file(self, file_name, show_progress=True, target_dir=None):
+        """Download files and measure their size."""
+        result = self._call(
+            "download",
+            "download_file",
+            file_name,
+            show_progress=show_progress,
+            target_dir=target_dir,
+        )
+        if result:
+            local_file = os.path.join(target_dir or self._client.workdir, result)
+            self._timer.add_files("download", [local_file])
+        return result
+
+    def download_project_archive(self, *args, **kwargs):
+        """Archive and download the project."""
+        return self._call("download", "download_project_archive", *args, **kwargs)
+
+    def start_mechanical_server(self, system_name, port=0):
+        """Start a Mechanical server as part of the solver start phase."""
+        return self._call("solver_start", "start_mechanical_server", system_name, port)
+
+    def start_fluent_server(self, system_name):
+        """Start a Fluent server as part of the solver start phase."""
+        return self._call("solver_start", "start_fluent_server", system_name)
+
+    def exit(self):
+        """Shut down the server as part of the exit phase."""
+        return self._call("exit", "exit")
+
+
+class TimedMechanicalClient(_TimedClient):
+    """Wrapper of a PyMechanical client attributing its calls to phases.
+
+    Parameters
+    ----------
+    client : ansys.mechanical.core.Mechanical
+        The wrapped client.
+    timer : PhaseTimer
+        Accumulator of the measurements.
+    split : bool, default: True
+        Whether to split the scripts after their meshing and solve statements.
+    """
+
+    def __init__(self, client, timer, split=True):
+        super().__init__(client, timer)
+        self._split = split
+
+    @property
+    def project_directory(self):
+        """Get the project directory as part of the result query phase."""
+        return self.run_python_script("ExtAPI.DataModel.Project.ProjectDirectory")
+
+    def run_python_script(self, script_block, *args, **kwargs):
+        """Run a script, timing its meshing, solve and query parts separately."""
+        if self._split:
+            parts = split_mechanical_script(script_block)
+        else:
+            parts = [(classify_mechanical_script(script_block), script_block)]
+        for phase, part in parts:
+            result = self._call(phase, "run_python_script", part, *args, **kwargs)
+        return result
+
+    def upload(self, file_name, *args, **kwargs):
+        """Upload a file and measure its size."""
+        result = self._call("upload", "upload", file_name, *args, **kwargs)
+        self._timer.add_files("upload", [file_name])
+        return result
+
+    def download(self, files, target_dir=None, *args, **kwargs):
+        """Download files and measure their size."""
+        result = self._call("download", "download", files, target_dir, *args, **kwargs)
+        self._timer.add_files("download", result or [])
+        return result
+
+    def exit(self, force=False):
+        """Shut down the server as part of the exit phase."""
+        return self._call("exit", "exit", force)
+
+
+@contextlib.contextmanager
+def measure(split=True) -> Iterator[PhaseTimer]:
+    """Attribute the calls of the sessions opened in the context to phases.
+
+    Parameters
+    ----------
+    split : bool, default: True
+        Whether to split the Mechanical scripts after their meshing and solve
+        statements.
+
+    Yields
+    ------
+    PhaseTimer
+        The measurements, completed when the context exits. The time not spent
+        in any call is attributed to the ``client`` phase.
+    """
+    timer = PhaseTimer()
+
+    def wrap_workbench(client, elapsed):
+        timer.add("launch", elapsed)
+        return TimedWorkbenchClient(client, timer)
+
+    def wrap_mechanical(client, elapsed):
+        timer.add("launch", elapsed)
+        return TimedMechanicalClient(client, timer, split)
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        with wrap_clients(wrap_workbench, wrap_mechanical):
+            yield timer
+    finally:
+        totals = timer.totals()
+        timer.add(
+            "client",
+            time.perf_counter() - wall - totals["wall"],
+            time.process_time() - cpu - totals["cpu"],
+            calls=0,
+        )
+
+
+def git_commit() -> str:
+    """Return the commit of the repository, or ``None`` outside of a Git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPOSITORY_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(example_dir, mode="live", split=True, **options) -> Dict[str, Any]:
+    """Run an example and measure its phases.
+
+    Parameters
+    ----------
+    example_dir : str
+        Path to the example directory.
+    mode : str, default: "live"
+        ``"live"`` to run against real servers, ``"offline"`` to run against the
+        servers of :mod:`tools.offline_workbench`, or ``"replay"`` to replay the
+        cassette given in the ``cassette`` option.
+    split : bool, default: True
+        Whether to split the Mechanical scripts after their meshing and solve
+        statements. Scripts are never split in replay mode, since the cassette
+        recorded them whole and serves them by the key of their full text.
+    **options
+        Options forwarded to :func:`tools.offline_workbench.install` in offline
+        mode, completed with the default responses of the example, or
+        ``cassette`` and ``network`` in replay mode.
+
+    Returns
+    -------
+    dict
+        Record of the run, with the measurements of every phase.
+    """
+    example_dir = pathlib.Path(example_dir).absolute()
+    if mode == "offline":
+        for name, value in load_default_responses(example_dir).items():
+            if options.get(name) is None:
+                options[name] = value
+        servers = install(**options)
+    elif mode == "replay":
+        from tools.cassette import replay
+
+        servers = replay(options.pop("cassette"), realtime=True, **options)
+        split = False
+    else:
+        servers = contextlib.nullcontext()
+
+    error = None
+    with servers, working_directory(example_dir), measure(split) as timer:
+        try:
+            runpy.run_path(str(example_dir / "main.py"), run_name="__main__")
+        except Exception:
+            error = traceback.format_exc()
+    return {
+        "example": example_dir.name,
+        "mode": mode,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "status": "failed" if error else "passed",
+        "error": error,
+        "total": timer.totals(),
+        "phases": timer.phases,
+    }
+
+
+def read_history(path) -> List[Dict[str, Any]]:
+    """Read the records of a history file, oldest first."""
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def append_history(path, record):
+    """Append a record to a history file."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(json.dumps(record) + "\n")
+
+
+def build_baseline(history, runs=5) -> Dict[str, Any]:
+    """Build a baseline from the median of the latest passing runs of each example.
+
+    Parameters
+    ----------
+    history : list[dict]
+        Records of a history file, oldest first.
+    runs : int, default: 5
+        Number of latest runs of each example and mode to consider.
+
+    Returns
+    -------
+    dict
+        Baseline measurements of each phase, keyed by mode and example.
+    """
+    grouped = {}
+    for record in history:
+        if record["status"] == "passed":
+            grouped.setdefault((record["mode"], record["example"]), []).append(record)
+    baseline = {}
+    for (mode, example), records in grouped.items():
+        records = records[-runs:]
+        baseline.setdefault(mode, {})[example] = {
+            phase: {
+                metric: statistics.median(record["phases"][phase][metric] for record in records)
+                for metric in METRICS
+            }
+            for phase in PHASES
+        }
+    return baseline
+
+
+def compare(record, baseline, threshold=0.2, min_delta=1.0) -> List[Dict[str, Any]]:
+    """Return the phases of a run regressing against a baseline.
+
+    Parameters
+    ----------
+    record : dict
+        Record of the run.
+    baseline : dict
+        Baseline built by :func:`build_baseline`.
+    threshold : float, default: 0.2
+        Relative increase, over the baseline, considered as a regression.
+    min_delta : float, default: 1.0
+        Minimum absolute increase, in seconds, of a time considered as a
+        regression. It avoids flagging noise on short phases.
+
+    Returns
+    -------
+    list[dict]
+        Phase, metric, baseline and measured values of each regression.
+    """
+    reference = baseline.get(record["mode"], {}).get(record["example"])
+    if reference is None:
+        return []
+    regressions = []
+    for phase in PHASES:
+        for metric in METRICS:
+            expected = reference[phase][metric]
+            measured = record["phases"][phase][metric]
+            if measured <= expected * (1 + threshold):
+                continue
+            if metric != "bytes" and measured - expected < min_delta:
+                continue
+            regressions.append(
+                {"phase": phase, "metric": metric, "baseline": expected, "measured": measured}
+            )
+    return regressions
+
+
+def format_record(record) -> str:
+    """Return a table of the measurements of a run."""
+    lines = [f"{record['example']} ({record['mode']}, {record['status']})"]
+    for phase, entry in record["phases"].items():
+        if entry["calls"] or entry["wall"] >= 0.0005:
+            lines.append(
+                f"  {phase:<16} {entry['calls']:>5} calls {entry['wall']:>10.3f} s wall "
+                f"{entry['cpu']:>10.3f} s cpu {entry['bytes']:>14} bytes"
+            )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run the benchmarks or build their baseline from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--history",
+        default=str(BENCHMARKS_DIR / "history.jsonl"),
+        help="JSON Lines file collecting the benchmark runs.",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=str(BENCHMARKS_DIR / "baseline.json"),
+        help="JSON file with the baseline measurements.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run and measure examples.")
+    run_parser.add_argument(
+        "examples", nargs="*", help="Example directories. All the examples by default."
+    )
+    run_parser.add_argument(
+        "--mode", choices=("live", "offline", "replay"), default="live", help="Servers to use."
+    )
+    run_parser.add_argument(
+        "--cassettes", help="Directory of the <example>.cassette files used in replay mode."
+    )
+    run_parser.add_argument("--latency", type=float, default=0.0, help="Offline round trip.")
+    run_parser.add_argument("--bandwidth", type=float, help="Offline transfer rate.")
+    run_parser.add_argument("--no-split", action="store_true", help="Time scripts as a whole.")
+    run_parser.add_argument("--threshold", type=float, default=0.2, help="Relative regression.")
+    run_parser.add_argument("--min-delta", type=float, default=1.0, help="Seconds of regression.")
+
+    baseline_parser = commands.add_parser("baseline", help="Build the baseline from the history.")
+    baseline_parser.add_argument("--runs", type=int, default=5, help="Latest runs to consider.")
+    args = parser.parse_args(argv)
+
+    if args.command == "baseline":
+        baseline = build_baseline(read_history(args.history), args.runs)
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2)
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+    example_dirs = args.examples or sorted(
+        str(path.parent) for path in EXAMPLES_DIR.glob("*/main.py")
+    )
+    failed = False
+    for example_dir in example_dirs:
+        options = {}
+        if args.mode == "offline":
+            options["network"] = NetworkModel(args.latency, args.bandwidth)
+        elif args.mode == "replay":
+            name = pathlib.Path(example_dir).absolute().name
+            options["cassette"] = os.path.join(args.cassettes, f"{name}.cassette")
+        record = run_benchmark(example_dir, args.mode, not args.no_split, **options)
+        append_history(args.history, record)
+        print(format_record(record))
+        if record["error"]:
+            print(record["error"])
+        regressions = compare(record, baseline, args.threshold, args.min_delta)
+        for regression in regressions:
+            print(
+                f"  REGRESSION {regression['phase']} {regression['metric']}: "
+                f"{regression['baseline']:.3f} -> {regression['measured']:.3f}"
+            )
+        failed = failed or record["status"] == "failed" or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
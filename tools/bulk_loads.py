@@ -0,0 +1,126 @@
+"""Table-driven creation of repeated Mechanical loads.
+
+Scripts that apply the same boundary condition to many named selections, such
+as the convection, mass flow rates and temperatures of the cooling passages of
+a turbine blade, create each load with its own ``Add`` call and property
+assignments, and Mechanical refreshes its tree and graphics after each of them.
+:func:`add_loads` takes a table of rows instead, one per load, resolves all the
+named selections at once through :mod:`tools.tree_index`, and creates all the
+loads in a single server call and a single transaction, so the tree and
+graphics are refreshed once at the end:
+
+.. code:: python
+
+    from tools.bulk_loads import add_loads
+
+    rows = [
+        (
+            "Convection",
+            f"Hole {number}",
+            [
+                ("FilmCoefficient", [f"{coefficient} [W m^-1 m^-1 K^-1]"]),
+                ("HasFluidFlow", True),
+                ("FluidFlowSelection", f"Passage {number}"),
+            ],
+        )
+        for number, coefficient in enumerate(coefficients, start=1)
+    ]
+    ids = add_loads(mechanical, 'ExtAPI.DataModel.AnalysisByName("Steady-State Thermal")', rows)
+
+Other Mechanical scripts can call the same ``add_loads`` function once
+:data:`TREE_INDEX_SCRIPT` and :data:`ADD_LOADS_FUNCTION` are prepended to their
+text.
+"""
+
+import json
+from typing import Any, Iterable, List, Sequence, Tuple
+
+from tools.tree_index import TREE_INDEX_SCRIPT
+
+ADD_LOADS_FUNCTION = '''def add_loads(analysis, rows, index):
+    """Create the loads of a table of rows in a single transaction.
+
+    The loads already created are deleted if a load cannot be created.
+    """
+    names = []
+    for load_type, location, properties in rows:
+        names.append(location)
+        names.extend(value for name, value in properties if name.endswith("Selection"))
+    selections = dict(zip(names, index.resolve(names)))
+    loads = []
+    try:
+        with Transaction():
+            for load_type, location, properties in rows:
+                load = getattr(analysis, "Add" + load_type)()
+                loads.append(load)
+                load.Location = selections[location]
+                for name, value in properties:
+                    if name.endswith("Selection"):
+                        setattr(load, name, selections[value])
+                    elif isinstance(value, list):
+                        quantities = [Quantity(item) for item in value]
+                        getattr(load, name).Output.DiscreteValues = quantities
+                    else:
+                        setattr(load, name, value)
+    except:
+        for load in loads:
+            load.Delete()
+        raise
+    return loads
+'''
+
+ADD_LOADS_SCRIPT = """import json
+request = json.loads(request)
+tree_indexes = globals().setdefault("tree_indexes", {})
+if NAMED_SELECTION_TYPE not in tree_indexes:
+    tree_indexes[NAMED_SELECTION_TYPE] = TreeIndex(eval(NAMED_SELECTION_TYPE))
+loads_result = [
+    load.ObjectId
+    for load in add_loads(
+        eval(request["analysis"]), request["rows"], tree_indexes[NAMED_SELECTION_TYPE]
+    )
+]
+"""
+
+NAMED_SELECTION_TYPE = "Ansys.ACT.Automation.Mechanical.NamedSelection"
+
+Row = Tuple[str, str, Sequence[Tuple[str, Any]]]
+
+
+def add_loads(mechanical, analysis: str, rows: Iterable[Row]) -> List[int]:
+    """Create the loads of a table of rows in a single server call.
+
+    Parameters
+    ----------
+    mechanical : ansys.mechanical.core.Mechanical
+        Client connected to the Mechanical server.
+    analysis : str
+        Python expression of the analysis the loads are added to, such as
+        ``"Model.Analyses[0]"``.
+    rows : list[tuple]
+        One row per load: its type, such as ``"Convection"`` for
+        ``AddConvection``, the name of the named selection it is applied to,
+        and a list of ``(property, value)`` pairs set in order. Values of
+        tabular properties, such as ``Magnitude``, are lists of quantities
+        like ``"0 [K]"``, and values of the properties ending in ``Selection``
+        are names of named selections.
+
+    Returns
+    -------
+    list[int]
+        ``ObjectId`` of the loads, in the order of ``rows``.
+
+    Raises
+    ------
+    Exception
+        The ``KeyError`` of the server, with the missing names, if a named
+        selection is not found, or the error of the property assignment or
+        ``Add`` call that failed. In both cases, the loads already created are
+        deleted, so no load is left in the tree.
+    """
+    request = json.dumps({"analysis": analysis, "rows": [list(row) for row in rows]})
+    script = (
+        f"{TREE_INDEX_SCRIPT}NAMED_SELECTION_TYPE = {NAMED_SELECTION_TYPE!r}\n"
+        f"request = {request!r}\n{ADD_LOADS_FUNCTION}{ADD_LOADS_SCRIPT}json.dumps(loads_result)"
+    )
+    return json.loads(mechanical.run_python_script(script))
@@ -0,0 +1,484 @@
+"""Record and replay the traffic of Workbench and Mechanical sessions.
+
+While recording, the clients returned by ``launch_workbench``,
+``connect_workbench``, ``connect_to_mechanical`` and ``launch_mechanical`` are
+wrapped to capture every script, upload and download together with payload
+hashes and timings. The interactions are written to a compact cassette: a ZIP
+file holding the interactions and, deduplicated by hash, the content of the
+downloaded files.
+
+While replaying, the offline servers of :mod:`tools.offline_workbench` serve
+the recorded results, optionally with the recorded timings, so the client-side
+loops of an example can be profiled from a real captured session.
+
+.. code:: console
+
+    python -m tools.cassette record examples/axisymmetric-rotor rotor.cassette
+    python -m tools.cassette replay examples/axisymmetric-rotor rotor.cassette --realtime
+    python -m tools.cassette summary rotor.cassette
+
+"""
+
+import argparse
+import collections
+import contextlib
+import hashlib
+import json
+import os
+import pathlib
+import runpy
+import time
+from typing import Any, Dict, Iterator, List
+import zipfile
+
+from tools.offline_workbench import (
+    OfflineMechanicalClient,
+    OfflineWorkbenchClient,
+    expand_patterns,
+    install,
+    substitute_script_args,
+    working_directory,
+    wrap_clients,
+)
+
+WORKBENCH = "workbench"
+MECHANICAL = "mechanical"
+
+
+def payload_key(*parts) -> str:
+    """Return the key identifying the payload of a call."""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def file_record(path) -> Dict[str, Any]:
+    """Return the name, size and SHA-256 hash of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return {
+        "name": os.path.basename(path),
+        "size": os.path.getsize(path),
+        "sha256": digest.hexdigest(),
+    }
+
+
+class Cassette:
+    """Interactions captured from Workbench and Mechanical sessions.
+
+    Each interaction records the target server, the client method, the key of
+    the payload, the result, the elapsed time and the transferred files.
+    """
+
+    def __init__(self):
+        self.interactions: List[Dict[str, Any]] = []
+        self.blobs: Dict[str, bytes] = {}
+        self._pending = None
+
+    def record(self, target, method, key, result, elapsed, files=(), store_files=False):
+        """Add an interaction.
+
+        Parameters
+        ----------
+        target : str
+            Server the call was sent to, ``"workbench"`` or ``"mechanical"``.
+        method : str
+            Name of the client method.
+        key : str
+            Key of the payload of the call.
+        result : Any
+            JSON-serializable result of the call.
+        elapsed : float
+            Duration, in seconds, of the call.
+        files : list[str], default: ()
+            Local paths of the files transferred by the call.
+        store_files : bool, default: False
+            Whether to store the content of the files, which is needed to replay
+            downloads.
+        """
+        records = []
+        for path in files:
+            record = file_record(path)
+            if store_files and record["sha256"] not in self.blobs:
+                self.blobs[record["sha256"]] = pathlib.Path(path).read_bytes()
+            records.append(record)
+        self.interactions.append(
+            {
+                "target": target,
+                "method": method,
+                "key": key,
+                "result": result,
+                "elapsed": elapsed,
+                "files": records,
+            }
+        )
+
+    def next(self, target, method, key) -> Dict[str, Any]:
+        """Return the next recorded interaction matching a call.
+
+        Identical calls are served in the order they were recorded.
+
+        Raises
+        ------
+        KeyError
+            If no interaction is left for the call.
+        """
+        if self._pending is None:
+            self._pending = collections.defaultdict(collections.deque)
+            for interaction in self.interactions:
+                index = (interaction["target"], interaction["method"], interaction["key"])
+                self._pending[index].append(interaction)
+        try:
+            return self._pending[(target, method, key)].popleft()
+        except IndexError:
+            raise KeyError(f"No recorded {target} {method} interaction for key {key}.") from None
+
+    def save(self, path):
+        """Write the cassette to a ZIP file."""
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("interactions.json", json.dumps(self.interactions))
+            for sha256, content in self.blobs.items():
+                archive.writestr(f"blobs/{sha256}", content)
+
+    @classmethod
+    def load(cls, path) -> "Cassette":
+        """Read a cassette from a ZIP file."""
+        cassette = cls()
+        with zipfile.ZipFile(path) as archive:
+            cassette.interactions = json.loads(archive.read("interactions.json"))
+            for name in archive.namelist():
+                if name.startswith("blobs/"):
+                    cassette.blobs[name[len("blobs/") :]] = archive.read(name)
+        return cassette
+
+    def write_file(self, record, target_dir) -> str:
+        """Write a recorded file to a directory and return its path."""
+        path = os.path.join(target_dir, record["name"])
+        os.makedirs(target_dir, exist_ok=True)
+        pathlib.Path(path).write_bytes(self.blobs[record["sha256"]])
+        return path
+
+
+class _RecordingClient:
+    """Base of the client wrappers recording the calls to a server."""
+
+    _target = None
+
+    def __init__(self, client, cassette):
+        self._client = client
+        self._cassette = cassette
+
+    def __getattr__(self, name):
+        """Forward the calls that are not recorded to the wrapped client."""
+        return getattr(self._client, name)
+
+    def _call(self, method, *args, **kwargs):
+        """Call the wrapped client and return its result and elapsed time."""
+        start = time.perf_counter()
+        result = getattr(self._client, method)(*args, **kwargs)
+        return result, time.perf_counter() - start
+
+
+class RecordingWorkbenchClient(_RecordingClient):
+    """Wrapper of a PyWorkbench client recording its calls in a cassette."""
+
+    _target = WORKBENCH
+
+    def run_script_string(self, script_string, args=None, log_level="error"):
+        """Run a script and record its result."""
+        key = payload_key(substitute_script_args(script_string, args))
+        result, elapsed = self._call("run_script_string", script_string, args, log_level)
+        self._cassette.record(WORKBENCH, "run_script", key, result, elapsed)
+        return result
+
+    def run_script_file(self, script_file_name, args=None, log_level="error"):
+        """Run a script file and record its result."""
+        script_path = os.path.join(self._client.workdir, script_file_name)
+        with open(script_path, encoding="utf-8-sig") as sf:
+            key = payload_key(substitute_script_args(sf.read(), args))
+        result, elapsed = self._call("run_script_file", script_file_name, args, log_level)
+        self._cassette.record(WORKBENCH, "run_script", key, result, elapsed)
+        return result
+
+    def upload_file(self, *file_list, show_progress=True):
+        """Upload files and record their hashes."""
+        result, elapsed = self._call("upload_file", *file_list, show_progress=show_progress)
+        files = expand_patterns(file_list, self._client.workdir)
+        self._cassette.record(
+            WORKBENCH,
+            "upload_file",
+            payload_key(file_list),
+            None,
+            elapsed,
+            [path for path in files if os.path.isfile(path)],
+        )
+        return result
+
+    def upload_file_from_example_repo(self, relative_file_path, show_progress=True):
+        """Upload a file of the example repository and record its hash."""
+        result, elapsed = self._call(
+            "upload_file_from_example_repo", relative_file_path, show_progress=show_progress
+        )
+        local_file = os.path.join(self._client.workdir, os.path.basename(relative_file_path))
+        self._cassette.record(
+            WORKBENCH,
+            "upload_file_from_example_repo",
+            payload_key(relative_file_path),
+            None,
+            elapsed,
+            [local_file] if os.path.isfile(local_file) else [],
+        )
+        return result
+
+    def download_file(self, file_name, show_progress=True, target_dir=None):
+        """Download files and record their content."""
+        result, elapsed = self._call(
+            "download_file", file_name, show_progress=show_progress, target_dir=target_dir
+        )
+        local_file = os.path.join(target_dir or self._client.workdir, result or "")
+        self._cassette.record(
+            WORKBENCH,
+            "download_file",
+            payload_key(file_name),
+            result,
+            elapsed,
+            [local_file] if result else [],
+            store_files=True,
+        )
+        return result
+
+    def start_mechanical_server(self, system_name, port=0):
+        """Start a Mechanical server and record the time taken."""
+        result, elapsed = self._call("start_mechanical_server", system_name, port)
+        self._cassette.record(
+            WORKBENCH, "start_mechanical_server", payload_key(system_name), result, elapsed
+        )
+        return result
+
+    def exit(self):
+        """Shut down the server and record the time taken."""
+        result, elapsed = self._call("exit")
+        self._cassette.record(WORKBENCH, "exit", payload_key(), None, elapsed)
+        return result
+
+
+class RecordingMechanicalClient(_RecordingClient):
+    """Wrapper of a PyMechanical client recording its calls in a cassette."""
+
+    _target = MECHANICAL
+
+    @property
+    def project_directory(self):
+        """Get the project directory and record the query."""
+        return self.run_python_script("ExtAPI.DataModel.Project.ProjectDirectory")
+
+    def run_python_script(self, script_block, *args, **kwargs):
+        """Run a script and record its result."""
+        key = payload_key(script_block)
+        result, elapsed = self._call("run_python_script", script_block, *args, **kwargs)
+        self._cassette.record(MECHANICAL, "run_python_script", key, result, elapsed)
+        return result
+
+    def run_python_script_from_file(self, file_path, *args, **kwargs):
+        """Run a script file and record its result as the result of its text."""
+        with open(file_path, encoding="utf-8") as sf:
+            key = payload_key(sf.read())
+        result, elapsed = self._call("run_python_script_from_file", file_path, *args, **kwargs)
+        self._cassette.record(MECHANICAL, "run_python_script", key, result, elapsed)
+        return result
+
+    def upload(self, file_name, *args, **kwargs):
+        """Upload a file and record its hash."""
+        result, elapsed = self._call("upload", file_name, *args, **kwargs)
+        key = payload_key(os.path.basename(file_name))
+        self._cassette.record(MECHANICAL, "upload", key, None, elapsed, [file_name])
+        return result
+
+    def download(self, files, target_dir=None, *args, **kwargs):
+        """Download files and record their content."""
+        result, elapsed = self._call("download", files, target_dir, *args, **kwargs)
+        self._cassette.record(
+            MECHANICAL,
+            "download",
+            payload_key(files),
+            [os.path.basename(path) for path in result or []],
+            elapsed,
+            result or [],
+            store_files=True,
+        )
+        return result
+
+    def exit(self, force=False):
+        """Shut down the server and record the time taken."""
+        result, elapsed = self._call("exit", force)
+        self._cassette.record(MECHANICAL, "exit", payload_key(), None, elapsed)
+        return result
+
+
+@contextlib.contextmanager
+def record(path) -> Iterator[Cassette]:
+    """Record the Workbench and Mechanical sessions opened in the context.
+
+    The cassette is written to ``path`` when the context exits, even on errors.
+
+    Parameters
+    ----------
+    path : str
+        Path of the cassette file to write.
+
+    Yields
+    ------
+    Cassette
+        The cassette being recorded.
+    """
+    cassette = Cassette()
+
+    def wrapper(client_class):
+        def wrap(client, elapsed):
+            cassette.record(client_class._target, "launch", payload_key(), None, elapsed)
+            return client_class(client, cassette)
+
+        return wrap
+
+    try:
+        with wrap_clients(wrapper(RecordingWorkbenchClient), wrapper(RecordingMechanicalClient)):
+            yield cassette
+    finally:
+        cassette.save(path)
+
+
+class CassetteResponses:
+    """Scripted responses serving the results recorded in a cassette.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        The cassette to replay.
+    target : str
+        Server whose scripts are served, ``"workbench"`` or ``"mechanical"``.
+    method : str
+        Name of the recorded script method.
+    realtime : bool, default: False
+        Whether to wait for the recorded duration of each script.
+    """
+
+    def __init__(self, cassette, target, method, realtime=False):
+        self.cassette = cassette
+        self.target = target
+        self.method = method
+        self.realtime = realtime
+
+    def resolve(self, script: str) -> Any:
+        """Return the recorded result of a script."""
+        interaction = self.cassette.next(self.target, self.method, payload_key(script))
+        if self.realtime:
+            time.sleep(interaction["elapsed"])
+        return interaction["result"]
+
+
+class ReplayMechanicalClient(OfflineMechanicalClient):
+    """Offline Mechanical client serving the downloads recorded in a cassette."""
+
+    def download(self, files, target_dir=None, **kwargs):
+        """Write the recorded files of a download to the client."""
+        responses = self.responses
+        interaction = responses.cassette.next(MECHANICAL, "download", payload_key(files))
+        if responses.realtime:
+            time.sleep(interaction["elapsed"])
+        target_dir = target_dir or os.getcwd()
+        return [
+            responses.cassette.write_file(record, target_dir) for record in interaction["files"]
+        ]
+
+
+class ReplayWorkbenchClient(OfflineWorkbenchClient):
+    """Offline Workbench client serving the downloads recorded in a cassette."""
+
+    mechanical_client_class = ReplayMechanicalClient
+
+    def download_file(self, file_name, show_progress=True, target_dir=None):
+        """Write the recorded files of a download to the client."""
+        cassette = self.responses.cassette
+        interaction = cassette.next(WORKBENCH, "download_file", payload_key(file_name))
+        if self.responses.realtime:
+            time.sleep(interaction["elapsed"])
+        for record in interaction["files"]:
+            cassette.write_file(record, target_dir or self.workdir)
+        return interaction["result"]
+
+
+def replay(path, realtime=False, network=None):
+    """Serve the sessions recorded in a cassette from offline servers.
+
+    Parameters
+    ----------
+    path : str
+        Path of the cassette file to replay.
+    realtime : bool, default: False
+        Whether to wait for the recorded duration of scripts and downloads.
+    network : NetworkModel, default: None
+        Simulated cost of the calls, added to the recorded durations.
+
+    Returns
+    -------
+    contextlib.AbstractContextManager
+        Context in which the PyWorkbench and PyMechanical entry points are
+        served from the cassette.
+    """
+    cassette = Cassette.load(path)
+    return install(
+        responses=CassetteResponses(cassette, WORKBENCH, "run_script", realtime),
+        mechanical_responses=CassetteResponses(cassette, MECHANICAL, "run_python_script", realtime),
+        network=network,
+        client_factory=ReplayWorkbenchClient,
+    )
+
+
+def summarize(cassette: Cassette) -> List[Dict[str, Any]]:
+    """Aggregate the calls, time and bytes of a cassette per target and method."""
+    summary = {}
+    for interaction in cassette.interactions:
+        index = (interaction["target"], interaction["method"])
+        entry = summary.setdefault(
+            index, {"target": index[0], "method": index[1], "calls": 0, "elapsed": 0.0, "bytes": 0}
+        )
+        entry["calls"] += 1
+        entry["elapsed"] += interaction["elapsed"]
+        entry["bytes"] += sum(record["size"] for record in interaction["files"])
+    return sorted(summary.values(), key=lambda entry: entry["elapsed"], reverse=True)
+
+
+def main(argv=None):
+    """Record, replay or summarize a cassette from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in ("record", "replay"):
+        subparser = commands.add_parser(command)
+        subparser.add_argument("example_dir", help="Path to the example directory.")
+        subparser.add_argument("cassette", help="Path to the cassette file.")
+    commands.choices["replay"].add_argument(
+        "--realtime", action="store_true", help="Wait for the recorded durations."
+    )
+    commands.add_parser("summary").add_argument("cassette", help="Path to the cassette file.")
+    args = parser.parse_args(argv)
+
+    if args.command == "summary":
+        for entry in summarize(Cassette.load(args.cassette)):
+            print(
+                f"{entry['target']:<10} {entry['method']:<30} {entry['calls']:>5} calls "
+                f"{entry['elapsed']:>10.3f} s {entry['bytes']:>12} bytes"
+            )
+        return
+
+    cassette_path = os.path.abspath(args.cassette)
+    example_dir = pathlib.Path(args.example_dir).absolute()
+    if args.command == "record":
+        context = record(cassette_path)
+    else:
+        context = replay(cassette_path, realtime=args.realtime)
+    with context, working_directory(example_dir):
+        runpy.run_path(str(example_dir / "main.py"), run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,533 @@
+"""Chunked, checksummed and resumable transfers of large solver files.
+
+Large files, such as the ``.rst``, ``.full`` and ``.esav`` files of a solve, are
+transferred as fixed-size chunks, several at a time. The server copies each
+chunk of a download to a staging directory and returns its SHA-256 hash, which
+the client checks after the transfer. Verified chunks are written in place in a
+``.part`` file, and their hashes are saved next to it, so an interrupted
+download resumes from the verified chunks. Uploads are split on the client,
+their chunks are staged on the server under content-addressed names and only
+the chunks missing from the staging directory are sent again. The server
+checks every chunk before assembling the file.
+
+Downloads can be compressed with gzip at a chosen level. The server compresses
+each chunk while staging it and the client decompresses it while writing it in
+place, so no archive of the whole file is ever built on either side. A staged
+chunk is removed from the server once fetched, or when its transfer fails.
+
+Both PyWorkbench and PyMechanical clients are supported:
+
+.. code:: python
+
+    from tools.chunked_transfer import download_chunked, download_directory_chunked
+
+    download_chunked(mechanical, os.path.join(solve_dir, "file.rst"), target_dir=".")
+    download_directory_chunked(mechanical, solve_dir, "*.*", target_dir=".")
+
+"""
+
+import concurrent.futures
+import contextlib
+import fnmatch
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, Iterable, List
+
+from tools.transfer import file_sha256
+
+CHUNK_SIZE = 64 * 1024 * 1024
+
+SERVER_SCRIPT = """import glob
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+def file_sha256(path, offset=0, size=-1):
+    digest = hashlib.sha256()
+    stream = open(path, "rb")
+    try:
+        stream.seek(offset)
+        while size != 0:
+            chunk = stream.read(1048576 if size < 0 else min(size, 1048576))
+            if not chunk:
+                break
+            digest.update(chunk)
+            size -= len(chunk)
+    finally:
+        stream.close()
+    return digest.hexdigest()
+
+def copy_range(source, target, offset, size, level=None):
+    reader = open(source, "rb")
+    if level is None:
+        writer = open(target, "wb")
+    else:
+        writer = gzip.GzipFile(target, "wb", level)
+    try:
+        reader.seek(offset)
+        while size > 0:
+            chunk = reader.read(min(size, 1048576))
+            if not chunk:
+                break
+            writer.write(chunk)
+            size -= len(chunk)
+    finally:
+        reader.close()
+        writer.close()
+
+request = json.loads(request)
+staging = STAGING_DIR
+if not os.path.isdir(staging):
+    os.makedirs(staging)
+action = request["action"]
+if action == "list":
+    result = []
+    for path in sorted(glob.glob(os.path.join(request["dir"], request["pattern"]))):
+        if os.path.isfile(path) and not path.endswith(".chunk"):
+            entry = {
+                "name": os.path.basename(path),
+                "size": os.path.getsize(path),
+                "mtime": os.path.getmtime(path),
+            }
+            if request["hashes"]:
+                entry["sha256"] = file_sha256(path)
+            result.append(entry)
+elif action == "hash":
+    result = dict(
+        (name, file_sha256(os.path.join(request["dir"], name))) for name in request["names"]
+    )
+elif action == "staging":
+    result = staging
+elif action == "stat":
+    path = os.path.join(staging, request["path"])
+    result = {"size": os.path.getsize(path), "mtime": os.path.getmtime(path), "staging": staging}
+elif action == "stage":
+    staged = os.path.join(staging, request["name"])
+    path = os.path.join(staging, request["path"])
+    copy_range(path, staged, request["offset"], request["size"], request["level"])
+    result = file_sha256(staged)
+elif action == "lookup":
+    result = [
+        name
+        for name, sha256 in request["chunks"]
+        if os.path.isfile(os.path.join(staging, name))
+        and file_sha256(os.path.join(staging, name)) == sha256
+    ]
+elif action == "assemble":
+    for name, sha256 in request["chunks"]:
+        if file_sha256(os.path.join(staging, name)) != sha256:
+            raise IOError("Corrupted chunk " + name)
+    target = request["path"] or os.path.join(staging, request["name"])
+    writer = open(target + ".part", "wb")
+    try:
+        for name, sha256 in request["chunks"]:
+            reader = open(os.path.join(staging, name), "rb")
+            try:
+                shutil.copyfileobj(reader, writer, 1048576)
+            finally:
+                reader.close()
+    finally:
+        writer.close()
+    if os.path.exists(target):
+        os.remove(target)
+    os.rename(target + ".part", target)
+    for name, sha256 in request["chunks"]:
+        os.remove(os.path.join(staging, name))
+    result = target
+elif action == "remove":
+    for name in request["names"]:
+        path = os.path.join(staging, name)
+        if os.path.isfile(path):
+            os.remove(path)
+    result = None
+"""
+
+
+class _WorkbenchServer:
+    """Transfers through a PyWorkbench client, staged in the server working directory."""
+
+    staging_dir = "GetServerWorkingDirectory()"
+    direct_downloads = False
+
+    def __init__(self, client):
+        self.client = client
+
+    def run(self, request) -> Any:
+        script = SERVER_SCRIPT.replace("STAGING_DIR", self.staging_dir)
+        script = f"request = {json.dumps(request)!r}\n{script}"
+        return self.client.run_script_string(script + "wb_script_result = json.dumps(result)\n")
+
+    def fetch(self, name, directory, target_dir):
+        # Only the files of the working directory, where chunks are staged, can be downloaded.
+        self.client.download_file(name, show_progress=False, target_dir=target_dir)
+
+    def send(self, path, staging):
+        self.client.upload_file(path, show_progress=False)
+
+
+class _MechanicalServer:
+    """Transfers through a PyMechanical client, staged in a temporary directory of the server."""
+
+    staging_dir = 'os.path.join(tempfile.gettempdir(), "chunked_transfers")'
+    direct_downloads = True
+
+    def __init__(self, client):
+        self.client = client
+
+    def run(self, request) -> Any:
+        script = SERVER_SCRIPT.replace("STAGING_DIR", self.staging_dir)
+        script = f"request = {json.dumps(request)!r}\n{script}json.dumps(result)\n"
+        return json.loads(self.client.run_python_script(script))
+
+    def fetch(self, name, directory, target_dir):
+        self.client.download(os.path.join(directory, name), target_dir=target_dir)
+
+    def send(self, path, staging):
+        self.client.upload(path, staging)
+
+
+def _server(client):
+    """Return the transfer interface of a PyWorkbench or PyMechanical client."""
+    if hasattr(client, "run_python_script"):
+        return _MechanicalServer(client)
+    return _WorkbenchServer(client)
+
+
+def _chunks(size, chunk_size) -> List[Dict[str, int]]:
+    """Return the index, offset and size of the chunks of a file."""
+    return [
+        {"index": index, "offset": offset, "size": min(chunk_size, size - offset)}
+        for index, offset in enumerate(range(0, size, chunk_size))
+    ] or [{"index": 0, "offset": 0, "size": 0}]
+
+
+def _with_retries(function, retries):
+    """Call a function, calling it again on errors up to a number of retries."""
+    for attempt in range(retries + 1):
+        try:
+            return function()
+        except Exception:
+            if attempt == retries:
+                raise
+
+
+def download_chunked(
+    client,
+    server_path,
+    target_dir=None,
+    chunk_size=CHUNK_SIZE,
+    max_workers=4,
+    retries=2,
+    compress_level=None,
+) -> str:
+    """Download a large file in verified chunks, resuming an interrupted download.
+
+    Parameters
+    ----------
+    client : WorkbenchClient or Mechanical
+        PyWorkbench or PyMechanical client connected to the server.
+    server_path : str
+        Path of the file on the server. With a PyWorkbench client, relative
+        paths are relative to the server working directory.
+    target_dir : str, default: None
+        Client directory receiving the file. The default is ``None``, in which
+        case the current working directory is used.
+    chunk_size : int, default: 64 MB
+        Size, in bytes, of the chunks. A download is only resumed with the same
+        chunk size.
+    max_workers : int, default: 4
+        Number of chunks transferred at once.
+    retries : int, default: 2
+        Number of times a chunk failing its transfer or its checksum is retried.
+    compress_level : int, default: None
+        Gzip compression level, from 1 to 9, of the chunks. The server
+        compresses each chunk while staging it and the client decompresses it
+        while writing it in place, which pays off for the text and sparse binary
+        files of solver directories over slow links. The default is ``None``, in
+        which case the chunks are not compressed.
+
+    Returns
+    -------
+    str
+        Path of the downloaded file.
+    """
+    server = _server(client)
+    target_dir = os.path.abspath(target_dir or os.getcwd())
+    name = os.path.basename(server_path)
+    target = os.path.join(target_dir, name)
+    part_path, state_path = target + ".part", target + ".part.json"
+
+    info = server.run({"action": "stat", "path": server_path})
+    source = {"path": server_path, "size": info["size"], "mtime": info["mtime"]}
+    state = {"source": source, "chunk_size": chunk_size, "done": {}}
+    if os.path.exists(state_path) and os.path.exists(part_path):
+        with open(state_path, encoding="utf-8") as file:
+            saved = json.load(file)
+        if saved["source"] == source and saved["chunk_size"] == chunk_size:
+            state = saved
+    if not state["done"]:
+        os.makedirs(target_dir, exist_ok=True)
+        with open(part_path, "wb") as file:
+            file.truncate(info["size"])
+
+    lock = threading.Lock()
+    token = hashlib.sha256(json.dumps(source).encode()).hexdigest()[:16]
+
+    def download_chunk(chunk):
+        staged_name = f"{name}.{token}.{chunk['index']:05d}.chunk"
+        if compress_level is not None:
+            staged_name += ".gz"
+        # The staged chunk is removed even when the transfer fails or is interrupted, so no
+        # chunk is left behind in the staging directory of the server.
+        try:
+            with tempfile.TemporaryDirectory(dir=target_dir) as chunk_dir:
+
+                def transfer():
+                    sha256 = server.run(
+                        {
+                            "action": "stage",
+                            "path": server_path,
+                            "name": staged_name,
+                            "level": compress_level,
+                            **chunk,
+                        }
+                    )
+                    server.fetch(staged_name, info["staging"], chunk_dir)
+                    local_chunk = os.path.join(chunk_dir, staged_name)
+                    if file_sha256(local_chunk) != sha256:
+                        raise IOError(f"Checksum mismatch of chunk {chunk['index']} of {name}.")
+                    return local_chunk, sha256
+
+                local_chunk, sha256 = _with_retries(transfer, retries)
+                opener = open if compress_level is None else gzip.open
+                with opener(local_chunk, "rb") as reader, open(part_path, "r+b") as writer:
+                    writer.seek(chunk["offset"])
+                    shutil.copyfileobj(reader, writer, 1024 * 1024)
+                    if writer.tell() - chunk["offset"] != chunk["size"]:
+                        raise IOError(f"Truncated chunk {chunk['index']} of {name}.")
+        finally:
+            with contextlib.suppress(Exception):
+                server.run({"action": "remove", "names": [staged_name]})
+        with lock:
+            state["done"][str(chunk["index"])] = sha256
+            with open(state_path, "w", encoding="utf-8") as file:
+                json.dump(state, file)
+
+    pending = [
+        chunk
+        for chunk in _chunks(info["size"], chunk_size)
+        if str(chunk["index"]) not in state["done"]
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for future in [executor.submit(download_chunk, chunk) for chunk in pending]:
+            future.result()
+    os.replace(part_path, target)
+    os.remove(state_path)
+    return target
+
+
+def download_directory_chunked(
+    client,
+    server_dir,
+    pattern="*",
+    target_dir=None,
+    min_size=CHUNK_SIZE,
+    exclude=(),
+    **options,
+) -> List[str]:
+    """Download the files of a server directory, chunking the large ones.
+
+    Parameters
+    ----------
+    client : WorkbenchClient or Mechanical
+        PyWorkbench or PyMechanical client connected to the server.
+    server_dir : str
+        Path of the directory on the server.
+    pattern : str, default: "*"
+        Wildcard pattern of the files to download.
+    target_dir : str, default: None
+        Client directory receiving the files. The default is ``None``, in which
+        case the current working directory is used.
+    min_size : int, default: 64 MB
+        Size, in bytes, from which files are downloaded in chunks. Smaller files
+        are downloaded in a single transfer by PyMechanical clients, unless
+        they are compressed.
+    exclude : list[str], default: ()
+        Wildcard patterns of the file names to skip.
+    **options
+        Options of :func:`download_chunked`.
+
+    Returns
+    -------
+    list[str]
+        Paths of the downloaded files.
+    """
+    files = [
+        entry
+        for entry in list_files(client, server_dir, pattern)
+        if not any(fnmatch.fnmatch(entry["name"], excluded) for excluded in exclude)
+    ]
+    return download_files(client, server_dir, files, target_dir, min_size, **options)
+
+
+def list_files(client, server_dir, pattern="*", hashes=False) -> List[Dict[str, Any]]:
+    """List the files of a server directory.
+
+    Parameters
+    ----------
+    client : WorkbenchClient or Mechanical
+        PyWorkbench or PyMechanical client connected to the server.
+    server_dir : str
+        Path of the directory on the server.
+    pattern : str, default: "*"
+        Wildcard pattern of the files to list.
+    hashes : bool, default: False
+        Whether the server computes the SHA-256 hash of every file, which reads
+        all of them.
+
+    Returns
+    -------
+    list[dict]
+        Name, size in bytes, modification time and, if requested, SHA-256 hash
+        of each file, sorted by name.
+    """
+    request = {"action": "list", "dir": server_dir, "pattern": pattern, "hashes": hashes}
+    return _server(client).run(request)
+
+
+def hash_files(client, server_dir, names: Iterable[str]) -> Dict[str, str]:
+    """Return the SHA-256 hashes of files of a server directory.
+
+    Parameters
+    ----------
+    client : WorkbenchClient or Mechanical
+        PyWorkbench or PyMechanical client connected to the server.
+    server_dir : str
+        Path of the directory on the server.
+    names : list[str]
+        Names of the files to hash. Only these files are read by the server.
+
+    Returns
+    -------
+    dict[str, str]
+        SHA-256 hash of each file, keyed by name, computed in a single server
+        call.
+    """
+    names = list(names)
+    if not names:
+        return {}
+    return _server(client).run({"action": "hash", "dir": server_dir, "names": names})
+
+
+def download_files(
+    client, server_dir, files, target_dir=None, min_size=CHUNK_SIZE, **options
+) -> List[str]:
+    """Download files of a server directory, chunking the large ones.
+
+    Parameters
+    ----------
+    client : WorkbenchClient or Mechanical
+        PyWorkbench or PyMechanical client connected to the server.
+    server_dir : str
+        Path of the directory on the server.
+    files : list[dict]
+        Files to download, with their name and size, as returned by
+        :func:`list_files`.
+    target_dir : str, default: None
+        Client directory receiving the files. The default is ``None``, in which
+        case the current working directory is used.
+    min_size : int, default: 64 MB
+        Size, in bytes, from which files are downloaded in chunks.
+    **options
+        Options of :func:`download_chunked`.
+
+    Returns
+    -------
+    list[str]
+        Paths of the downloaded files.
+    """
+    server = _server(client)
+    target_dir = os.path.abspath(target_dir or os.getcwd())
+    paths = []
+    for entry in files:
+        chunked = entry["size"] >= min_size or options.get("compress_level") is not None
+        if chunked or not server.direct_downloads:
+            server_path = os.path.join(server_dir, entry["name"])
+            paths.append(download_chunked(client, server_path, target_dir, **options))
+        else:
+            server.fetch(entry["name"], server_dir, target_dir)
+            paths.append(os.path.join(target_dir, entry["name"]))
+    return paths
+
+
+def upload_chunked(
+    client,
+    path,
+    server_dir=None,
+    chunk_size=CHUNK_SIZE,
+    max_workers=4,
+    retries=2,
+) -> str:
+    """Upload a large file in chunks verified by the server, resuming an interrupted upload.
+
+    Parameters
+    ----------
+    client : WorkbenchClient or Mechanical
+        PyWorkbench or PyMechanical client connected to the server.
+    path : str
+        Path of the file on the client.
+    server_dir : str, default: None
+        Directory of the server receiving the file. The default is ``None``, in
+        which case the server working directory of Workbench, or the staging
+        directory of Mechanical, is used.
+    chunk_size : int, default: 64 MB
+        Size, in bytes, of the chunks.
+    max_workers : int, default: 4
+        Number of chunks transferred at once.
+    retries : int, default: 2
+        Number of times a chunk failing its transfer is retried.
+
+    Returns
+    -------
+    str
+        Path of the file on the server.
+    """
+    server = _server(client)
+    name = os.path.basename(path)
+    chunks = _chunks(os.path.getsize(path), chunk_size)
+    with open(path, "rb") as file:
+        for chunk in chunks:
+            file.seek(chunk["offset"])
+            chunk["sha256"] = hashlib.sha256(file.read(chunk["size"])).hexdigest()
+            chunk["name"] = f"{name}.{chunk['index']:05d}.{chunk['sha256'][:16]}.chunk"
+    listing = [[chunk["name"], chunk["sha256"]] for chunk in chunks]
+    staged = set(server.run({"action": "lookup", "chunks": listing}))
+    staging = server.run({"action": "staging"})
+
+    def upload_chunk(chunk, chunk_dir):
+        local_chunk = os.path.join(chunk_dir, chunk["name"])
+        with open(path, "rb") as reader, open(local_chunk, "wb") as writer:
+            reader.seek(chunk["offset"])
+            writer.write(reader.read(chunk["size"]))
+        _with_retries(lambda: server.send(local_chunk, staging), retries)
+        os.remove(local_chunk)
+
+    with tempfile.TemporaryDirectory() as chunk_dir:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(upload_chunk, chunk, chunk_dir)
+                for chunk in chunks
+                if chunk["name"] not in staged
+            ]
+            for future in futures:
+                future.result()
+    target = os.path.join(server_dir, name) if server_dir else None
+    return server.run({"action": "assemble", "chunks": listing, "name": name, "path": target})
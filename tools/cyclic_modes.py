@@ -0,0 +1,160 @@
+"""Harmonic index by mode frequency matrices of cyclic modal analyses.
+
+The ``TabularData`` of a cyclic modal result lists one row per mode and
+harmonic index. :func:`get_frequency_matrices` reads the tables of any number
+of modal results in a single call, through :mod:`tools.tabular_data`, and
+reshapes each of them into a dense array of frequencies indexed by harmonic
+index and mode, whatever the number of modes and harmonic indices solved.
+:func:`stack_matrices` aligns the matrices of several analyses, such as a
+standalone and prestressed modal analysis, on their harmonic indices so they
+can be compared as a single array:
+
+.. code:: python
+
+    from tools.cyclic_modes import get_frequency_matrices, stack_matrices
+
+    matrices = get_frequency_matrices(
+        mechanical,
+        {
+            "standalone": "Model.Analyses[0].Solution.Children[1]",
+            "prestress": "Model.Analyses[2].Solution.Children[1]",
+        },
+    )
+    harmonic_indices, frequencies = stack_matrices(matrices)
+    shift = frequencies[1] - frequencies[0]
+
+"""
+
+from typing import Any, Dict, Tuple
+
+from tools.tabular_data import get_tabular_data
+
+
+def frequency_matrix(
+    table,
+    modes_per_index=None,
+    harmonic_index_column="Harmonic Index",
+    frequency_column="Frequency",
+) -> Dict[str, Any]:
+    """Reshape the table of a cyclic modal result into a frequency matrix.
+
+    Parameters
+    ----------
+    table : dict
+        Table returned by :func:`tools.tabular_data.get_tabular_data`.
+    modes_per_index : int, default: None
+        Number of modes of each harmonic index, the ``MaximumModesToFind`` of
+        the analysis, used when the table has no harmonic index column.
+    harmonic_index_column : str, default: "Harmonic Index"
+        Name of the column of the harmonic indices.
+    frequency_column : str, default: "Frequency"
+        Name of the column of the frequencies.
+
+    Returns
+    -------
+    dict
+        ``harmonic_indices`` of the rows of the matrix, sorted, ``frequencies``
+        as a float64 array of shape ``(harmonic indices, modes)``, padded with
+        NaN when a harmonic index has fewer modes, and their ``unit``. An empty
+        table gives a ``(0, 0)`` matrix.
+
+    Raises
+    ------
+    ValueError
+        If the table has no harmonic index column and ``modes_per_index`` is
+        not given.
+    """
+    import numpy as np
+
+    values = table["values"]
+    frequencies = values[frequency_column].astype("f8")
+    if harmonic_index_column in values.dtype.names:
+        harmonic_indices = values[harmonic_index_column].astype("f8").astype(int)
+    elif modes_per_index is not None:
+        harmonic_indices = np.arange(len(frequencies)) // modes_per_index
+    else:
+        raise ValueError(f"The table has no {harmonic_index_column!r} column.")
+    unit = table["units"].get(frequency_column, "")
+    if not len(frequencies):
+        return {
+            "harmonic_indices": np.array([], dtype=int),
+            "frequencies": np.empty((0, 0)),
+            "unit": unit,
+        }
+
+    unique_indices, rows, counts = np.unique(
+        harmonic_indices, return_inverse=True, return_counts=True
+    )
+    # Rank of each row among the modes of its harmonic index, in table order.
+    order = np.argsort(rows, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    columns = np.empty(len(rows), dtype=int)
+    columns[order] = np.arange(len(rows)) - np.repeat(starts, counts)
+
+    matrix = np.full((len(unique_indices), counts.max()), np.nan)
+    matrix[rows, columns] = frequencies
+    return {
+        "harmonic_indices": unique_indices,
+        "frequencies": matrix,
+        "unit": unit,
+    }
+
+
+def get_frequency_matrices(
+    mechanical, results: Dict[str, str], modes_per_index=None, **columns
+) -> Dict[str, Dict[str, Any]]:
+    """Read the frequency matrices of cyclic modal results in a single server call.
+
+    Parameters
+    ----------
+    mechanical : ansys.mechanical.core.Mechanical
+        Client connected to the Mechanical server.
+    results : dict[str, str]
+        Python expressions of the modal results, or solutions, whose tabular
+        data lists the frequencies, keyed by name.
+    modes_per_index : int, default: None
+        Number of modes of each harmonic index, used when the tables have no
+        harmonic index column.
+    **columns
+        Column names of :func:`frequency_matrix`.
+
+    Returns
+    -------
+    dict[str, dict]
+        Matrix returned by :func:`frequency_matrix` for each result, keyed by
+        name.
+    """
+    tables = get_tabular_data(mechanical, results)
+    return {
+        name: frequency_matrix(table, modes_per_index, **columns) for name, table in tables.items()
+    }
+
+
+def stack_matrices(matrices: Dict[str, Dict[str, Any]]) -> Tuple[Any, Any]:
+    """Align frequency matrices on their harmonic indices.
+
+    Parameters
+    ----------
+    matrices : dict[str, dict]
+        Matrices returned by :func:`frequency_matrix`, keyed by name.
+
+    Returns
+    -------
+    tuple
+        Sorted union of the harmonic indices of the matrices, and a float64
+        array of shape ``(matrices, harmonic indices, modes)``, in the order of
+        ``matrices``, padded with NaN.
+    """
+    import numpy as np
+
+    matrices = list(matrices.values())
+    harmonic_indices = np.unique(
+        np.concatenate([matrix["harmonic_indices"] for matrix in matrices] or [np.array([], int)])
+    )
+    modes = max((matrix["frequencies"].shape[1] for matrix in matrices), default=0)
+    stacked = np.full((len(matrices), len(harmonic_indices), modes), np.nan)
+    for position, matrix in enumerate(matrices):
+        rows = np.searchsorted(harmonic_indices, matrix["harmonic_indices"])
+        frequencies = matrix["frequencies"]
+        stacked[position, rows, : frequencies.shape[1]] = frequencies
+    return harmonic_indices, stacked
@@ -0,0 +1,266 @@
+"""Parallel design of experiments across the servers of a pool.
+
+The material designer example updates a single design point. :func:`run_doe`
+takes a table of input parameter values, splits it into batches of design
+points, and updates the batches concurrently on the servers of a
+:class:`tools.workbench_pool.WorkbenchPool`. Each server loads the project once,
+then creates, updates, reads and deletes the design points of one batch per
+server call. Results are yielded as soon as each batch finishes, and failed
+points are retried one at a time:
+
+.. code:: python
+
+    from tools.doe import run_doe
+    from tools.workbench_pool import WorkbenchPool
+
+    def setup(wb):
+        wb.upload_file_from_example_repo("material-designer-workflow/wbpz/MatDesigner.wbpz")
+        wb.run_script_file("assets/project.wbjn")
+
+    points = [{"P1": f"{modulus} [Pa]"} for modulus in (1.2e10, 1.6e10, 2.0e10)]
+    with WorkbenchPool(size=4, use_insecure_connection=True) as pool:
+        for result in run_doe(pool, setup, points, batch_size=2):
+            print(result["index"], result["outputs"])
+
+The same sweep runs from the command line, with the points read from a CSV file
+whose header holds the names of the input parameters:
+
+.. code:: console
+
+    python -m tools.doe points.csv --size 4 --batch-size 2 --output results.jsonl \\
+        --example-file material-designer-workflow/wbpz/MatDesigner.wbpz \\
+        --setup-script examples/material-designer-workflow/assets/project.wbjn
+
+"""
+
+import argparse
+import collections
+import contextlib
+import csv
+import json
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+from tools.offline_workbench import install
+from tools.workbench_pool import WorkbenchPool
+
+DOE_SCRIPT = """import json
+request = json.loads(request)
+parameters = {}
+def get_parameter(name):
+    if name not in parameters:
+        parameters[name] = Parameters.GetParameter(Name=name)
+    return parameters[name]
+outputs = request["outputs"]
+if outputs is None:
+    outputs = [p.Name for p in Parameters.GetAllParameters() if str(p.Usage) == "Output"]
+def describe(value):
+    if hasattr(value, "Unit"):
+        return {"value": float(value.Value), "unit": str(value.Unit)}
+    try:
+        return {"value": float(value), "unit": ""}
+    except (TypeError, ValueError):
+        return {"value": str(value), "unit": ""}
+design_points = []
+results = []
+try:
+    for point in request["points"]:
+        design_point = Parameters.CreateDesignPoint()
+        for name, expression in point.items():
+            design_point.SetParameterExpression(
+                Parameter=get_parameter(name), Expression=expression
+            )
+        design_points.append(design_point)
+    errors = {}
+    try:
+        UpdateAllDesignPoints(DesignPoints=design_points, ErrorBehavior="Stop")
+    except Exception:
+        # The update stops at the first design point that fails, and the others keep the outputs
+        # of their last update, so each point is updated on its own to find out which failed.
+        # Points already up to date are not solved again.
+        for position, design_point in enumerate(design_points):
+            try:
+                UpdateAllDesignPoints(DesignPoints=[design_point], ErrorBehavior="Stop")
+            except Exception as exception:
+                errors[position] = str(exception) or "The design point failed to update."
+    for position, design_point in enumerate(design_points):
+        result = {"outputs": {}, "error": errors.get(position)}
+        if result["error"] is None:
+            try:
+                for name in outputs:
+                    result["outputs"][name] = describe(
+                        design_point.GetParameterValue(Parameter=get_parameter(name))
+                    )
+            except Exception as exception:
+                result["error"] = str(exception)
+        results.append(result)
+finally:
+    for design_point in design_points:
+        design_point.Delete()
+wb_script_result = json.dumps(results)
+"""
+
+
+def _format_point(point: Dict[str, Any]) -> Dict[str, str]:
+    """Return the expressions of the input parameters of a design point."""
+    return {name: str(value) for name, value in point.items()}
+
+
+def run_doe(
+    pool: WorkbenchPool,
+    setup: Callable[[Any], Any],
+    points: Iterable[Dict[str, Any]],
+    outputs: Iterable[str] = None,
+    batch_size=1,
+    retries=2,
+) -> Iterator[Dict[str, Any]]:
+    """Update design points concurrently on the servers of a pool.
+
+    Parameters
+    ----------
+    pool : tools.workbench_pool.WorkbenchPool
+        Started pool of Workbench servers. One batch runs at a time on each of
+        its servers.
+    setup : callable
+        Called with the client of each leased server to load the project, for
+        example by uploading and unarchiving it.
+    points : list[dict]
+        Input parameter expressions of each design point, keyed by parameter
+        name, such as ``{"P1": "1.6e10 [Pa]"}``. Numbers are used as
+        expressions in the units of the project.
+    outputs : list[str], default: None
+        Names of the output parameters to read. The default is ``None``, in
+        which case all the output parameters are read.
+    batch_size : int, default: 1
+        Number of design points updated by a server call.
+    retries : int, default: 2
+        Number of times a failed design point is retried, on its own.
+
+    Yields
+    ------
+    dict
+        For each design point, in the order in which they finish, its
+        ``index`` in ``points``, its ``inputs``, its ``outputs`` with their
+        ``value`` and ``unit``, keyed by name, its number of ``attempts``, and
+        the ``error`` of its last attempt, ``None`` if it succeeded.
+    """
+    points = [_format_point(point) for point in points]
+    outputs = None if outputs is None else list(outputs)
+    tasks = queue.Queue()
+    results = queue.Queue()
+    attempts = collections.Counter()
+    for start in range(0, len(points), batch_size):
+        tasks.put(list(range(start, min(start + batch_size, len(points)))))
+    remaining = len(points)
+    stopped = threading.Event()
+
+    def finish(index, point_outputs, error):
+        attempts[index] += 1
+        if error is not None and attempts[index] <= retries:
+            tasks.put([index])
+            return
+        results.put(
+            {
+                "index": index,
+                "inputs": points[index],
+                "outputs": point_outputs,
+                "attempts": attempts[index],
+                "error": error,
+            }
+        )
+
+    def run_batches(wb):
+        """Run batches on a leased server until they are all done, or the server fails."""
+        while not stopped.is_set():
+            try:
+                batch = tasks.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            request = json.dumps({"points": [points[index] for index in batch], "outputs": outputs})
+            try:
+                batch_results = wb.run_script_string(f"request = {request!r}\n{DOE_SCRIPT}")
+                if batch_results is None:
+                    raise RuntimeError("The design point script failed on the server.")
+            except Exception as error:
+                for index in batch:
+                    finish(index, {}, str(error))
+                return
+            for index, result in zip(batch, batch_results):
+                finish(index, result["outputs"], result["error"])
+
+    def work():
+        # A failed server call may have lost the server, so the lease is returned, which resets
+        # or replaces its server, and a new one is leased.
+        while not stopped.is_set():
+            try:
+                with pool.lease() as wb:
+                    setup(wb)
+                    run_batches(wb)
+            except Exception as error:
+                if not stopped.is_set():
+                    results.put(error)
+                return
+
+    workers = [
+        threading.Thread(target=work, name=f"doe-{number}", daemon=True)
+        for number in range(min(pool.size, max(1, -(-len(points) // batch_size))))
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        while remaining:
+            result = results.get()
+            if isinstance(result, Exception):
+                raise result
+            remaining -= 1
+            yield result
+    finally:
+        stopped.set()
+        for worker in workers:
+            worker.join()
+
+
+def read_points(path) -> List[Dict[str, str]]:
+    """Read the input parameter expressions of design points from a CSV file."""
+    with open(path, newline="", encoding="utf-8") as file:
+        return [dict(row) for row in csv.DictReader(file)]
+
+
+def main(argv=None):
+    """Run a design of experiments on a pool of Workbench servers from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("points", help="CSV file of the input parameter expressions.")
+    parser.add_argument("--example-file", action="append", default=[], help="Example file.")
+    parser.add_argument("--setup-script", action="append", default=[], help="Setup script.")
+    parser.add_argument("--outputs", nargs="+", help="Names of the output parameters.")
+    parser.add_argument("--size", type=int, default=1, help="Number of servers.")
+    parser.add_argument("--batch-size", type=int, default=1, help="Design points per call.")
+    parser.add_argument("--retries", type=int, default=2, help="Retries of a failed point.")
+    parser.add_argument("--output", help="JSON lines file receiving the results.")
+    parser.add_argument("--offline", action="store_true", help="Use offline servers.")
+    args = parser.parse_args(argv)
+
+    def setup(wb):
+        for example_file in args.example_file:
+            wb.upload_file_from_example_repo(example_file, show_progress=False)
+        for setup_script in args.setup_script:
+            wb.run_script_file(setup_script)
+
+    points = read_points(args.points)
+    servers = install() if args.offline else contextlib.nullcontext()
+    with servers, contextlib.ExitStack() as stack:
+        output = stack.enter_context(open(args.output, "w")) if args.output else None
+        pool = stack.enter_context(WorkbenchPool(args.size, use_insecure_connection=True))
+        failed = 0
+        for result in run_doe(pool, setup, points, args.outputs, args.batch_size, args.retries):
+            failed += result["error"] is not None
+            if output is not None:
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+            print(json.dumps(result))
+        print(f"Updated {len(points) - failed} design points, {failed} failed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""Shared cache of the example input files.
+
+The examples download their inputs from the ``ansys/example-data`` repository,
+either through ``upload_file_from_example_repo`` of PyWorkbench or through
+the ``examples.download_file`` functions of PyMechanical and PyFluent. This
+module keeps the downloaded files in a local cache shared by all the processes
+of a machine, and by all its users when the cache directory is shared:
+
+- Files are stored once, under their SHA-256 hash, and an index maps each URL
+  to its content. The content is checked against its hash when it is used and
+  downloaded again if it is corrupted.
+- Concurrent processes, such as parallel CI jobs, serialize their accesses with
+  a lock file, so a file is downloaded once.
+- The least recently used files are evicted when the cache exceeds its size.
+- In offline mode, files are only served from the cache, which lets examples run
+  on machines without internet access once the cache is filled.
+
+The cache directory, its size in bytes and the offline mode are set by the
+``PYWORKBENCH_EXAMPLE_DATA_CACHE``, ``PYWORKBENCH_EXAMPLE_DATA_CACHE_SIZE`` and
+``PYWORKBENCH_EXAMPLE_DATA_OFFLINE`` environment variables. The default cache
+directory is in the home directory of the user. To share the cache between
+users, set ``PYWORKBENCH_EXAMPLE_DATA_CACHE`` to a directory writable by all of
+them, such as a directory of a common group with the setgid bit, and run the
+examples with a umask, such as ``002``, that lets the group write. Cached files
+are created with the permissions allowed by the umask. Run an example with the
+cache with:
+
+.. code:: console
+
+    python -m tools.example_data run examples/grantami-integration
+    python -m tools.example_data list
+
+"""
+
+import argparse
+import contextlib
+import hashlib
+import importlib
+import json
+import os
+import pathlib
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterator
+import urllib.request
+
+from tools.offline_workbench import working_directory, wrap_clients
+
+EXAMPLE_DATA_URL = "https://github.com/ansys/example-data/raw/master"
+DEFAULT_CACHE_DIR = pathlib.Path.home() / ".cache" / "pyworkbench-examples" / "example-data"
+DEFAULT_MAX_SIZE = 10 * 1024**3
+
+
+def _sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _umask() -> int:
+    """Return the umask of the process."""
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+@contextlib.contextmanager
+def _locked(path) -> Iterator[None]:
+    """Hold an exclusive lock on a file, shared by all the processes of the machine."""
+    with open(path, "a+b") as lock_file:
+        if sys.platform == "win32":
+            import msvcrt
+
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class ExampleDataCache:
+    """Content-indexed cache of downloaded files.
+
+    Parameters
+    ----------
+    cache_dir : str, default: None
+        Directory of the cache. The default is ``None``, in which case the
+        ``PYWORKBENCH_EXAMPLE_DATA_CACHE`` environment variable, or the
+        per-user ``~/.cache/pyworkbench-examples/example-data``, is used. Set
+        it to a directory writable by all the users to share the cache.
+    max_size : int, default: None
+        Size, in bytes, above which the least recently used files are evicted.
+        The default is ``None``, in which case the
+        ``PYWORKBENCH_EXAMPLE_DATA_CACHE_SIZE`` environment variable, or 10 GB,
+        is used.
+    offline : bool, default: None
+        Whether to only serve the files already cached. The default is ``None``,
+        in which case the ``PYWORKBENCH_EXAMPLE_DATA_OFFLINE`` environment
+        variable is used.
+    """
+
+    def __init__(self, cache_dir=None, max_size=None, offline=None):
+        self.cache_dir = pathlib.Path(
+            cache_dir or os.environ.get("PYWORKBENCH_EXAMPLE_DATA_CACHE", DEFAULT_CACHE_DIR)
+        )
+        self.max_size = int(
+            max_size or os.environ.get("PYWORKBENCH_EXAMPLE_DATA_CACHE_SIZE", DEFAULT_MAX_SIZE)
+        )
+        if offline is None:
+            offline = os.environ.get("PYWORKBENCH_EXAMPLE_DATA_OFFLINE", "") not in ("", "0")
+        self.offline = offline
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_file = self.cache_dir / "index.json"
+        self.lock_file = self.cache_dir / ".lock"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+    def _read_index(self) -> Dict[str, Any]:
+        if not self.index_file.exists():
+            return {}
+        with open(self.index_file, encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write_index(self, index):
+        staging = self.index_file.with_suffix(".tmp")
+        with open(staging, "w", encoding="utf-8") as file:
+            json.dump(index, file, indent=1)
+        os.replace(staging, self.index_file)
+
+    def _download(self, url) -> pathlib.Path:
+        """Download a URL to a temporary file of the cache and return its path."""
+        handle, staging = tempfile.mkstemp(dir=self.cache_dir, suffix=".download")
+        try:
+            with os.fdopen(handle, "wb") as file, urllib.request.urlopen(url) as response:
+                shutil.copyfileobj(response, file, 1024 * 1024)
+            # mkstemp creates files readable by their owner only, which other users of a shared
+            # cache could not read. Give them the permissions of a file created with open.
+            os.chmod(staging, 0o666 & ~_umask())
+        except BaseException:
+            os.remove(staging)
+            raise
+        return pathlib.Path(staging)
+
+    def get(self, url, sha256=None) -> pathlib.Path:
+        """Return the path of the cached content of a URL, downloading it if needed.
+
+        Parameters
+        ----------
+        url : str
+            URL of the file.
+        sha256 : str, default: None
+            Expected SHA-256 hash of the file, checked after the download.
+
+        Returns
+        -------
+        pathlib.Path
+            Path of the content in the cache. It must not be modified.
+
+        Raises
+        ------
+        FileNotFoundError
+            In offline mode, if the file is not cached.
+        ValueError
+            If the downloaded file does not match the expected hash.
+        """
+        with _locked(self.lock_file):
+            index = self._read_index()
+            entry = index.get(url)
+            if entry is not None:
+                path = self.objects_dir / entry["sha256"]
+                if path.is_file() and _sha256(path) == entry["sha256"]:
+                    entry["last_used"] = time.time()
+                    self._write_index(index)
+                    return path
+                # Missing or corrupted content, download it again.
+                path.unlink(missing_ok=True)
+                del index[url]
+            if self.offline:
+                raise FileNotFoundError(f"{url} is not in the example data cache {self.cache_dir}.")
+            staging = self._download(url)
+            digest = _sha256(staging)
+            if sha256 is not None and digest != sha256:
+                staging.unlink()
+                raise ValueError(f"{url} does not match the expected SHA-256 hash {sha256}.")
+            path = self.objects_dir / digest
+            os.replace(staging, path)
+            index[url] = {"sha256": digest, "size": path.stat().st_size, "last_used": time.time()}
+            self._evict(index, keep=url)
+            self._write_index(index)
+            return path
+
+    def _evict(self, index, keep=None, max_size=None):
+        """Remove the least recently used files until the cache fits its size."""
+        max_size = self.max_size if max_size is None else max_size
+        sizes = {entry["sha256"]: entry["size"] for entry in index.values()}
+        total = sum(sizes.values())
+        for url, entry in sorted(index.items(), key=lambda item: item[1]["last_used"]):
+            if total <= max_size:
+                break
+            if url == keep:
+                continue
+            del index[url]
+            if all(other["sha256"] != entry["sha256"] for other in index.values()):
+                (self.objects_dir / entry["sha256"]).unlink(missing_ok=True)
+                total -= sizes[entry["sha256"]]
+
+    def fetch(self, url, destination, sha256=None) -> str:
+        """Copy the content of a URL to a file, from the cache.
+
+        Parameters
+        ----------
+        url : str
+            URL of the file.
+        destination : str
+            Path of the file to write.
+        sha256 : str, default: None
+            Expected SHA-256 hash of the file.
+
+        Returns
+        -------
+        str
+            Path of the written file.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+        shutil.copyfile(self.get(url, sha256), destination)
+        return str(destination)
+
+    def entries(self) -> Dict[str, Any]:
+        """Return the cached URLs with their hash, size and time of last use."""
+        with _locked(self.lock_file):
+            return self._read_index()
+
+    def prune(self, max_size=None):
+        """Evict the least recently used files above a size, by default the cache size."""
+        with _locked(self.lock_file):
+            index = self._read_index()
+            self._evict(index, max_size=max_size)
+            self._write_index(index)
+
+
+class _CachedWorkbenchClient:
+    """Wrapper of a PyWorkbench client serving the example repository from a cache."""
+
+    def __init__(self, client, cache):
+        self._client = client
+        self._cache = cache
+
+    def __getattr__(self, name):
+        """Forward the other calls to the wrapped client."""
+        return getattr(self._client, name)
+
+    def upload_file_from_example_repo(self, relative_file_path, show_progress=True):
+        """Upload a file of the example repository, downloaded through the cache."""
+        file_name = os.path.basename(relative_file_path)
+        self._cache.fetch(
+            f"{EXAMPLE_DATA_URL}/pyworkbench/{relative_file_path}",
+            os.path.join(self._client.workdir, file_name),
+        )
+        self._client.upload_file(file_name, show_progress=show_progress)
+
+
+def _mechanical_download_file(cache):
+    """Return a replacement of ``ansys.mechanical.core.examples.download_file``."""
+    from ansys.mechanical.core import examples
+
+    def download_file(filename, *directory, destination=None, force=False):
+        url = "/".join((EXAMPLE_DATA_URL, *directory, filename))
+        destination = destination or getattr(examples, "EXAMPLES_PATH", tempfile.gettempdir())
+        path = os.path.join(destination, filename)
+        if force or not os.path.isfile(path):
+            cache.fetch(url, path)
+        return path
+
+    return download_file
+
+
+def _fluent_download_file(cache):
+    """Return a replacement of ``ansys.fluent.core.examples.download_file``."""
+    import ansys.fluent.core as pyfluent
+
+    def download_file(file_name, directory=None, save_path=None, return_without_path=None):
+        url = "/".join(part for part in (EXAMPLE_DATA_URL, directory, file_name) if part)
+        save_path = save_path or getattr(pyfluent, "EXAMPLES_PATH", tempfile.gettempdir())
+        path = os.path.join(save_path, file_name)
+        if not os.path.isfile(path):
+            cache.fetch(url, path)
+        return file_name if return_without_path else path
+
+    return download_file
+
+
+DOWNLOADERS = {
+    "ansys.mechanical.core.examples": _mechanical_download_file,
+    "ansys.fluent.core.examples": _fluent_download_file,
+}
+
+
+@contextlib.contextmanager
+def install(cache=None) -> Iterator[ExampleDataCache]:
+    """Serve the example files downloaded in the context from a cache.
+
+    ``upload_file_from_example_repo`` of the Workbench clients launched in the
+    context, ``ansys.mechanical.core.examples.download_file`` and
+    ``ansys.fluent.core.examples.download_file`` go through the cache. The
+    downloaders of the packages that are not installed are left alone.
+
+    Parameters
+    ----------
+    cache : ExampleDataCache, default: None
+        The cache. The default is ``None``, in which case the cache configured
+        by the environment variables is used.
+
+    Yields
+    ------
+    ExampleDataCache
+        The cache.
+    """
+    cache = cache or ExampleDataCache()
+    with contextlib.ExitStack() as stack:
+        for module_name, downloader in DOWNLOADERS.items():
+            try:
+                module = importlib.import_module(module_name)
+            except ImportError:
+                continue
+            stack.callback(setattr, module, "download_file", module.download_file)
+            module.download_file = downloader(cache)
+        stack.enter_context(
+            wrap_clients(
+                lambda client, elapsed: _CachedWorkbenchClient(client, cache),
+                lambda client, elapsed: client,
+            )
+        )
+        yield cache
+
+
+def main(argv=None):
+    """Run examples with the cache, or inspect the cache, from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cache-dir", help="Directory of the cache.")
+    parser.add_argument("--offline", action="store_true", help="Only use cached files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("run").add_argument("examples", nargs="+", help="Example directories.")
+    commands.add_parser("fetch").add_argument("urls", nargs="+", help="URLs to cache.")
+    commands.add_parser("list")
+    commands.add_parser("prune").add_argument("--max-size", type=int, help="Size, in bytes.")
+    args = parser.parse_args(argv)
+
+    cache = ExampleDataCache(args.cache_dir, offline=args.offline or None)
+    if args.command == "run":
+        with install(cache):
+            for example_dir in args.examples:
+                example_dir = pathlib.Path(example_dir).absolute()
+                with working_directory(example_dir):
+                    runpy.run_path(str(example_dir / "main.py"), run_name="__main__")
+    elif args.command == "fetch":
+        for url in args.urls:
+            print(cache.get(url))
+    elif args.command == "list":
+        for url, entry in sorted(cache.entries().items()):
+            print(f"{entry['size']:>12} {entry['sha256'][:12]} {url}")
+    else:
+        cache.prune(args.max_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Evaluation of many Mechanical expressions in a single server call.
+
+The examples read values from Mechanical two calls at a time, one assigning an
+expression to a variable and one returning the variable. :func:`query`
+evaluates any number of expressions in a single ``run_python_script`` call and
+returns their values as JSON types, and :func:`get_analyses` returns the name,
+type, working directory and solve status of all the analyses of the model:
+
+.. code:: python
+
+    from tools.mechanical_query import get_analyses, query
+
+    for analysis in get_analyses(mechanical):
+        print(analysis["name"], analysis["solve_status"], analysis["working_dir"])
+    values = query(mechanical, {"nodes": "Model.Mesh.Nodes", "elements": "Model.Mesh.Elements"})
+
+"""
+
+import json
+from typing import Any, Dict, List
+
+QUERY_SCRIPT = """import json
+request = json.loads(request)
+def query_value(expression, variables):
+    try:
+        value = eval(expression, globals(), variables)
+    except Exception as error:
+        return {"error": str(error)}
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        if hasattr(value, "__iter__") and not isinstance(value, str):
+            value = [str(item) for item in value]
+        else:
+            value = str(value)
+    return {"value": value}
+query_result = {}
+for name, expression in request["expressions"].items():
+    query_result[name] = query_value(expression, {})
+if request["analysis_expressions"] is not None:
+    query_analyses = []
+    for index, analysis in enumerate(ExtAPI.DataModel.AnalysisList):
+        variables = {"analysis": analysis, "index": index}
+        query_analyses.append(
+            dict(
+                (name, query_value(expression, variables))
+                for name, expression in request["analysis_expressions"].items()
+            )
+        )
+    query_result["analyses"] = {"value": query_analyses}
+"""
+
+ANALYSIS_EXPRESSIONS = {
+    "index": "index",
+    "name": "analysis.Name",
+    "analysis_type": "str(analysis.AnalysisType)",
+    "working_dir": "analysis.WorkingDir",
+    "solve_status": "str(analysis.Solution.Status)",
+}
+
+
+def _value(result, name) -> Any:
+    """Return the value of a query result, raising its error."""
+    if "error" in result:
+        raise RuntimeError(f"Cannot evaluate {name} in Mechanical: {result['error']}")
+    return result["value"]
+
+
+def _run(mechanical, expressions, analysis_expressions=None) -> Dict[str, Any]:
+    request = {"expressions": expressions, "analysis_expressions": analysis_expressions}
+    script = f"request = {json.dumps(request)!r}\n{QUERY_SCRIPT}json.dumps(query_result)"
+    return json.loads(mechanical.run_python_script(script))
+
+
+def query(mechanical, expressions: Dict[str, str], errors="raise") -> Dict[str, Any]:
+    """Evaluate Mechanical expressions in a single server call.
+
+    Parameters
+    ----------
+    mechanical : ansys.mechanical.core.Mechanical
+        Client connected to the Mechanical server.
+    expressions : dict[str, str]
+        Python expressions evaluated in the global scope of the Mechanical
+        scripts, keyed by name.
+    errors : str, default: "raise"
+        What to do when an expression cannot be evaluated: ``"raise"`` raises a
+        ``RuntimeError`` and ``"ignore"`` returns ``None`` for the expression.
+
+    Returns
+    -------
+    dict
+        Value of each expression, keyed by name. Values that are not JSON
+        serializable are returned as strings, or as lists of strings for
+        collections.
+    """
+    result = _run(mechanical, expressions)
+    if errors == "ignore":
+        return {name: result[name].get("value") for name in expressions}
+    return {name: _value(result[name], expressions[name]) for name in expressions}
+
+
+def get_analyses(mechanical, expressions: Dict[str, str] = None) -> List[Dict[str, Any]]:
+    """Return the metadata of all the analyses of the model in a single server call.
+
+    Parameters
+    ----------
+    mechanical : ansys.mechanical.core.Mechanical
+        Client connected to the Mechanical server.
+    expressions : dict[str, str], default: None
+        Additional expressions evaluated for each analysis, keyed by name. They
+        read the analysis as ``analysis`` and its position as ``index``.
+
+    Returns
+    -------
+    list[dict]
+        For each analysis of ``ExtAPI.DataModel.AnalysisList``, its ``index``,
+        ``name``, ``analysis_type``, ``working_dir`` and ``solve_status``, such
+        as ``"Done"``, and the values of the additional expressions.
+    """
+    analysis_expressions = dict(ANALYSIS_EXPRESSIONS, **(expressions or {}))
+    result = _run(mechanical, {}, analysis_expressions)
+    return [
+        {name: _value(values[name], analysis_expressions[name]) for name in analysis_expressions}
+        for values in result["analyses"]["value"]
+    ]
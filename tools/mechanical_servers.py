@@ -0,0 +1,104 @@
+"""Parallel solves of the Mechanical systems of a Workbench project.
+
+A project with several independent Mechanical systems, such as the 2D and 3D
+rotor models of the axisymmetric rotor example, solves them one after the
+other when each script waits for the previous one. The servers of the systems
+run in separate processes, so their solves can overlap.
+:func:`start_mechanical_servers` starts the servers one at a time through the
+single Workbench client, which is not shared between threads, and
+:func:`run_python_scripts` then runs one script on each server in parallel:
+
+.. code:: python
+
+    from tools.mechanical_servers import run_python_scripts, start_mechanical_servers
+
+    mechanical_2d, mechanical_3d = start_mechanical_servers(wb, [sys_name[1], sys_name[0]])
+    output_2d, output_3d = run_python_scripts(
+        [mechanical_2d, mechanical_3d],
+        [scripts / "axisymmetric_rotor.py", scripts / "rotor_3d.py"],
+    )
+
+"""
+
+import concurrent.futures
+import os
+from typing import List, Sequence, Union
+
+
+def start_mechanical_servers(wb, system_names: Sequence[str], ip="localhost") -> List:
+    """Start a Mechanical server for each system and connect a client to it.
+
+    The servers are started sequentially, through the single Workbench client.
+    When a server cannot be started or connected, the clients already connected
+    are exited before the error is raised.
+
+    Parameters
+    ----------
+    wb : ansys.workbench.core.workbench_client.WorkbenchClient
+        Client connected to the Workbench server.
+    system_names : sequence of str
+        Names of the Mechanical systems of the project.
+    ip : str, default: "localhost"
+        Address of the Mechanical servers.
+
+    Returns
+    -------
+    list[ansys.mechanical.core.Mechanical]
+        Client connected to the server of each system, in the order of
+        ``system_names``.
+    """
+    from ansys.mechanical.core import connect_to_mechanical
+
+    clients = []
+    try:
+        for system_name in system_names:
+            server_port = wb.start_mechanical_server(system_name=system_name)
+            clients.append(connect_to_mechanical(ip=ip, port=server_port))
+    except BaseException:
+        for client in clients:
+            client.exit()
+        raise
+    return clients
+
+
+def run_python_scripts(
+    clients: Sequence, scripts: Sequence[Union[str, os.PathLike]], max_workers=None
+) -> List[str]:
+    """Run a script on each Mechanical client in parallel.
+
+    Each client is used by a single thread, so the scripts overlap on the
+    servers while the calls of a client stay sequential.
+
+    Parameters
+    ----------
+    clients : sequence of ansys.mechanical.core.Mechanical
+        Clients connected to distinct Mechanical servers.
+    scripts : sequence of str or os.PathLike
+        Script run on each client, in the order of ``clients``. Paths are read
+        as script files and strings are run as script text.
+    max_workers : int, default: None
+        Maximum number of scripts run at the same time, all of them by default.
+
+    Returns
+    -------
+    list[str]
+        Output of each script, in the order of ``clients``.
+
+    Raises
+    ------
+    ValueError
+        If the numbers of clients and scripts differ.
+    """
+    if len(clients) != len(scripts):
+        raise ValueError(f"Got {len(clients)} clients for {len(scripts)} scripts.")
+    if not clients:
+        return []
+
+    def run_python_script(client, script):
+        if isinstance(script, os.PathLike):
+            with open(script) as sf:
+                script = sf.read()
+        return client.run_python_script(script)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers or len(clients)) as executor:
+        return list(executor.map(run_python_script, clients, scripts))
@@ -0,0 +1,720 @@
+"""Offline stand-in for the Workbench and Mechanical servers.
+
+The clients of this module implement the client-facing surface used by the
+examples (``launch_workbench``, ``upload_file``, ``run_script_file``,
+``start_mechanical_server``, ``download_file``, ``connect_to_mechanical`` and so
+on) on top of a local file store. Script results are served from scripted
+responses and every call can be slowed down by a configurable latency and
+bandwidth, so the client-side orchestration of the examples can be run and
+measured on a machine without Ansys products installed.
+
+Examples whose flow depends on script results, such as system names, parameter
+values or analysis working directories, run with the default responses shipped
+for them in ``tools/offline_responses/<example-name>.json``, unless other
+responses are given. Run an example offline with:
+
+.. code:: console
+
+    python -m tools.offline_workbench examples/logging --latency 0.05
+
+"""
+
+import argparse
+import base64
+import contextlib
+import glob
+import itertools
+import json
+import logging
+import os
+import pathlib
+import re
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+import types
+from typing import Any, Callable, Dict, Iterator, List, Union
+import zipfile
+
+Response = Union[Any, Callable[[str], Any]]
+
+DEFAULT_RESPONSES_DIR = pathlib.Path(__file__).parent / "offline_responses"
+PROJECT_DIRECTORY = "{project_directory}"
+
+
+class ScriptedResponses:
+    """Results returned for the scripts run on an offline server.
+
+    Each response is a regular expression searched in the script text together
+    with the result to return. The result can be a JSON-serializable value or a
+    callable receiving the script text. The first matching response wins and
+    scripts without any matching response return ``None``.
+
+    Parameters
+    ----------
+    responses : list[tuple[str, Any]], default: None
+        Pairs of regular expressions and results.
+    """
+
+    def __init__(self, responses=None):
+        self._responses = [(re.compile(pattern), result) for pattern, result in responses or []]
+
+    @classmethod
+    def from_file(cls, path):
+        """Read scripted responses from a JSON file.
+
+        The file contains a list of ``{"match": <regex>, "result": <value>}`` objects.
+
+        Parameters
+        ----------
+        path : str
+            Path to the JSON file.
+
+        Returns
+        -------
+        ScriptedResponses
+            The scripted responses read from the file.
+        """
+        with open(path, encoding="utf-8") as file:
+            entries = json.load(file)
+        return cls([(entry["match"], entry["result"]) for entry in entries])
+
+    def add(self, pattern: str, result: Response):
+        """Add a response, taking precedence over the existing ones.
+
+        Parameters
+        ----------
+        pattern : str
+            Regular expression searched in the script text.
+        result : Any
+            Value or callable returning the value of the script.
+        """
+        self._responses.insert(0, (re.compile(pattern), result))
+
+    def resolve(self, script: str) -> Any:
+        """Return the result of a script.
+
+        Parameters
+        ----------
+        script : str
+            Text of the script.
+
+        Returns
+        -------
+        Any
+            Result of the first matching response, or ``None``.
+        """
+        for pattern, result in self._responses:
+            if pattern.search(script):
+                return result(script) if callable(result) else result
+        return None
+
+
+class NetworkModel:
+    """Simulated cost of the calls between a client and an offline server.
+
+    Parameters
+    ----------
+    latency : float, default: 0.0
+        Round-trip time, in seconds, added to every call.
+    bandwidth : float, default: None
+        Transfer rate, in bytes per second, of the uploads and downloads. The
+        default is ``None``, in which case transfers are instantaneous.
+    startup_time : float, default: 0.0
+        Time, in seconds, taken to launch a server.
+    """
+
+    def __init__(self, latency=0.0, bandwidth=None, startup_time=0.0):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.startup_time = startup_time
+
+    def call(self):
+        """Wait for the round trip of a call."""
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def transfer(self, size: int):
+        """Wait for the round trip of a call transferring ``size`` bytes."""
+        self.call()
+        if self.bandwidth:
+            time.sleep(size / self.bandwidth)
+
+
+def substitute_script_args(script_string: str, args: Dict[str, Any] = None) -> str:
+    """Substitute the ``$$name%%default%%`` arguments of a Workbench script.
+
+    Parameters
+    ----------
+    script_string : str
+        Text of the script.
+    args : dict, default: None
+        Values of the script arguments. Arguments without a value use their default.
+
+    Returns
+    -------
+    str
+        Text of the script run by the server.
+    """
+    for arg_name, arg_value in (args or {}).items():
+        script_string = re.sub(
+            r"\$\$" + arg_name + r"%%((?!%%).)*%%", str(arg_value), script_string
+        )
+    return re.sub(r"\$\$\w+%%(((?!%%).)*)%%", r"\1", script_string)
+
+
+class OfflineWorkbenchClient:
+    """Offline replacement of the PyWorkbench client.
+
+    Parameters
+    ----------
+    client_workdir : str, default: None
+        Path to the client working directory. The default is ``None``, in which
+        case the system temp directory is used.
+    server_workdir : str, default: None
+        Path to the server working directory used as file store. The default is
+        ``None``, in which case a temporary directory is created.
+    responses : ScriptedResponses, default: None
+        Results of the Workbench scripts.
+    mechanical_responses : ScriptedResponses, default: None
+        Results of the Mechanical scripts run on the Mechanical servers started
+        by this client.
+    network : NetworkModel, default: None
+        Simulated cost of the calls.
+    example_data_dir : str, default: None
+        Local copy of the ``pyworkbench`` folder of the ``example-data``
+        repository. Files requested from the example repository and missing from
+        this directory are replaced by empty files.
+    mechanical_files : dict[str, bytes], default: None
+        Contents of the files created in the project directory of each
+        Mechanical server started by this client, keyed by relative path, such as
+        the solver output and images that the examples download.
+    """
+
+    mechanical_client_class = None
+
+    def __init__(
+        self,
+        client_workdir=None,
+        server_workdir=None,
+        responses=None,
+        mechanical_responses=None,
+        network=None,
+        example_data_dir=None,
+        mechanical_files=None,
+    ):
+        self.workdir = client_workdir or tempfile.gettempdir()
+        self._owned_server_workdir = server_workdir is None
+        self.server_workdir = server_workdir or tempfile.mkdtemp(prefix="offline_wb_")
+        os.makedirs(self.server_workdir, exist_ok=True)
+        self.responses = responses or ScriptedResponses()
+        self.mechanical_responses = mechanical_responses or ScriptedResponses()
+        self.network = network or NetworkModel()
+        self.example_data_dir = example_data_dir
+        self.mechanical_files = mechanical_files or {}
+        self.server_version = 252
+        self._logger = logging.getLogger(f"offline_wb.{id(self)}")
+        self._logger.setLevel(logging.DEBUG)
+        self._logger.propagate = False
+        self._console_handler = logging.StreamHandler()
+        self._console_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        self._console_handler.setLevel(logging.WARNING)
+        self._logger.addHandler(self._console_handler)
+        self._log_file_handler = None
+        self._mechanical_servers = {}
+        self._exited = False
+        self.network.call()
+        if self.network.startup_time > 0:
+            time.sleep(self.network.startup_time)
+
+    def __enter__(self):
+        """Connect to the offline server."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Shut down the offline server."""
+        self.exit()
+
+    def set_console_log_level(self, log_level):
+        """Set the log filter level for the client console."""
+        self._console_handler.setLevel(log_level.upper())
+
+    def set_log_file(self, log_file):
+        """Set a local log file for the server log."""
+        self.reset_log_file()
+        handler = logging.FileHandler(log_file)
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        handler.setLevel(logging.DEBUG)
+        self._logger.addHandler(handler)
+        self._log_file_handler = handler
+
+    def reset_log_file(self):
+        """No longer use the current log file for the server log."""
+        if self._log_file_handler is None:
+            return
+        self._log_file_handler.close()
+        self._logger.removeHandler(self._log_file_handler)
+        self._log_file_handler = None
+
+    def run_script_string(self, script_string, args=None, log_level="error"):
+        """Return the scripted result of a Workbench script.
+
+        Script arguments given as ``$$name%%default%%`` are substituted as the
+        PyWorkbench client does.
+        """
+        script_string = substitute_script_args(script_string, args)
+        self.network.call()
+        if logging.getLevelName(log_level.upper()) <= logging.INFO:
+            self._logger.info(f"running script ({len(script_string)} chars)")
+        return self.responses.resolve(script_string)
+
+    def run_script_file(self, script_file_name, args=None, log_level="error"):
+        """Return the scripted result of a Workbench script file."""
+        script_path = os.path.join(self.workdir, script_file_name)
+        with open(script_path, encoding="utf-8-sig") as sf:
+            script_string = sf.read()
+        return self.run_script_string(script_string, args, log_level)
+
+    def upload_file(self, *file_list, show_progress=True):
+        """Copy one or more client files to the server file store."""
+        uploaded = []
+        for file_path in expand_patterns(file_list, self.workdir):
+            if not os.path.isfile(file_path):
+                self._logger.warning(f"The following file does not exist: {file_path}")
+                continue
+            self.network.transfer(os.path.getsize(file_path))
+            server_path = os.path.join(self.server_workdir, os.path.basename(file_path))
+            shutil.copyfile(file_path, server_path)
+            self._logger.info(f"A file is uploaded to the server with the name: {file_path}")
+            uploaded.append(os.path.basename(file_path))
+        return uploaded
+
+    def upload_file_from_example_repo(self, relative_file_path, show_progress=True):
+        """Copy a file of the local example data to the server file store."""
+        file_name = os.path.basename(relative_file_path)
+        local_file = os.path.join(self.workdir, file_name)
+        source = os.path.join(self.example_data_dir or "", relative_file_path)
+        if self.example_data_dir and os.path.isfile(source):
+            shutil.copyfile(source, local_file)
+        else:
+            self._logger.warning(f"Example file {relative_file_path} is not available offline.")
+            open(local_file, "wb").close()
+        self.upload_file(local_file, show_progress=show_progress)
+
+    def download_file(self, file_name, show_progress=True, target_dir=None):
+        """Copy one or more files from the server file store to the client.
+
+        Several matching files are packed in a ZIP file, as the Workbench server does.
+        """
+        matches = sorted(glob.glob(os.path.join(self.server_workdir, file_name)))
+        matches = [match for match in matches if os.path.isfile(match)]
+        if not matches:
+            self.network.call()
+            self._logger.error(f"Error during file download: {file_name} not found")
+            return None
+        local_name = file_name.replace("*", "_").replace("?", "_")
+        target_dir = target_dir or self.workdir
+        os.makedirs(target_dir, exist_ok=True)
+        if len(matches) == 1 and local_name == file_name:
+            self.network.transfer(os.path.getsize(matches[0]))
+            shutil.copyfile(matches[0], os.path.join(target_dir, local_name))
+            return local_name
+        local_name += ".zip"
+        with zipfile.ZipFile(os.path.join(target_dir, local_name), "w") as archive:
+            for match in matches:
+                archive.write(match, os.path.basename(match))
+        self.network.transfer(os.path.getsize(os.path.join(target_dir, local_name)))
+        return local_name
+
+    def download_project_archive(
+        self, archive_name, include_solution_result_files=True, show_progress=True
+    ):
+        """Download the project archive, if scripted on the server file store."""
+        self.download_file(archive_name + ".wbpz", show_progress=show_progress)
+
+    def start_mechanical_server(self, system_name, port=0):
+        """Start an offline Mechanical server for a system and return its port."""
+        self.network.call()
+        if self.network.startup_time > 0:
+            time.sleep(self.network.startup_time)
+        port = port or next(_mechanical_ports)
+        project_directory = os.path.join(self.server_workdir, f"{system_name}_files", "")
+        os.makedirs(project_directory, exist_ok=True)
+        for relative_path, content in self.mechanical_files.items():
+            path = os.path.join(project_directory, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(content)
+        client_class = self.mechanical_client_class or OfflineMechanicalClient
+        server = client_class(project_directory, self.mechanical_responses, self.network)
+        _mechanical_servers[port] = server
+        self._mechanical_servers[system_name] = port
+        return port
+
+    def stop_mechanical_server(self, system_name):
+        """Stop the offline Mechanical server of a system."""
+        self.network.call()
+        _mechanical_servers.pop(self._mechanical_servers.pop(system_name, None), None)
+
+    def start_fluent_server(self, system_name):
+        """Start an offline Fluent server and return its server info file name."""
+        self.network.call()
+        server_info_file = os.path.join(self.server_workdir, f"{system_name}_server_info.txt")
+        open(server_info_file, "w").close()
+        return server_info_file
+
+    def stop_fluent_server(self, system_name):
+        """Stop the offline Fluent server of a system."""
+        self.network.call()
+
+    def exit(self):
+        """Shut down the offline server and remove its temporary file store."""
+        if self._exited:
+            return
+        for system_name in list(self._mechanical_servers):
+            self.stop_mechanical_server(system_name)
+        self.reset_log_file()
+        self._logger.removeHandler(self._console_handler)
+        if self._owned_server_workdir:
+            shutil.rmtree(self.server_workdir, ignore_errors=True)
+        self._exited = True
+
+
+class OfflineMechanicalClient:
+    """Offline replacement of the PyMechanical client.
+
+    Parameters
+    ----------
+    project_directory : str
+        Path to the project directory of the Mechanical server.
+    responses : ScriptedResponses
+        Results of the Mechanical scripts. The ``{project_directory}`` text of
+        string results is replaced by the project directory of the server, so
+        paths returned by the scripts, such as the working directories of the
+        analyses, point to the server file store.
+    network : NetworkModel
+        Simulated cost of the calls.
+    """
+
+    def __init__(self, project_directory, responses, network):
+        self._project_directory = project_directory
+        self.responses = responses
+        self.network = network
+
+    @property
+    def project_directory(self):
+        """Get the project directory of the Mechanical server."""
+        return self.run_python_script("ExtAPI.DataModel.Project.ProjectDirectory") or (
+            self._project_directory
+        )
+
+    def run_python_script(self, script_block, enable_logging=False, log_level="WARNING", **kwargs):
+        """Return the scripted result of a Mechanical script as a string."""
+        self.network.call()
+        result = self.responses.resolve(script_block)
+        if result is None:
+            return ""
+        project_directory = os.path.normpath(self._project_directory)
+        return str(result).replace(PROJECT_DIRECTORY, project_directory)
+
+    def run_python_script_from_file(
+        self, file_path, enable_logging=False, log_level="WARNING", **kwargs
+    ):
+        """Return the scripted result of a Mechanical script file as a string."""
+        with open(file_path, encoding="utf-8") as sf:
+            return self.run_python_script(sf.read(), enable_logging, log_level)
+
+    def upload(self, file_name, file_location_destination=None, **kwargs):
+        """Copy a client file to the project directory of the Mechanical server."""
+        destination = file_location_destination or self._project_directory
+        self.network.transfer(os.path.getsize(file_name))
+        return shutil.copy(file_name, destination)
+
+    def list_files(self):
+        """List the files of the project directory of the Mechanical server."""
+        self.network.call()
+        return sorted(
+            str(path) for path in pathlib.Path(self._project_directory).rglob("*") if path.is_file()
+        )
+
+    def download(self, files, target_dir=None, **kwargs):
+        """Copy files matching one or more glob expressions to the client."""
+        target_dir = target_dir or os.getcwd()
+        os.makedirs(target_dir, exist_ok=True)
+        downloaded = []
+        for pattern in [files] if isinstance(files, str) else files:
+            if not os.path.isabs(pattern):
+                pattern = os.path.join(self._project_directory, "**", pattern)
+            for match in sorted(glob.glob(pattern, recursive=True)):
+                if os.path.isfile(match):
+                    self.network.transfer(os.path.getsize(match))
+                    downloaded.append(shutil.copy(match, target_dir))
+        return downloaded
+
+    def exit(self, force=False):
+        """Shut down the offline Mechanical server."""
+        self.network.call()
+
+
+_mechanical_servers: Dict[int, OfflineMechanicalClient] = {}
+# Ports are never reused, so a new server cannot take the port of a running one.
+_mechanical_ports = itertools.count(10000)
+
+
+def expand_patterns(file_list, workdir) -> List[str]:
+    """Expand the wildcards of client file patterns as PyWorkbench does."""
+    requested = []
+    for file_pattern in file_list:
+        if "*" in file_pattern or "?" in file_pattern:
+            if not os.path.isabs(file_pattern):
+                file_pattern = os.path.join(workdir, file_pattern)
+            requested.extend(glob.glob(file_pattern))
+        else:
+            requested.append(file_pattern)
+    return [
+        file_name if os.path.isabs(file_name) else os.path.join(workdir, file_name)
+        for file_name in requested
+    ]
+
+
+def connect_to_mechanical(ip=None, port=None, **kwargs) -> OfflineMechanicalClient:
+    """Connect to an offline Mechanical server started by ``start_mechanical_server``."""
+    return _mechanical_servers[port]
+
+
+@contextlib.contextmanager
+def install(
+    responses=None,
+    mechanical_responses=None,
+    network=None,
+    example_data_dir=None,
+    client_factory=OfflineWorkbenchClient,
+    mechanical_files=None,
+) -> Iterator[List[OfflineWorkbenchClient]]:
+    """Route the PyWorkbench and PyMechanical entry points to offline servers.
+
+    The ``ansys.workbench.core`` and ``ansys.mechanical.core`` modules are
+    replaced in ``sys.modules`` while the context is active, so unmodified
+    examples importing ``launch_workbench`` and ``connect_to_mechanical`` use
+    offline servers.
+
+    Parameters
+    ----------
+    responses : ScriptedResponses, default: None
+        Results of the Workbench scripts.
+    mechanical_responses : ScriptedResponses, default: None
+        Results of the Mechanical scripts.
+    network : NetworkModel, default: None
+        Simulated cost of the calls.
+    example_data_dir : str, default: None
+        Local copy of the ``pyworkbench`` folder of the ``example-data`` repository.
+    client_factory : type, default: OfflineWorkbenchClient
+        Factory of the Workbench clients, receiving the same keyword arguments as
+        :class:`OfflineWorkbenchClient`.
+    mechanical_files : dict[str, bytes], default: None
+        Files created in the project directory of each Mechanical server.
+
+    Yields
+    ------
+    list[OfflineWorkbenchClient]
+        The clients launched while the context is active.
+    """
+    launched = []
+
+    def launch_workbench(client_workdir=None, server_workdir=None, **kwargs):
+        client = client_factory(
+            client_workdir=client_workdir,
+            server_workdir=server_workdir,
+            responses=responses,
+            mechanical_responses=mechanical_responses,
+            network=network,
+            example_data_dir=example_data_dir,
+            mechanical_files=mechanical_files,
+        )
+        launched.append(client)
+        return client
+
+    def connect_workbench(port, client_workdir=None, host=None, security="mtls"):
+        return launch_workbench(client_workdir=client_workdir)
+
+    workbench_core = types.ModuleType("ansys.workbench.core")
+    workbench_core.launch_workbench = launch_workbench
+    workbench_core.connect_workbench = connect_workbench
+    mechanical_core = types.ModuleType("ansys.mechanical.core")
+    mechanical_core.connect_to_mechanical = connect_to_mechanical
+    mechanical_core.launch_mechanical = connect_to_mechanical
+
+    stubs = {"ansys.workbench.core": workbench_core, "ansys.mechanical.core": mechanical_core}
+    for package in ("ansys", "ansys.workbench", "ansys.mechanical"):
+        if package not in sys.modules:
+            stubs[package] = types.ModuleType(package)
+            stubs[package].__path__ = []
+    saved = {name: sys.modules.get(name) for name in stubs}
+    sys.modules.update(stubs)
+    try:
+        yield launched
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        for client in launched:
+            client.exit()
+
+
+WORKBENCH_ENTRY_POINTS = ("launch_workbench", "connect_workbench")
+MECHANICAL_ENTRY_POINTS = ("connect_to_mechanical", "launch_mechanical")
+
+
+@contextlib.contextmanager
+def wrap_clients(wrap_workbench, wrap_mechanical) -> Iterator[None]:
+    """Wrap the clients returned by the PyWorkbench and PyMechanical entry points.
+
+    The entry points of the ``ansys.workbench.core`` and ``ansys.mechanical.core``
+    modules currently importable, real or offline, are patched while the context
+    is active.
+
+    Parameters
+    ----------
+    wrap_workbench : callable
+        Called with a new Workbench client and the time, in seconds, taken to
+        launch or connect to it. Its return value is handed to the caller.
+    wrap_mechanical : callable
+        Same as ``wrap_workbench`` for Mechanical clients.
+    """
+    import ansys.mechanical.core as mechanical_core
+    import ansys.workbench.core as workbench_core
+
+    patched = [(workbench_core, name, wrap_workbench) for name in WORKBENCH_ENTRY_POINTS]
+    patched += [(mechanical_core, name, wrap_mechanical) for name in MECHANICAL_ENTRY_POINTS]
+    originals = []
+    for module, name, wrap in patched:
+        original = getattr(module, name)
+        originals.append((module, name, original))
+
+        def entry_point(*args, _original=original, _wrap=wrap, **kwargs):
+            start = time.perf_counter()
+            client = _original(*args, **kwargs)
+            return _wrap(client, time.perf_counter() - start)
+
+        setattr(module, name, entry_point)
+    try:
+        yield
+    finally:
+        for module, name, original in originals:
+            setattr(module, name, original)
+
+
+@contextlib.contextmanager
+def working_directory(path) -> Iterator[None]:
+    """Temporarily change the current working directory."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def load_default_responses(example_dir) -> Dict[str, Any]:
+    """Read the default responses of an example.
+
+    The responses of an example are read from the JSON file of
+    :data:`DEFAULT_RESPONSES_DIR` named after the example directory. The file
+    holds an object with optional ``workbench`` and ``mechanical`` lists of
+    ``{"match": <regex>, "result": <value>}`` responses and a ``mechanical_files``
+    object mapping paths, relative to the project directory of the Mechanical
+    servers, to their text or to ``{"base64": <data>}`` for binary files.
+
+    Parameters
+    ----------
+    example_dir : str
+        Path to the example directory.
+
+    Returns
+    -------
+    dict
+        ``responses``, ``mechanical_responses`` and ``mechanical_files`` options
+        of :func:`install`, empty when the example has no default responses.
+    """
+    path = DEFAULT_RESPONSES_DIR / f"{pathlib.Path(example_dir).absolute().name}.json"
+    if not path.is_file():
+        return {}
+    with open(path, encoding="utf-8") as file:
+        defaults = json.load(file)
+
+    def responses(entries):
+        return ScriptedResponses([(entry["match"], entry["result"]) for entry in entries])
+
+    mechanical_files = {
+        relative_path: (
+            base64.b64decode(content["base64"])
+            if isinstance(content, dict)
+            else content.encode("utf-8")
+        )
+        for relative_path, content in defaults.get("mechanical_files", {}).items()
+    }
+    return {
+        "responses": responses(defaults.get("workbench", [])),
+        "mechanical_responses": responses(defaults.get("mechanical", [])),
+        "mechanical_files": mechanical_files,
+    }
+
+
+def run_example(example_dir, **options) -> Dict[str, Any]:
+    """Run the ``main.py`` file of an example against offline servers.
+
+    The example runs from its own directory, as it does in the documentation build.
+
+    Parameters
+    ----------
+    example_dir : str
+        Path to the example directory.
+    **options
+        Options forwarded to :func:`install`. The ``responses``,
+        ``mechanical_responses`` and ``mechanical_files`` options that are not
+        given default to those of :func:`load_default_responses`.
+
+    Returns
+    -------
+    dict
+        Global variables of the example once it has run.
+    """
+    example_dir = pathlib.Path(example_dir).absolute()
+    for name, value in load_default_responses(example_dir).items():
+        if options.get(name) is None:
+            options[name] = value
+    with install(**options), working_directory(example_dir):
+        return runpy.run_path(str(example_dir / "main.py"), run_name="__main__")
+
+
+def main(argv=None):
+    """Run an example against offline servers from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("example_dir", help="Path to the example directory.")
+    parser.add_argument("--responses", help="JSON file with the Workbench script results.")
+    parser.add_argument(
+        "--mechanical-responses", help="JSON file with the Mechanical script results."
+    )
+    parser.add_argument("--example-data", help="Local copy of the example data.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Round trip, in seconds.")
+    parser.add_argument("--bandwidth", type=float, help="Transfer rate, in bytes per second.")
+    parser.add_argument("--startup-time", type=float, default=0.0, help="Server launch time.")
+    args = parser.parse_args(argv)
+
+    run_example(
+        args.example_dir,
+        responses=args.responses and ScriptedResponses.from_file(args.responses),
+        mechanical_responses=(
+            args.mechanical_responses and ScriptedResponses.from_file(args.mechanical_responses)
+        ),
+        network=NetworkModel(args.latency, args.bandwidth, args.startup_time),
+        example_data_dir=args.example_data,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Bulk readout of the parameters of a Workbench project.
+
+Reading parameters one ``run_script_string`` call at a time costs a server
+round trip per parameter, and per design point. :func:`get_parameters` reads
+all the parameters of a project, or a selection of them, for any number of
+design points in a single call, and returns their values as numbers with their
+units:
+
+.. code:: python
+
+    from tools.parameters import get_parameters
+
+    outputs = get_parameters(wb, usage="Output")
+    for name, parameter in outputs.items():
+        print(parameter["display_text"], parameter["value"], parameter["unit"])
+
+"""
+
+import json
+from typing import Any, Dict, Iterable
+
+PARAMETERS_SCRIPT = """import json
+request = json.loads(request)
+if request["names"] is None:
+    parameters = list(Parameters.GetAllParameters())
+else:
+    parameters = [Parameters.GetParameter(Name=name) for name in request["names"]]
+design_points = None
+if request["design_points"] is not None:
+    design_points = [
+        Parameters.GetDesignPoint(Name=name) for name in request["design_points"]
+    ]
+def describe(value):
+    if hasattr(value, "Unit"):
+        return float(value.Value), str(value.Unit)
+    try:
+        return float(value), ""
+    except (TypeError, ValueError):
+        return str(value), ""
+result = {}
+for parameter in parameters:
+    usage = str(parameter.Usage)
+    if request["usage"] is not None and usage != request["usage"]:
+        continue
+    entry = {"display_text": parameter.DisplayText, "usage": usage}
+    entry["value"], entry["unit"] = describe(parameter.Value)
+    if design_points is not None:
+        values = {}
+        for design_point in design_points:
+            values[design_point.Name] = describe(
+                design_point.GetParameterValue(Parameter=parameter)
+            )[0]
+        entry["values"] = values
+    result[parameter.Name] = entry
+wb_script_result = json.dumps(result)
+"""
+
+
+def get_parameters(
+    wb, names: Iterable[str] = None, usage=None, design_points: Iterable[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Read the parameters of a Workbench project in a single server call.
+
+    Parameters
+    ----------
+    wb : ansys.workbench.core.workbench_client.WorkbenchClient
+        Client connected to the Workbench server.
+    names : list[str], default: None
+        Names of the parameters to read, such as ``["P2", "P3"]``. The default
+        is ``None``, in which case all the parameters are read.
+    usage : str, default: None
+        Usage of the parameters to read, ``"Input"`` or ``"Output"``. The
+        default is ``None``, in which case parameters of both usages are read.
+    design_points : list[str], default: None
+        Names of design points whose values are also read, such as
+        ``["0", "1"]``.
+
+    Returns
+    -------
+    dict[str, dict]
+        For each parameter, keyed by name, its ``display_text``, ``usage``,
+        ``value`` in the current design point and ``unit``. Numeric values are
+        returned as floats and the unit is empty for dimensionless parameters.
+        When design points are given, ``values`` maps each of their names to the
+        value of the parameter, in the same unit.
+    """
+    request = {
+        "names": None if names is None else list(names),
+        "usage": usage,
+        "design_points": None if design_points is None else list(design_points),
+    }
+    return wb.run_script_string(f"request = {json.dumps(request)!r}\n{PARAMETERS_SCRIPT}")
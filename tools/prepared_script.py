@@ -0,0 +1,159 @@
+"""Prepared scripts, compiled once on the server and called with bound arguments.
+
+Scripts built on the client with ``str.format`` or f-strings are sent, parsed
+and compiled again by the server on every call, and interpolated values, such
+as Windows paths, must be quoted by hand. A :class:`PreparedScript` is sent to
+the server once, where its compiled code is cached. Each call then only sends
+its handle and its arguments, encoded as JSON, which the script reads as
+variables:
+
+.. code:: python
+
+    from tools.prepared_script import PreparedScript
+
+    set_modulus = PreparedScript(wb, '''
+    design_point = Parameters.GetDesignPoint(Name="0")
+    design_point.SetParameterExpression(
+        Parameter=Parameters.GetParameter(Name="P1"), Expression="%s [Pa]" % modulus
+    )
+    UpdateAllDesignPoints(DesignPoints=[design_point])
+    result = Parameters.GetParameter(Name="P2").Value.Value
+    ''')
+    for modulus in (1.2e10, 1.6e10, 2.0e10):
+        print(set_modulus(modulus=modulus))
+
+The script returns the value of its ``result`` variable, which must be JSON
+serializable. The same scripts run on Workbench servers, through PyWorkbench,
+and on Mechanical servers, through PyMechanical.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+REGISTRY = """import json
+import sys
+import types
+registry = sys.modules.get("_prepared_scripts")
+if registry is None:
+    registry = types.ModuleType("_prepared_scripts")
+    registry.scripts = {}
+    sys.modules["_prepared_scripts"] = registry
+"""
+
+PREPARE_SCRIPT = (
+    REGISTRY
+    + """registry.scripts[request["handle"]] = compile(request["source"], request["name"], "exec")
+prepared_result = {"handle": request["handle"]}
+"""
+)
+
+CALL_SCRIPT = (
+    REGISTRY
+    + """code = registry.scripts.get(request["handle"])
+if code is None:
+    prepared_result = {"missing": True}
+else:
+    namespace = dict(globals())
+    namespace.update(request["args"])
+    namespace["result"] = None
+    try:
+        exec(code, namespace)
+        prepared_result = {"result": namespace["result"]}
+    except Exception as error:
+        import traceback
+        prepared_result = {"error": traceback.format_exc()}
+"""
+)
+
+
+class _WorkbenchRunner:
+    """Runs the registry scripts through a PyWorkbench client."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def run(self, script, request) -> Any:
+        script = f"request = json.loads({json.dumps(request)!r})\n{script}"
+        result = self.client.run_script_string(
+            "import json\n" + script + "wb_script_result = json.dumps(prepared_result)\n"
+        )
+        if result is None:
+            raise RuntimeError("The prepared script failed on the Workbench server.")
+        return result
+
+
+class _MechanicalRunner:
+    """Runs the registry scripts through a PyMechanical client."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def run(self, script, request) -> Any:
+        script = f"import json\nrequest = json.loads({json.dumps(request)!r})\n{script}"
+        return json.loads(self.client.run_python_script(script + "json.dumps(prepared_result)\n"))
+
+
+class PreparedScript:
+    """Script compiled once on the server and called with bound arguments.
+
+    Parameters
+    ----------
+    client : WorkbenchClient or Mechanical
+        PyWorkbench or PyMechanical client connected to the server.
+    source : str
+        Text of the script. It reads its arguments as variables and returns the
+        value of its ``result`` variable.
+    name : str, default: "<prepared>"
+        File name reported in the tracebacks of the script.
+
+    Notes
+    -----
+    Compiled scripts are kept by the server process, keyed by the hash of their
+    text. A script is sent again, transparently, when the server was restarted
+    or reset since it was prepared.
+    """
+
+    def __init__(self, client, source, name="<prepared>"):
+        if hasattr(client, "run_python_script"):
+            self._runner = _MechanicalRunner(client)
+        else:
+            self._runner = _WorkbenchRunner(client)
+        self.source = source
+        self.name = name
+        self.handle = hashlib.sha256(f"{name}\n{source}".encode()).hexdigest()
+        self.prepare()
+
+    def prepare(self):
+        """Send the script to the server, which compiles and caches it."""
+        request = {"handle": self.handle, "source": self.source, "name": self.name}
+        self._runner.run(PREPARE_SCRIPT, request)
+
+    def __call__(self, **args) -> Any:
+        """Run the script with bound arguments.
+
+        Parameters
+        ----------
+        **args
+            Values of the variables read by the script. They must be JSON
+            serializable and are received as their JSON types, so strings such
+            as file paths need no quoting.
+
+        Returns
+        -------
+        Any
+            Value of the ``result`` variable of the script.
+
+        Raises
+        ------
+        RuntimeError
+            If the script raises an exception, with its server traceback.
+        """
+        request = {"handle": self.handle, "args": args}
+        response = self._runner.run(CALL_SCRIPT, request)
+        if response.get("missing"):
+            self.prepare()
+            response = self._runner.run(CALL_SCRIPT, request)
+        if "error" in response:
+            raise RuntimeError(f"The prepared script {self.name} failed:\n{response['error']}")
+        return response["result"]
@@ -0,0 +1,184 @@
+"""Selective download of the files of a solver working directory.
+
+The manifest of an analysis ``WorkingDir`` lists the name, size, modification
+time, optionally the hash, and the type of each of its files, so only the files
+a workflow needs are downloaded instead of the whole directory, which is mostly
+made of scratch files:
+
+.. code:: python
+
+    from tools.solver_files import download_solver_files, get_manifest
+
+    solve_dir = mechanical.run_python_script("ExtAPI.DataModel.AnalysisList[0].WorkingDir")
+    manifest = get_manifest(mechanical, solve_dir)
+    download_solver_files(mechanical, solve_dir, types=["results", "logs"], max_size=2**30)
+
+"""
+
+import fnmatch
+import os
+from typing import Any, Dict, Iterable, List
+
+from tools.chunked_transfer import download_files, hash_files, list_files
+from tools.transfer import file_sha256
+
+FILE_TYPES = {
+    "results": ("*.rst", "*.rth", "*.rmg", "*.rfl", "*.rdsp", "*.rstp"),
+    "logs": ("*.out", "*.err", "*.log", "*.gst", "*.mntr", "*.bcs", "*.nlh", "*.cnd"),
+    "inputs": ("*.dat", "*.inp", "*.cdb", "*.mac", "*.xml"),
+    "images": ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.bmp", "*.avi"),
+    "scratch": (
+        "*.full",
+        "*.esav",
+        "*.emat",
+        "*.sub",
+        "*.tri",
+        "*.osav",
+        "*.mode",
+        "*.ldhi",
+        "*.rdb",
+        "*.r[0-9][0-9][0-9]",
+        "*.page",
+        "*.lock",
+        "*.dsub",
+        "*.dsp",
+        "*.stat",
+    ),
+}
+
+
+def classify(name: str) -> str:
+    """Return the type of a solver file from its name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the file.
+
+    Returns
+    -------
+    str
+        One of the keys of ``FILE_TYPES``, or ``"other"``.
+    """
+    name = name.lower()
+    for file_type, patterns in FILE_TYPES.items():
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns):
+            return file_type
+    return "other"
+
+
+def get_manifest(client, server_dir, hashes=False) -> List[Dict[str, Any]]:
+    """Return the manifest of a solver working directory.
+
+    Parameters
+    ----------
+    client : WorkbenchClient or Mechanical
+        PyWorkbench or PyMechanical client connected to the server.
+    server_dir : str
+        Path of the directory on the server, such as the ``WorkingDir`` of an
+        analysis.
+    hashes : bool, default: False
+        Whether the server computes the SHA-256 hash of every file, which reads
+        all of them.
+
+    Returns
+    -------
+    list[dict]
+        Name, size in bytes, modification time, type and, if requested, SHA-256
+        hash of each file of the directory, listed in a single server call.
+    """
+    manifest = list_files(client, server_dir, hashes=hashes)
+    for entry in manifest:
+        entry["type"] = classify(entry["name"])
+    return manifest
+
+
+def select(
+    manifest, types: Iterable[str] = None, max_size=None, names: Iterable[str] = None
+) -> List[Dict[str, Any]]:
+    """Select files of a manifest.
+
+    Parameters
+    ----------
+    manifest : list[dict]
+        Manifest returned by :func:`get_manifest`.
+    types : list[str], default: None
+        Types of the files to keep, such as ``["results"]`` or ``["logs"]``. The
+        default is ``None``, in which case files of all types are kept.
+    max_size : int, default: None
+        Maximum size, in bytes, of the files to keep.
+    names : list[str], default: None
+        Names or wildcard patterns of the files to keep.
+
+    Returns
+    -------
+    list[dict]
+        Entries of the selected files.
+    """
+    types = None if types is None else set(types)
+    names = None if names is None else list(names)
+    return [
+        entry
+        for entry in manifest
+        if (types is None or entry["type"] in types)
+        and (max_size is None or entry["size"] <= max_size)
+        and (names is None or any(fnmatch.fnmatch(entry["name"], name) for name in names))
+    ]
+
+
+def download_solver_files(
+    client,
+    server_dir,
+    target_dir=None,
+    types=None,
+    max_size=None,
+    names=None,
+    skip_identical=False,
+    **options,
+) -> List[str]:
+    """Download the selected files of a solver working directory.
+
+    Parameters
+    ----------
+    client : WorkbenchClient or Mechanical
+        PyWorkbench or PyMechanical client connected to the server.
+    server_dir : str
+        Path of the directory on the server.
+    target_dir : str, default: None
+        Client directory receiving the files. The default is ``None``, in which
+        case the current working directory is used.
+    types, max_size, names
+        Filters of :func:`select`.
+    skip_identical : bool, default: False
+        Whether to skip the files already present in the target directory with
+        the same content. The server then hashes the selected files that exist
+        on the client with the same size, and only those.
+    **options
+        Options of :func:`tools.chunked_transfer.download_files`.
+
+    Returns
+    -------
+    list[str]
+        Paths of the selected files on the client, downloaded or not.
+    """
+    target_dir = os.path.abspath(target_dir or os.getcwd())
+    # The directory is listed without hashes, so the scratch files left out of the selection are
+    # never read by the server.
+    selected = select(get_manifest(client, server_dir), types, max_size, names)
+    hashes = {}
+    if skip_identical:
+        candidates = [
+            entry["name"]
+            for entry in selected
+            if os.path.isfile(os.path.join(target_dir, entry["name"]))
+            and os.path.getsize(os.path.join(target_dir, entry["name"])) == entry["size"]
+        ]
+        hashes = hash_files(client, server_dir, candidates)
+    missing = [
+        entry
+        for entry in selected
+        if entry["name"] not in hashes
+        or file_sha256(os.path.join(target_dir, entry["name"])) != hashes[entry["name"]]
+    ]
+    download_files(client, server_dir, missing, target_dir, **options)
+    return [os.path.join(target_dir, entry["name"]) for entry in selected]
@@ -0,0 +1,329 @@
+"""Live streaming of solver output while a solve runs.
+
+The Mechanical examples wait for ``Solve(True)`` and only then download
+``solve.out`` and print it. :class:`SolverOutputTail` instead tails the solver
+output files, ``solve.out`` for Mechanical APDL and the ``.trn`` transcripts of
+Fluent, while the solve runs, and streams their new lines, and the progress
+events parsed from them, to callbacks.
+
+A Mechanical server runs one script at a time, so it cannot be polled while it
+solves. The output files are read instead from the client file system, when the
+server runs locally, or through the Workbench server, which stays available
+while its Mechanical and Fluent systems solve:
+
+.. code:: python
+
+    from tools.solver_output import SolverOutputTail, WorkbenchReader
+
+    with SolverOutputTail(WorkbenchReader(wb), project_dir, on_event=print):
+        mechanical.run_python_script(solve_script)
+
+"""
+
+import fnmatch
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+TAIL_SCRIPT = """import fnmatch
+import json
+import os
+import time
+request = json.loads(request)
+since = request["since"]
+if since is None:
+    since = time.time()
+files = {}
+for directory, subdirs, names in os.walk(request["root"]):
+    for name in names:
+        if not [pattern for pattern in request["patterns"] if fnmatch.fnmatch(name, pattern)]:
+            continue
+        path = os.path.join(directory, name)
+        if path not in request["offsets"] and os.path.getmtime(path) < since:
+            continue
+        offset = request["offsets"].get(path, 0)
+        size = os.path.getsize(path)
+        if size < offset:
+            offset = 0
+        if size > offset:
+            stream = open(path, "rb")
+            try:
+                stream.seek(offset)
+                data = stream.read(request["max_bytes"])
+            finally:
+                stream.close()
+            files[path] = [offset, offset + len(data), data.decode("latin-1")]
+wb_script_result = json.dumps({"since": since, "files": files})
+"""
+
+MAX_BYTES = 1024 * 1024
+
+EVENT_PATTERNS = (
+    ("error", re.compile(r"\*\*\* ERROR \*\*\*")),
+    ("warning", re.compile(r"\*\*\* WARNING \*\*\*")),
+    (
+        "substep",
+        re.compile(
+            r"LOAD STEP\s+(?P<load_step>\d+)\s+SUBSTEP\s+(?P<substep>\d+)\s+COMPLETED"
+            r".*CUM ITER\s*=\s*(?P<cumulative_iterations>\d+)"
+        ),
+    ),
+    (
+        "convergence",
+        re.compile(
+            r"(?P<label>FORCE|MOMENT|DISP|HEAT|TEMP) CONVERGENCE VALUE\s*=\s*(?P<value>\S+)"
+            r"\s+CRITERION\s*=\s*(?P<criterion>\S+)"
+        ),
+    ),
+    ("time", re.compile(r"^\s*TIME\s*=\s*(?P<time>\S+)\s+TIME INC\s*=\s*(?P<increment>\S+)")),
+    (
+        "residuals",
+        re.compile(
+            r"^\s*(?P<iteration>\d+)(?P<values>(\s+[-+0-9.eE]+){2,}?)"
+            r"(\s+(?P<time_per_iteration>\d+:\d\d:\d\d)\s+(?P<iterations_left>\d+))?\s*$"
+        ),
+    ),
+    ("finished", re.compile(r"(?i)(Elapsed Time \(sec\)|solution is done|calculation complete)")),
+)
+
+
+def parse_line(line: str, transcript=False) -> Optional[Dict[str, Any]]:
+    """Return the progress event reported by a line of solver output.
+
+    Parameters
+    ----------
+    line : str
+        Line of ``solve.out`` or of a Fluent transcript.
+    transcript : bool, default: False
+        Whether the line comes from a Fluent transcript, whose lines made of
+        numbers report residuals.
+
+    Returns
+    -------
+    dict or None
+        Event with its ``type`` and parsed fields, or ``None`` if the line does
+        not report progress. Residuals of Fluent transcripts are reported as a
+        ``residuals`` event with the iteration and the values of the line, and
+        the ``time_per_iteration`` and ``iterations_left`` columns when the line
+        ends with them.
+
+    Examples
+    --------
+    >>> line = "   112  3.5419e-04  1.2270e-05  1.5328e-05  2.1134e-05  0:00:37  199"
+    >>> event = parse_line(line, transcript=True)
+    >>> event["iteration"], event["values"], event["time_per_iteration"]
+    (112.0, [0.00035419, 1.227e-05, 1.5328e-05, 2.1134e-05], '0:00:37')
+    """
+    for event_type, pattern in EVENT_PATTERNS:
+        if event_type == "residuals" and not transcript:
+            continue
+        match = pattern.search(line)
+        if match:
+            event = {"type": event_type, "line": line}
+            for key, value in match.groupdict().items():
+                if value is None:
+                    continue
+                if key == "values":
+                    value = [float(number) for number in value.split()]
+                elif key not in ("label", "time_per_iteration"):
+                    value = float(value)
+                event[key] = value
+            return event
+    return None
+
+
+class LocalReader:
+    """Reader of solver output files on the client file system."""
+
+    def poll(self, root, patterns, offsets, since, max_bytes=MAX_BYTES) -> Dict[str, Any]:
+        """Return the data appended to the output files since the last poll.
+
+        See :meth:`WorkbenchReader.poll` for the parameters.
+        """
+        since = time.time() if since is None else since
+        files = {}
+        for directory, _, names in os.walk(root):
+            for name in names:
+                if not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    if path not in offsets and os.path.getmtime(path) < since:
+                        continue
+                    offset = offsets.get(path, 0)
+                    if os.path.getsize(path) < offset:
+                        offset = 0
+                    with open(path, "rb") as stream:
+                        stream.seek(offset)
+                        data = stream.read(max_bytes)
+                except OSError:
+                    continue
+                if data:
+                    files[path] = [offset, offset + len(data), data.decode("latin-1")]
+        return {"since": since, "files": files}
+
+
+class WorkbenchReader:
+    """Reader of solver output files through a Workbench server.
+
+    Parameters
+    ----------
+    wb : ansys.workbench.core.workbench_client.WorkbenchClient
+        Client connected to the Workbench server running the solve.
+    """
+
+    def __init__(self, wb):
+        self.wb = wb
+
+    def poll(self, root, patterns, offsets, since, max_bytes=MAX_BYTES) -> Dict[str, Any]:
+        """Return the data appended to the output files since the last poll.
+
+        Parameters
+        ----------
+        root : str
+            Directory of the server searched for output files.
+        patterns : list[str]
+            Wildcard patterns of the names of the output files.
+        offsets : dict[str, int]
+            Offsets already read, keyed by file path.
+        since : float
+            Server time from which new output files are tailed, or ``None`` for
+            the current time of the server.
+        max_bytes : int, default: 1 MB
+            Maximum number of bytes read from a file.
+
+        Returns
+        -------
+        dict
+            ``since`` time and, for each file with new data, its previous and
+            new offsets and the data read.
+        """
+        request = {
+            "root": root,
+            "patterns": list(patterns),
+            "offsets": offsets,
+            "since": since,
+            "max_bytes": max_bytes,
+        }
+        return self.wb.run_script_string(f"request = {json.dumps(request)!r}\n{TAIL_SCRIPT}")
+
+
+class SolverOutputTail:
+    """Tail of the solver output files written under a directory.
+
+    Output files modified after the tail starts are followed from their
+    beginning. Complete lines are passed to ``on_line`` and the progress events
+    parsed from them to ``on_event``, from a background thread.
+
+    Parameters
+    ----------
+    reader : LocalReader or WorkbenchReader
+        Reader of the output files.
+    root : str
+        Directory searched for output files, such as the project directory.
+    patterns : list[str], default: ("solve.out", "*.trn")
+        Wildcard patterns of the names of the output files.
+    interval : float, default: 1.0
+        Time, in seconds, between two polls.
+    on_line : callable, default: None
+        Called with the path of the file and each new line. The default is
+        ``None``, in which case lines are printed.
+    on_event : callable, default: None
+        Called with the path of the file and each progress event returned by
+        :func:`parse_line`. Exceptions raised by the callbacks stop the tail and
+        are raised again by :meth:`stop`.
+    """
+
+    def __init__(
+        self,
+        reader,
+        root,
+        patterns=("solve.out", "*.trn"),
+        interval=1.0,
+        on_line: Callable[[str, str], Any] = None,
+        on_event: Callable[[str, Dict[str, Any]], Any] = None,
+    ):
+        self.reader = reader
+        self.root = root
+        self.patterns = patterns
+        self.interval = interval
+        self.on_line = on_line or (lambda path, line: print(line))
+        self.on_event = on_event
+        self.offsets: Dict[str, int] = {}
+        self.events = []
+        self._since = None
+        self._partial: Dict[str, str] = {}
+        self._stopped = threading.Event()
+        self._thread = None
+        self._error = None
+
+    def __enter__(self):
+        """Start tailing."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop tailing, after reading the remaining output."""
+        self.stop()
+
+    def start(self):
+        """Start tailing in a background thread."""
+        self._since = self.reader.poll(self.root, self.patterns, {}, None, 0)["since"]
+        self._thread = threading.Thread(target=self._run, name="solver-output", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Read the remaining output and stop tailing.
+
+        Raises
+        ------
+        Exception
+            The exception raised by a callback, if any.
+        """
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        if self._error is None:
+            self.poll(final=True)
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as error:
+                self._error = error
+                return
+
+    def poll(self, final=False):
+        """Read the new output once and dispatch its complete lines."""
+        while True:
+            result = self.reader.poll(self.root, self.patterns, self.offsets, self._since)
+            for path, (offset, end, data) in sorted(result["files"].items()):
+                if offset < self.offsets.get(path, 0):
+                    self._partial.pop(path, None)
+                self.offsets[path] = end
+                lines = (self._partial.pop(path, "") + data).split("\n")
+                self._partial[path] = lines.pop()
+                for line in lines:
+                    self._dispatch(path, line.rstrip("\r"))
+            if not any(end - offset >= MAX_BYTES for offset, end, _ in result["files"].values()):
+                break
+        if final:
+            for path, line in sorted(self._partial.items()):
+                if line:
+                    self._dispatch(path, line)
+            self._partial.clear()
+
+    def _dispatch(self, path, line):
+        self.on_line(path, line)
+        event = parse_line(line, transcript=path.endswith(".trn"))
+        if event is not None:
+            self.events.append(event)
+            if self.on_event is not None:
+                self.on_event(path, event)
@@ -0,0 +1,113 @@
+"""Incremental and parallel synchronization of a server directory to the client.
+
+:func:`sync_directory` compares the manifests of the source and destination
+directories and only copies the files that are new or changed, with a thread
+pool. When the source directory is mounted on the client, which is the case
+when the server runs locally, files are copied directly. Otherwise they are
+downloaded through the PyWorkbench or PyMechanical client. Copied files keep
+the modification time of their source, so running a workflow again only copies
+the files its new run changed:
+
+.. code:: python
+
+    from tools.sync import sync_directory
+
+    sync_directory(solve_dir, os.getcwd(), client=mechanical)
+
+Files of the destination that are missing from the source are kept.
+"""
+
+import concurrent.futures
+import fnmatch
+import os
+import shutil
+from typing import Dict, List, Tuple
+
+from tools.chunked_transfer import download_files, list_files
+
+
+def local_manifest(directory, pattern="*") -> Dict[str, Tuple[int, float]]:
+    """Return the size and modification time of the files of a local directory."""
+    manifest = {}
+    if os.path.isdir(directory):
+        for entry in os.scandir(directory):
+            if entry.is_file() and fnmatch.fnmatch(entry.name, pattern):
+                stat = entry.stat()
+                manifest[entry.name] = (stat.st_size, stat.st_mtime)
+    return manifest
+
+
+def _is_unchanged(source, destination) -> bool:
+    """Return whether a destination file is identical to its source, from their manifests."""
+    return (
+        destination is not None
+        and destination[0] == source[0]
+        and abs(destination[1] - source[1]) < 1e-3
+    )
+
+
+def sync_directory(
+    source_dir, destination_dir, client=None, pattern="*", max_workers=8, **options
+) -> List[str]:
+    """Copy the new and changed files of a server directory to a client directory.
+
+    Parameters
+    ----------
+    source_dir : str
+        Path of the directory on the server.
+    destination_dir : str
+        Path of the directory on the client.
+    client : WorkbenchClient or Mechanical, default: None
+        Client used to download the files when the source directory is not
+        mounted on the client. The default is ``None``, in which case the source
+        directory must be local.
+    pattern : str, default: "*"
+        Wildcard pattern of the files to synchronize.
+    max_workers : int, default: 8
+        Number of files copied at once.
+    **options
+        Options of :func:`tools.chunked_transfer.download_files` for remote
+        sources.
+
+    Returns
+    -------
+    list[str]
+        Paths of the copied files on the client.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the source directory is not local and no client is given.
+    """
+    os.makedirs(destination_dir, exist_ok=True)
+    destination = local_manifest(destination_dir, pattern)
+    if os.path.isdir(source_dir):
+        source = local_manifest(source_dir, pattern)
+        changed = [
+            name
+            for name in sorted(source)
+            if not _is_unchanged(source[name], destination.get(name))
+        ]
+
+        def copy(name):
+            return shutil.copy2(os.path.join(source_dir, name), destination_dir)
+
+    elif client is not None:
+        entries = {entry["name"]: entry for entry in list_files(client, source_dir, pattern)}
+        changed = [
+            name
+            for name, entry in sorted(entries.items())
+            if not _is_unchanged((entry["size"], entry["mtime"]), destination.get(name))
+        ]
+
+        def copy(name):
+            entry = entries[name]
+            (path,) = download_files(client, source_dir, [entry], destination_dir, **options)
+            os.utime(path, (entry["mtime"], entry["mtime"]))
+            return path
+
+    else:
+        raise FileNotFoundError(f"{source_dir} is not a local directory and no client is given.")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(copy, changed))
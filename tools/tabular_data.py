@@ -0,0 +1,127 @@
+"""Bulk export of Mechanical ``TabularData`` tables to NumPy.
+
+Reading a ``TabularData`` table one cell at a time, as in
+``SOLN1.TabularData.Values[1][0]``, rebuilds the table and crosses the
+scripting bridge for every value. :func:`get_tabular_data` reads whole tables,
+from any number of objects, in a single server call. Their numeric columns are
+returned through the binary channel of :mod:`tools.typed_results` and the
+tables are assembled on the client as NumPy structured arrays:
+
+.. code:: python
+
+    from tools.tabular_data import get_tabular_data, to_dataframe
+
+    tables = get_tabular_data(
+        mechanical,
+        {
+            "modal": "Model.Analyses[0].Solution",
+            "campbell": "Model.Analyses[2].Solution",
+        },
+    )
+    frequencies = tables["modal"]["values"]["Frequency"]
+    print(to_dataframe(tables["campbell"]))
+
+"""
+
+import json
+from typing import Any, Dict
+
+from tools.typed_results import ENCODER_SCRIPT, decode_results
+
+TABULAR_SCRIPT = (
+    ENCODER_SCRIPT
+    + """request = json.loads(request)
+numeric = {}
+text = {}
+columns = {}
+for name, expression in request["objects"].items():
+    table = eval(expression).TabularData
+    if table is None:
+        raise ValueError("%s has no tabular data." % expression)
+    values = [list(column) for column in table.Values]
+    if hasattr(table, "Names"):
+        names = [str(column) for column in table.Names]
+    else:
+        names = [str(index) for index in range(len(values))]
+    unique_names = []
+    for column in names:
+        unique_name = column
+        count = 0
+        while unique_name in unique_names:
+            count += 1
+            unique_name = "%s.%d" % (column, count)
+        unique_names.append(unique_name)
+    columns[name] = unique_names
+    for column, column_values in zip(unique_names, values):
+        key = "%s/%s" % (name, column)
+        try:
+            if len(set([typed_number(value)[1] for value in column_values])) > 1:
+                raise ValueError("%s has several units." % key)
+            numeric[key] = column_values
+        except (TypeError, ValueError):
+            text[key] = [str(value) for value in column_values]
+tabular_result = json.dumps({"columns": columns, "numeric": encode_results(numeric), "text": text})
+"""
+)
+
+
+def get_tabular_data(mechanical, objects: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """Read the ``TabularData`` tables of Mechanical objects in a single server call.
+
+    Parameters
+    ----------
+    mechanical : ansys.mechanical.core.Mechanical
+        Client connected to the Mechanical server.
+    objects : dict[str, str]
+        Python expressions of the objects whose tables are read, such as
+        ``"Model.Analyses[0].Solution"``, keyed by name.
+
+    Returns
+    -------
+    dict[str, dict]
+        For each object, keyed by name, its table as a NumPy structured array,
+        ``values``, with a float64 field for each numeric column and a string
+        field for the other columns, in the order of the table, and the
+        ``units`` of the columns, empty for plain numbers and strings. Columns
+        mixing units are returned as strings, and columns shorter than the
+        longest one are padded with NaN or empty strings. Repeated column names
+        are suffixed with ``.1``, ``.2`` and so on.
+    """
+    import numpy as np
+
+    request = json.dumps({"objects": objects})
+    script = f"request = {request!r}\n{TABULAR_SCRIPT}tabular_result"
+    result = json.loads(mechanical.run_python_script(script))
+    numeric = decode_results(result["numeric"])
+    tables = {}
+    for name, columns in result["columns"].items():
+        arrays = []
+        units = {}
+        for column in columns:
+            key = f"{name}/{column}"
+            if key in numeric:
+                arrays.append(np.asarray(numeric[key]["value"], dtype="f8").reshape(-1))
+                units[column] = numeric[key]["unit"]
+            else:
+                arrays.append(np.asarray(result["text"][key], dtype=str))
+                units[column] = ""
+        length = max((len(array) for array in arrays), default=0)
+        dtype = [(column, array.dtype) for column, array in zip(columns, arrays)]
+        values = np.empty(length, dtype=dtype)
+        for column, array in zip(columns, arrays):
+            values[column] = np.nan if array.dtype.kind == "f" else ""
+            values[column][: len(array)] = array
+        tables[name] = {"values": values, "units": units}
+    return tables
+
+
+def to_dataframe(table):
+    """Return a table read by :func:`get_tabular_data` as a pandas DataFrame.
+
+    The units of the columns are kept in the ``attrs`` of the DataFrame.
+    """
+    import pandas as pd
+
+    dataframe = pd.DataFrame(table["values"])
+    dataframe.attrs["units"] = dict(table["units"])
+    return dataframe
@@ -0,0 +1,325 @@
+"""Bulk file transfers between a PyWorkbench client and its server.
+
+``upload_file`` opens one stream per file, so uploading many small journals and
+scripts is dominated by per-file round trips. :func:`upload_archive` packs all
+the matched files into a single ZIP archive, uploads it in one stream and
+unpacks it in the server working directory with one script.
+:func:`upload_parallel` instead runs several single-file uploads at once, which
+suits a few large files better. :func:`upload_deduplicated` skips the files
+the server already holds, in its working directory or in a shared store of
+previous uploads, by comparing content hashes.
+
+.. code:: python
+
+    from tools.transfer import upload_archive
+
+    upload_archive(wb, "assets/jou/*.jou", "assets/scdoc/mixing_elbow.scdoc")
+
+"""
+
+import concurrent.futures
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List
+import uuid
+import zipfile
+
+UNPACK_SCRIPT = """import json
+import os
+import zipfile
+workdir = GetServerWorkingDirectory()
+archive_path = os.path.join(workdir, "$$archive%%%%")
+archive = zipfile.ZipFile(archive_path)
+try:
+    names = archive.namelist()
+    archive.extractall(workdir)
+finally:
+    archive.close()
+os.remove(archive_path)
+wb_script_result = json.dumps(names)
+"""
+
+
+DEDUPLICATE_SCRIPT = """import hashlib
+import json
+import os
+import shutil
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    stream = open(path, "rb")
+    try:
+        chunk = stream.read(1048576)
+        while chunk:
+            digest.update(chunk)
+            chunk = stream.read(1048576)
+    finally:
+        stream.close()
+    return digest.hexdigest()
+
+request = json.loads(request)
+workdir = GetServerWorkingDirectory()
+store = request["store"]
+result = {}
+for entry in request["files"]:
+    target = os.path.join(workdir, entry["name"])
+    cached = store and os.path.join(store, entry["sha256"])
+    if request["action"] == "store":
+        if cached and not os.path.isfile(cached):
+            if not os.path.isdir(store):
+                os.makedirs(store)
+            shutil.copyfile(target, cached + ".part")
+            os.rename(cached + ".part", cached)
+        result[entry["name"]] = "stored"
+    elif (
+        os.path.isfile(target)
+        and os.path.getsize(target) == entry["size"]
+        and file_sha256(target) == entry["sha256"]
+    ):
+        result[entry["name"]] = "present"
+    elif cached and os.path.isfile(cached):
+        if os.path.exists(target):
+            os.remove(target)
+        if request["link"] and hasattr(os, "link"):
+            os.link(cached, target)
+        else:
+            shutil.copyfile(cached, target)
+        result[entry["name"]] = "linked"
+    else:
+        result[entry["name"]] = "missing"
+wb_script_result = json.dumps(result)
+"""
+
+
+def expand_file_list(workdir, file_list) -> List[str]:
+    """Return the existing files matching a list of paths and wildcard patterns.
+
+    Relative paths and patterns are relative to the client working directory,
+    as in ``upload_file``. Duplicates are removed and the order is kept.
+
+    Parameters
+    ----------
+    workdir : str
+        Client working directory.
+    file_list : list[str]
+        Paths and wildcard patterns.
+
+    Returns
+    -------
+    list[str]
+        Absolute paths of the matched files.
+    """
+    paths = []
+    for pattern in file_list:
+        pattern = os.path.join(workdir, pattern)
+        matches = glob.glob(pattern) if glob.has_magic(pattern) else [pattern]
+        for path in sorted(matches):
+            path = os.path.abspath(path)
+            if os.path.isfile(path) and path not in paths:
+                paths.append(path)
+    return paths
+
+
+def upload_archive(
+    wb, *file_list, compression=zipfile.ZIP_DEFLATED, show_progress=True
+) -> List[str]:
+    """Upload files to the server working directory as a single archive.
+
+    Files are stored under their base names, as ``upload_file`` does.
+
+    Parameters
+    ----------
+    wb : ansys.workbench.core.workbench_client.WorkbenchClient
+        Client connected to the server.
+    *file_list : str
+        Paths and wildcard patterns of the files, relative to the client working
+        directory.
+    compression : int, default: zipfile.ZIP_DEFLATED
+        Compression of the archive. Use ``zipfile.ZIP_STORED`` for files that
+        are already compressed.
+    show_progress : bool, default: True
+        Whether to show the progress bar of the upload.
+
+    Returns
+    -------
+    list[str]
+        Names of the files unpacked on the server.
+
+    Raises
+    ------
+    ValueError
+        If two files share the same base name.
+    """
+    paths = expand_file_list(wb.workdir, file_list)
+    if not paths:
+        return []
+    names = [os.path.basename(path) for path in paths]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Files with the same name cannot be uploaded together: {duplicates}")
+
+    archive_name = f"upload_{uuid.uuid4().hex}.zip"
+    with tempfile.TemporaryDirectory() as staging_dir:
+        archive_path = os.path.join(staging_dir, archive_name)
+        with zipfile.ZipFile(archive_path, "w", compression=compression) as archive:
+            for path, name in zip(paths, names):
+                archive.write(path, name)
+        wb.upload_file(archive_path, show_progress=show_progress)
+    return wb.run_script_string(UNPACK_SCRIPT, args={"archive": archive_name})
+
+
+def upload_parallel(wb, *file_list, max_workers=4, show_progress=False) -> List[str]:
+    """Upload files to the server working directory with several concurrent streams.
+
+    Parameters
+    ----------
+    wb : ansys.workbench.core.workbench_client.WorkbenchClient
+        Client connected to the server.
+    *file_list : str
+        Paths and wildcard patterns of the files, relative to the client working
+        directory.
+    max_workers : int, default: 4
+        Maximum number of concurrent uploads.
+    show_progress : bool, default: False
+        Whether to show the progress bars of the uploads.
+
+    Returns
+    -------
+    list[str]
+        Names of the uploaded files.
+    """
+    paths = expand_file_list(wb.workdir, file_list)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(wb.upload_file, path, show_progress=show_progress) for path in paths
+        ]
+        for future in futures:
+            future.result()
+    return [os.path.basename(path) for path in paths]
+
+
+def file_sha256(path) -> str:
+    """Return the SHA-256 hash of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _run_deduplicate_script(wb, action, entries, store_dir, link=False) -> Dict[str, str]:
+    """Run the deduplication script on the server and return its result."""
+    request = json.dumps({"action": action, "files": entries, "store": store_dir, "link": link})
+    return wb.run_script_string(f"request = {request!r}\n" + DEDUPLICATE_SCRIPT)
+
+
+def upload_deduplicated(
+    wb, *file_list, store_dir=None, link=False, show_progress=True
+) -> Dict[str, str]:
+    """Upload only the files the server does not already hold.
+
+    The SHA-256 hash of each file is sent to the server, which compares it with
+    the file of the same name in its working directory and looks it up in a
+    shared store. Files found in the store are copied, or linked, into the
+    working directory. Only the remaining files are transferred, and they are
+    then added to the store.
+
+    Parameters
+    ----------
+    wb : ansys.workbench.core.workbench_client.WorkbenchClient
+        Client connected to the server.
+    *file_list : str
+        Paths and wildcard patterns of the files, relative to the client working
+        directory.
+    store_dir : str, default: None
+        Directory of the server holding the uploaded files by hash, which can be
+        shared by several servers and runs. The default is ``None``, in which
+        case only the working directory of the server is checked.
+    link : bool, default: False
+        Whether to hard-link the files of the store into the working directory
+        instead of copying them. Only use it when the workflow does not modify
+        its input files in place, as the stored copy would change too.
+    show_progress : bool, default: True
+        Whether to show the progress bars of the uploads.
+
+    Returns
+    -------
+    dict[str, str]
+        Outcome of each file, keyed by name: ``"present"`` when the working
+        directory already held it, ``"linked"`` when it came from the store and
+        ``"uploaded"`` when it was transferred.
+
+    Raises
+    ------
+    ValueError
+        If two files share the same base name.
+    """
+    paths = expand_file_list(wb.workdir, file_list)
+    if not paths:
+        return {}
+    names = [os.path.basename(path) for path in paths]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Files with the same name cannot be uploaded together: {duplicates}")
+    entries = [
+        {"name": os.path.basename(path), "size": os.path.getsize(path), "sha256": file_sha256(path)}
+        for path in paths
+    ]
+    outcome = _run_deduplicate_script(wb, "lookup", entries, store_dir, link)
+    missing = [entry for entry in entries if outcome[entry["name"]] == "missing"]
+    if missing:
+        by_name = {os.path.basename(path): path for path in paths}
+        wb.upload_file(*(by_name[entry["name"]] for entry in missing), show_progress=show_progress)
+        if store_dir:
+            _run_deduplicate_script(wb, "store", missing, store_dir)
+        for entry in missing:
+            outcome[entry["name"]] = "uploaded"
+    return outcome
+
+
+def upload_file_from_example_repo_deduplicated(
+    wb, relative_file_path, store_dir=None, link=False, show_progress=True, sha256=None
+) -> str:
+    """Upload a file of the example repository unless the server already holds it.
+
+    The file is only downloaded from the example repository when the client
+    working directory does not hold a copy from a previous run. That copy is
+    reused as it is, even when the file has since changed in the repository,
+    unless ``sha256`` is given: a copy whose hash differs is then downloaded
+    again. Otherwise, delete the copy to refresh it.
+
+    Parameters
+    ----------
+    wb : ansys.workbench.core.workbench_client.WorkbenchClient
+        Client connected to the server.
+    relative_file_path : str
+        Path of the file in the ``pyworkbench`` folder of the example repository.
+    store_dir : str, default: None
+        Directory of the server holding the uploaded files by hash.
+    link : bool, default: False
+        Whether to hard-link the files of the store into the working directory.
+    show_progress : bool, default: True
+        Whether to show the progress bars of the transfers.
+    sha256 : str, default: None
+        Expected SHA-256 hash of the file in the repository, which the copy of
+        the client working directory must match to be reused.
+
+    Returns
+    -------
+    str
+        Outcome of the upload, as returned by :func:`upload_deduplicated`.
+    """
+    name = os.path.basename(relative_file_path)
+    path = os.path.join(wb.workdir, name)
+    if os.path.isfile(path) and (sha256 is None or file_sha256(path) == sha256):
+        return upload_deduplicated(
+            wb, name, store_dir=store_dir, link=link, show_progress=show_progress
+        )[name]
+    wb.upload_file_from_example_repo(relative_file_path, show_progress=show_progress)
+    if store_dir:
+        entry = {"name": name, "size": os.path.getsize(path), "sha256": file_sha256(path)}
+        _run_deduplicate_script(wb, "store", [entry], store_dir)
+    return "uploaded"
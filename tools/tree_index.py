@@ -0,0 +1,122 @@
+"""Name index of the objects of the Mechanical tree.
+
+Mechanical scripts often look up objects with a scan of the whole tree, such as
+``[x for x in ExtAPI.DataModel.Tree.AllObjects if x.Name == "Blade"][0]``,
+which costs a pass over all the objects for every lookup. ``TreeIndex``, defined
+by :data:`TREE_INDEX_SCRIPT`, scans the tree once per object type and then looks
+objects up by name in a dictionary. It checks the objects it returns against
+their name and is built again when a name is missing or was renamed, so it
+follows the changes of the tree. Its ``resolve`` method returns the objects of
+many names at once.
+
+Mechanical scripts use the class once :data:`TREE_INDEX_SCRIPT` is prepended to
+their text. From the client, :func:`resolve_object_ids` resolves names in a
+single server call, with indexes that persist between calls:
+
+.. code:: python
+
+    from tools.tree_index import resolve_object_ids
+
+    ids = resolve_object_ids(
+        mechanical,
+        ["Passage 1", "Passage 2", "Hole 1"],
+        object_type="Ansys.ACT.Automation.Mechanical.NamedSelection",
+    )
+    mechanical.run_python_script(f"DataModel.GetObjectById({ids['Hole 1']}).Name")
+
+"""
+
+import json
+from typing import Dict, Iterable
+
+TREE_INDEX_SCRIPT = '''class TreeIndex(object):
+    """Index of the objects of the Mechanical tree by name.
+
+    The tree is scanned once, when the index is first used, instead of once per
+    lookup. Objects found in the index are checked against their name, and the
+    index is built again when an object is missing or was renamed, so it
+    follows the changes of the tree. Call ``invalidate`` after deleting objects.
+    """
+
+    def __init__(self, object_type=None):
+        self.object_type = object_type
+        self._objects = None
+
+    def invalidate(self):
+        self._objects = None
+
+    def _build(self):
+        if self.object_type is None:
+            objects = ExtAPI.DataModel.Tree.AllObjects
+        else:
+            objects = Model.GetChildren[self.object_type](True)
+        self._objects = {}
+        for tree_object in objects:
+            # Keep the first object of each name, as a scan of the tree would.
+            self._objects.setdefault(tree_object.Name, tree_object)
+
+    def _is_current(self, name):
+        tree_object = self._objects.get(name)
+        try:
+            return tree_object is not None and tree_object.Name == name
+        except Exception:
+            return False
+
+    def resolve(self, names):
+        """Return the objects of several names, in a single pass over the index."""
+        if self._objects is None or not all(self._is_current(name) for name in names):
+            self._build()
+        missing = [name for name in names if name not in self._objects]
+        if missing:
+            raise KeyError("No tree objects named %s." % ", ".join(missing))
+        return [self._objects[name] for name in names]
+
+    def get(self, name):
+        """Return the object of a name."""
+        return self.resolve([name])[0]
+'''
+
+RESOLVE_SCRIPT = """import json
+request = json.loads(request)
+tree_indexes = globals().setdefault("tree_indexes", {})
+object_type = request["object_type"]
+if object_type not in tree_indexes:
+    tree_indexes[object_type] = TreeIndex(object_type and eval(object_type))
+tree_objects = tree_indexes[object_type].resolve(request["names"])
+resolve_result = dict(
+    (name, tree_object.ObjectId) for name, tree_object in zip(request["names"], tree_objects)
+)
+"""
+
+
+def resolve_object_ids(mechanical, names: Iterable[str], object_type=None) -> Dict[str, int]:
+    """Return the object IDs of named tree objects in a single server call.
+
+    Parameters
+    ----------
+    mechanical : ansys.mechanical.core.Mechanical
+        Client connected to the Mechanical server.
+    names : list[str]
+        Names of the objects.
+    object_type : str, default: None
+        Python expression of the type of the objects, such as
+        ``"Ansys.ACT.Automation.Mechanical.NamedSelection"``. The default is
+        ``None``, in which case all the objects of the tree are indexed.
+
+    Returns
+    -------
+    dict[str, int]
+        ``ObjectId`` of the first object of each name, which
+        ``DataModel.GetObjectById`` returns in later scripts.
+
+    Raises
+    ------
+    Exception
+        The ``KeyError`` of the server, with the missing names, if an object is
+        not found.
+    """
+    request = json.dumps({"names": list(names), "object_type": object_type})
+    script = (
+        f"{TREE_INDEX_SCRIPT}request = {request!r}\n{RESOLVE_SCRIPT}json.dumps(resolve_result)"
+    )
+    return json.loads(mechanical.run_python_script(script))
@@ -0,0 +1,127 @@
+"""Typed binary channel for the results of Mechanical scripts.
+
+The Mechanical scripts of the examples return their results as
+``json.dumps({"Total Deformation": str(TOT_DEF4_1.Maximum)})``, so the client
+receives strings such as ``"0.0123 [mm]"`` that it must parse. :func:`run_typed`
+runs such a script unchanged and then returns the values of Python expressions
+evaluated after it, quantities, numbers or rectangular nested sequences of them.
+The values are packed as little-endian float64 numbers in a single base64
+buffer, next to a small JSON header giving the shape and unit of each result,
+and are decoded on the client as NumPy arrays without any string parsing:
+
+.. code:: python
+
+    from tools.typed_results import run_typed
+
+    with open("examples/pymechanical-integration/scripts/solve.py") as script:
+        results = run_typed(mechanical, script.read(), {"maximum": "total_deformation.Maximum"})
+    print(results["maximum"]["value"], results["maximum"]["unit"])
+
+Scripts written for the channel can also call ``encode_results(results)`` on
+their last line, once :data:`ENCODER_SCRIPT` is prepended to them. The encoder
+runs on the IronPython and CPython interpreters of Mechanical, which do not
+provide NumPy.
+"""
+
+import base64
+import json
+from typing import Any, Dict
+
+ENCODER_SCRIPT = """import base64
+import json
+import struct
+def typed_number(value):
+    if hasattr(value, "Unit"):
+        return float(value.Value), str(value.Unit)
+    return float(value), ""
+def flatten_results(name, value, shape, numbers, units, depth, offset):
+    if not hasattr(value, "Unit") and hasattr(value, "__iter__") and not isinstance(value, str):
+        items = list(value)
+        if len(shape) == depth and len(numbers) == offset:
+            shape.append(len(items))
+        elif len(shape) <= depth or shape[depth] != len(items):
+            raise ValueError("%s is not rectangular: ragged sequence at level %d." % (name, depth))
+        for item in items:
+            flatten_results(name, item, shape, numbers, units, depth + 1, offset)
+    else:
+        if len(shape) != depth:
+            raise ValueError("%s is not rectangular: number at level %d." % (name, depth))
+        number, unit = typed_number(value)
+        numbers.append(number)
+        units.add(unit)
+def encode_results(values):
+    fields = {}
+    numbers = []
+    for name, value in values.items():
+        shape = []
+        units = set()
+        offset = len(numbers)
+        flatten_results(name, value, shape, numbers, units, 0, offset)
+        if len(units) > 1:
+            raise ValueError("The values of %s have several units: %s." % (name, sorted(units)))
+        fields[name] = {
+            "shape": shape,
+            "offset": offset,
+            "count": len(numbers) - offset,
+            "unit": units.pop() if units else "",
+        }
+    data = struct.pack("<%dd" % len(numbers), *numbers)
+    return json.dumps({"fields": fields, "data": base64.b64encode(data).decode("ascii")})
+"""
+
+
+def decode_results(payload) -> Dict[str, Dict[str, Any]]:
+    """Decode the results encoded by ``encode_results`` on the server.
+
+    Parameters
+    ----------
+    payload : str or dict
+        JSON text, or decoded JSON object, returned by the script.
+
+    Returns
+    -------
+    dict[str, dict]
+        For each result, keyed by name, its ``value``, a float for scalars or a
+        read-only float64 NumPy array of the shape of the sequence otherwise,
+        and its ``unit``, empty for plain numbers.
+    """
+    import numpy as np
+
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+    numbers = np.frombuffer(base64.b64decode(payload["data"]), dtype="<f8")
+    results = {}
+    for name, field in payload["fields"].items():
+        values = numbers[field["offset"] : field["offset"] + field["count"]]
+        if field["shape"]:
+            value = values.reshape(field["shape"])
+        else:
+            value = float(values[0])
+        results[name] = {"value": value, "unit": field["unit"]}
+    return results
+
+
+def run_typed(mechanical, script, expressions: Dict[str, str] = None) -> Dict[str, Dict[str, Any]]:
+    """Run a Mechanical script and return typed results.
+
+    Parameters
+    ----------
+    mechanical : ansys.mechanical.core.Mechanical
+        Client connected to the Mechanical server.
+    script : str
+        Text of the script, run unchanged.
+    expressions : dict[str, str], default: None
+        Python expressions evaluated after the script, keyed by name, whose
+        values are quantities, numbers or rectangular nested sequences of them,
+        sharing a unit. The default is ``None``, in which case the last line of
+        the script is ``encode_results(results)``.
+
+    Returns
+    -------
+    dict[str, dict]
+        Results decoded by :func:`decode_results`.
+    """
+    if expressions is not None:
+        values = ", ".join(f"{name!r}: {expression}" for name, expression in expressions.items())
+        script = f"{script}\nencode_results({{{values}}})"
+    return decode_results(mechanical.run_python_script(f"{ENCODER_SCRIPT}{script}"))
@@ -0,0 +1,370 @@
+"""Pool of pre-launched Workbench servers.
+
+Launching a Workbench server often takes longer than the short workflows run on
+it. The pool keeps a number of servers warm and leases them to the workflows.
+Between two leases, the project of the server is reset and its working
+directory is emptied, so each lease starts from the same state as a freshly
+launched server. Servers are recycled after a number of leases or when their
+memory exceeds a ceiling, and replacements are launched in the background.
+
+Unmodified examples run on the pool, their ``launch_workbench`` call leasing a
+server and their ``exit`` call releasing it:
+
+.. code:: console
+
+    python -m tools.workbench_pool --size 2 --max-uses 20 --repeat 10 \\
+        examples/material-designer-workflow
+
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import pathlib
+import runpy
+import threading
+from typing import Iterator
+import warnings
+
+from tools.offline_workbench import install, working_directory
+
+RESET_SCRIPT = """import json
+import os
+import shutil
+import System
+Reset()
+workdir = GetServerWorkingDirectory()
+for name in os.listdir(workdir):
+    path = os.path.join(workdir, name)
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        os.remove(path)
+wb_script_result = json.dumps(System.Diagnostics.Process.GetCurrentProcess().WorkingSet64)
+"""
+
+
+def _shut_down(server):
+    """Shut down a server, warning instead of raising when it fails."""
+    try:
+        server.client.exit()
+    except Exception as error:
+        warnings.warn(f"Cannot shut down a Workbench server: {error}")
+
+
+class PooledServer:
+    """Workbench server owned by a pool.
+
+    Parameters
+    ----------
+    client : ansys.workbench.core.workbench_client.WorkbenchClient
+        Client connected to the server.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.uses = 0
+        self.memory = None
+
+
+class LeasedWorkbenchClient:
+    """Client of a server leased from a pool.
+
+    Calls are forwarded to the client of the server, except ``exit``, which
+    returns the server to the pool instead of shutting it down.
+    """
+
+    def __init__(self, pool, server, client_workdir=None):
+        self._pool = pool
+        self._server = server
+        self._released = False
+        if client_workdir is not None:
+            server.client.workdir = client_workdir
+
+    def __getattr__(self, name):
+        """Forward the calls to the client of the leased server."""
+        return getattr(self._server.client, name)
+
+    def __enter__(self):
+        """Use the leased client as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Return the server to the pool."""
+        self.exit()
+
+    def exit(self):
+        """Return the server to the pool."""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._server)
+
+
+class WorkbenchPool:
+    """Pool of warm Workbench servers.
+
+    Parameters
+    ----------
+    size : int, default: 1
+        Number of servers kept warm.
+    max_uses : int, default: None
+        Number of leases after which a server is shut down and replaced. The
+        default is ``None``, in which case servers are reused indefinitely.
+    max_memory : int, default: None
+        Memory, in bytes, of the Workbench process above which a server is shut
+        down and replaced. The default is ``None``, in which case the memory is
+        not checked.
+    launcher : callable, default: None
+        Function launching a server and returning its client. The default is
+        ``None``, in which case ``ansys.workbench.core.launch_workbench`` is used.
+    launch_retries : int, default: 2
+        Number of times a failed launch is retried, after a delay doubling from
+        one second. A launch failing every time is reported with a warning, and
+        by :meth:`acquire` when no other server is left.
+    **launch_options
+        Keyword arguments of the launcher.
+    """
+
+    def __init__(
+        self,
+        size=1,
+        max_uses=None,
+        max_memory=None,
+        launcher=None,
+        launch_retries=2,
+        **launch_options,
+    ):
+        self.size = size
+        self.max_uses = max_uses
+        self.max_memory = max_memory
+        self.launcher = launcher
+        self.launch_retries = launch_retries
+        self.launch_options = launch_options
+        self.launched = 0
+        self.recycled = 0
+        self._idle = collections.deque()
+        self._pending = 0
+        self._error = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._executor = None
+
+    def __enter__(self):
+        """Start the pool."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Shut down the servers of the pool."""
+        self.close()
+
+    def start(self):
+        """Launch the servers of the pool in the background."""
+        if self.launcher is None:
+            from ansys.workbench.core import launch_workbench
+
+            self.launcher = launch_workbench
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.size, thread_name_prefix="workbench-pool"
+        )
+        for _ in range(self.size):
+            self._launch()
+
+    def _launch(self):
+        """Launch a server in the background, unless the pool is closed."""
+        with self._condition:
+            if self._closed:
+                return
+            self._pending += 1
+            self._executor.submit(self._run_launch)
+
+    def _run_launch(self):
+        server = error = None
+        for attempt in range(self.launch_retries + 1):
+            try:
+                server = PooledServer(self.launcher(**self.launch_options))
+                break
+            except Exception as exception:
+                error = exception
+            if attempt < self.launch_retries:
+                with self._condition:
+                    # Wait before the next attempt, unless the pool is closed meanwhile.
+                    if self._condition.wait_for(lambda: self._closed, 2**attempt):
+                        break
+        if server is None:
+            warnings.warn(
+                f"Cannot launch a Workbench server, the pool has one server less: {error}"
+            )
+            with self._condition:
+                self._pending -= 1
+                self._error = error
+                self._condition.notify_all()
+            return
+        with self._condition:
+            self._pending -= 1
+            self.launched += 1
+            self._idle.append(server)
+            self._condition.notify_all()
+
+    def acquire(self, client_workdir=None, timeout=None) -> LeasedWorkbenchClient:
+        """Lease a server, waiting for one to be available.
+
+        Parameters
+        ----------
+        client_workdir : str, default: None
+            Client working directory of the lease. The default is ``None``, in
+            which case the working directory of the previous lease is kept.
+        timeout : float, default: None
+            Time, in seconds, to wait for a server. The default is ``None``, in
+            which case the wait is not limited.
+
+        Returns
+        -------
+        LeasedWorkbenchClient
+            Client of the leased server. Its ``exit`` method returns the server
+            to the pool.
+
+        Raises
+        ------
+        RuntimeError
+            If the pool is closed, if no server can be launched or if no server
+            is available before the timeout.
+        """
+        with self._condition:
+            available = self._condition.wait_for(
+                lambda: self._closed or self._idle or (self._error and not self._pending),
+                timeout,
+            )
+            if self._closed:
+                raise RuntimeError("The Workbench pool is closed.")
+            if not available:
+                raise RuntimeError(f"No Workbench server available after {timeout} s.")
+            if not self._idle:
+                error, self._error = self._error, None
+                raise RuntimeError("Cannot launch a Workbench server.") from error
+            server = self._idle.popleft()
+        server.uses += 1
+        return LeasedWorkbenchClient(self, server, client_workdir)
+
+    @contextlib.contextmanager
+    def lease(self, client_workdir=None, timeout=None) -> Iterator[LeasedWorkbenchClient]:
+        """Lease a server for the duration of the context.
+
+        See :meth:`acquire` for the parameters.
+        """
+        client = self.acquire(client_workdir, timeout)
+        try:
+            yield client
+        finally:
+            client.exit()
+
+    def release(self, server):
+        """Reset a leased server in the background and return it to the pool.
+
+        Servers released after the pool is closed are shut down immediately.
+        """
+        with self._condition:
+            if not self._closed:
+                self._executor.submit(self._recycle, server)
+                return
+        _shut_down(server)
+
+    def _recycle(self, server):
+        try:
+            server.client.reset_log_file()
+            server.memory = server.client.run_script_string(RESET_SCRIPT)
+        except Exception as error:
+            warnings.warn(f"Cannot reset a Workbench server, replacing it: {error}")
+            self._retire(server)
+            return
+        worn_out = self.max_uses is not None and server.uses >= self.max_uses
+        too_large = (
+            self.max_memory is not None
+            and server.memory is not None
+            and server.memory > self.max_memory
+        )
+        if worn_out or too_large:
+            self._retire(server)
+            return
+        with self._condition:
+            if not self._closed:
+                self._idle.append(server)
+                self._condition.notify_all()
+                return
+        _shut_down(server)
+
+    def _retire(self, server):
+        """Shut down a server and launch its replacement."""
+        with self._condition:
+            self.recycled += 1
+        self._launch()
+        _shut_down(server)
+
+    def close(self):
+        """Shut down the idle servers and the servers released afterward."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        while self._idle:
+            _shut_down(self._idle.popleft())
+
+
+@contextlib.contextmanager
+def serve(pool) -> Iterator[WorkbenchPool]:
+    """Serve the ``launch_workbench`` calls made in the context from a pool.
+
+    Only the ``client_workdir`` argument of the calls is used, the servers are
+    launched with the options of the pool.
+
+    Parameters
+    ----------
+    pool : WorkbenchPool
+        The started pool leasing the servers.
+
+    Yields
+    ------
+    WorkbenchPool
+        The pool.
+    """
+    import ansys.workbench.core as workbench_core
+
+    def launch_workbench(client_workdir=None, **kwargs):
+        return pool.acquire(client_workdir)
+
+    original = workbench_core.launch_workbench
+    workbench_core.launch_workbench = launch_workbench
+    try:
+        yield pool
+    finally:
+        workbench_core.launch_workbench = original
+
+
+def main(argv=None):
+    """Run examples on a pool of Workbench servers from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("examples", nargs="+", help="Example directories.")
+    parser.add_argument("--size", type=int, default=1, help="Number of warm servers.")
+    parser.add_argument("--max-uses", type=int, help="Leases before recycling a server.")
+    parser.add_argument("--max-memory", type=float, help="Memory ceiling of a server, in MB.")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs of each example.")
+    parser.add_argument("--offline", action="store_true", help="Use offline servers.")
+    args = parser.parse_args(argv)
+
+    servers = install() if args.offline else contextlib.nullcontext()
+    max_memory = args.max_memory and int(args.max_memory * 1024 * 1024)
+    with servers:
+        pool = WorkbenchPool(args.size, args.max_uses, max_memory, use_insecure_connection=True)
+        with pool, serve(pool):
+            for _ in range(args.repeat):
+                for example_dir in args.examples:
+                    example_dir = pathlib.Path(example_dir).absolute()
+                    with working_directory(example_dir):
+                        runpy.run_path(str(example_dir / "main.py"), run_name="__main__")
+        print(f"Launched {pool.launched} servers, recycled {pool.recycled}.")
+
+
+if __name__ == "__main__":
+    main()